@@ -0,0 +1,1134 @@
+# SPDX-FileCopyrightText: 2018 Dan Halbert for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit`
+==========================
+
+Convenience library for using the Adafruit Crickit robotics boards.
+
+* Author(s): Dan Halbert
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+   `Adafruit Crickit for Circuit Playground Express <https://www.adafruit.com/3093>`_
+   `Adafruit Crickit FeatherWing <https://www.adafruit.com/3343>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+``adafruit_crickit.crickit`` is a singleton `Crickit` controlled by the default I2C pins.
+It is created the first time it is used, and is ``None`` if the board has no default
+I2C bus. Device drivers are likewise only imported when their first device is used.
+"""
+
+import sys
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    lib_index = sys.path.index("/lib")
+    if lib_index < sys.path.index(".frozen"):
+        # Prefer frozen modules over those in /lib.
+        sys.path.insert(lib_index, ".frozen")
+except ValueError:
+    # Don't change sys.path if it doesn't contain "lib" or ".frozen".
+    pass
+
+# Device drivers are imported by _load() when first needed. PWMOut is small and is
+# needed to define _CrickitPWMOut.
+from adafruit_seesaw.pwmout import PWMOut
+
+try:
+    from typing import Any, BinaryIO, Tuple, Type, Union
+
+    from adafruit_motor.motor import DCMotor
+    from adafruit_motor.servo import ContinuousServo, Servo
+    from adafruit_seesaw.neopixel import NeoPixel
+    from adafruit_seesaw.seesaw import Seesaw
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Crickit.git"
+
+
+_SERVO1 = const(17)
+_SERVO2 = const(16)
+_SERVO3 = const(15)
+_SERVO4 = const(14)
+
+_MOTOR1 = (22, 23)
+_MOTOR2 = (19, 18)
+# Order as needed for steppers.
+_MOTOR_STEPPER = _MOTOR1 + _MOTOR2
+
+_DRIVE1 = const(13)
+_DRIVE2 = const(12)
+_DRIVE3 = const(43)
+_DRIVE4 = const(42)
+
+# Order as needed for steppers.
+_DRIVE_STEPPER = (_DRIVE1, _DRIVE3, _DRIVE2, _DRIVE4)
+_FEATHER_DRIVE_STEPPER = tuple(reversed(_DRIVE_STEPPER))
+
+# PWM terminals that share a timer, and so always run at the same frequency, with the
+# names Crickit.set_pwm_frequency() knows them by.
+_TIMER_GROUPS = (
+    (_SERVO1, _SERVO2, _SERVO3, _SERVO4),
+    _MOTOR1,
+    _MOTOR2,
+    (_DRIVE1, _DRIVE2),
+    (_DRIVE3, _DRIVE4),
+)
+_TIMER_NAMES = ("servos", "motor_1", "motor_2", "drives_1_2", "drives_3_4")
+
+# Frequencies given to new devices on a timer that has none planned.
+_SERVO_FREQUENCY = const(50)
+_DRIVE_FREQUENCY = const(1000)
+
+
+_TOUCH1 = const(4)
+_TOUCH2 = const(5)
+_TOUCH3 = const(6)
+_TOUCH4 = const(7)
+
+# Index of each device property in Crickit._devices. A servo terminal has a slot for
+# each kind of servo; creating one clears the other, whose slot is ``slot ^ 4``.
+_SLOT_SERVO1 = const(0)
+_SLOT_SERVO2 = const(1)
+_SLOT_SERVO3 = const(2)
+_SLOT_SERVO4 = const(3)
+_SLOT_CONTINUOUS_SERVO1 = const(4)
+_SLOT_CONTINUOUS_SERVO2 = const(5)
+_SLOT_CONTINUOUS_SERVO3 = const(6)
+_SLOT_CONTINUOUS_SERVO4 = const(7)
+_SLOT_DC_MOTOR1 = const(8)
+_SLOT_DC_MOTOR2 = const(9)
+_SLOT_STEPPER = const(10)
+_SLOT_DRIVE_STEPPER = const(11)
+_SLOT_FEATHER_DRIVE_STEPPER = const(12)
+_SLOT_DRIVE1 = const(13)
+_SLOT_DRIVE2 = const(14)
+_SLOT_DRIVE3 = const(15)
+_SLOT_DRIVE4 = const(16)
+_SLOT_TOUCH1 = const(17)
+_SLOT_TOUCH2 = const(18)
+_SLOT_TOUCH3 = const(19)
+_SLOT_TOUCH4 = const(20)
+_SLOT_COUNT = const(21)
+
+# Terminal(s) used by the device in each slot.
+_SLOT_TERMINALS = (
+    _SERVO1,
+    _SERVO2,
+    _SERVO3,
+    _SERVO4,
+    _SERVO1,
+    _SERVO2,
+    _SERVO3,
+    _SERVO4,
+    _MOTOR1,
+    _MOTOR2,
+    _MOTOR_STEPPER,
+    _DRIVE_STEPPER,
+    _FEATHER_DRIVE_STEPPER,
+    _DRIVE1,
+    _DRIVE2,
+    _DRIVE3,
+    _DRIVE4,
+    _TOUCH1,
+    _TOUCH2,
+    _TOUCH3,
+    _TOUCH4,
+)
+_SIGNAL_PINS = (2, 3, 40, 41, 11, 10, 9, 8)
+
+_NEOPIXEL = const(20)
+_SS_PIXEL = const(27)
+
+# Seesaw GPIO registers, for reading both GPIO ports in one transaction.
+_GPIO_BASE = const(0x01)
+_GPIO_BULK = const(0x04)
+
+
+def _timer(pin: int) -> int:
+    # Index in _TIMER_GROUPS of the timer behind a PWM terminal.
+    for timer, pins in enumerate(_TIMER_GROUPS):
+        if pin in pins:
+            return timer
+    raise ValueError("Invalid PWM pin")
+
+
+# Classes imported by _load(), by name.
+_loaded = {}
+
+
+def _load(module: str, name: str) -> Type:
+    cls = _loaded.get(name, None)
+    if cls is None:
+        cls = getattr(__import__(module, None, None, (name,)), name)
+        _loaded[name] = cls
+    return cls
+
+
+CrickitInputs = namedtuple("CrickitInputs", ("touch_raw", "touched", "signals"))
+"""Snapshot of all Crickit inputs, returned by `Crickit.read_inputs`.
+``touch_raw`` and ``touched`` are 4-tuples for Touch 1-4, and ``signals`` is an
+8-tuple of ``bool`` for Signal 1-8.
+"""
+
+
+class CrickitTouchIn:
+    """Imitate touchio.TouchIn."""
+
+    __slots__ = ("_pin", "_seesaw", "threshold")
+
+    def __init__(self, seesaw: "Seesaw", pin: int):
+        self._seesaw = seesaw
+        self._pin = pin
+        self.threshold = self.raw_value + 100
+
+    @property
+    def raw_value(self) -> int:
+        """The raw touch measurement as an `int`. (read-only)"""
+        return self._seesaw.touch_read(self._pin)
+
+    @property
+    def value(self) -> bool:
+        """Whether the touch pad is being touched or not. (read-only)"""
+        return self.raw_value > self.threshold
+
+
+class PWMCache:
+    """Remembers the last duty cycle and frequency written to each PWM terminal of a
+    `Crickit`, so that writes which would change nothing are skipped.
+    Available as `Crickit.pwm_cache`.
+    """
+
+    def __init__(self):
+        self.duty_cycles = {}
+        """Last duty cycle written, keyed by seesaw pin."""
+        self.frequencies = {}
+        """Last frequency written, keyed by seesaw pin."""
+        self.hits = 0
+        """Number of writes skipped because the value was already in effect."""
+        self.misses = 0
+        """Number of writes sent to the seesaw."""
+
+    def invalidate(self) -> None:
+        """Forget all remembered values, so the next write to each terminal is always sent.
+        Call this after writing PWM values through `Crickit.seesaw` directly.
+        `Crickit.reset` calls it for you.
+        """
+        self.duty_cycles.clear()
+        self.frequencies.clear()
+
+
+class _CrickitPWMOut(PWMOut):
+    """A ``PWMOut`` whose writes go through its `Crickit`, so they can be cached and batched."""
+
+    def __init__(self, crickit: "Crickit", pin: int):
+        super().__init__(crickit.seesaw, pin)
+        self._crickit = crickit
+
+    @property
+    def frequency(self) -> int:
+        """The overall PWM frequency in Hertz."""
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, frequency: int) -> None:
+        self._crickit._write_pwm_freq(self._pin, frequency)
+        self._frequency = frequency
+
+    @property
+    def duty_cycle(self) -> int:
+        """16-bit value that dictates how much of one cycle is high (1) versus low (0).
+        65535 (0xffff) will always be high, 0 will always be low,
+        and 32767 (0x7fff) will be half high and then half low.
+        """
+        return self._dc
+
+    @duty_cycle.setter
+    def duty_cycle(self, value: int) -> None:
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError("Must be 0 to 65535")
+        self._crickit._write_pwm(self._pin, value)
+        self._dc = value
+
+
+class _PWMBatch:
+    """Context manager returned by `Crickit.batch`."""
+
+    def __init__(self, crickit: "Crickit"):
+        self._crickit = crickit
+
+    def __enter__(self) -> "Crickit":
+        crickit = self._crickit
+        lock = crickit._lock
+        if lock is not None:
+            lock.acquire()
+        crickit._batch_depth += 1
+        if lock is not None:
+            lock.release()
+        return crickit
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        crickit = self._crickit
+        lock = crickit._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            crickit._batch_depth -= 1
+            if not crickit._batch_depth:
+                try:
+                    crickit._flush_pwm()
+                finally:
+                    # Drop writes a failed flush left behind, so a later batch cannot
+                    # replay them.
+                    crickit._pending_pwm.clear()
+        finally:
+            if lock is not None:
+                lock.release()
+
+
+class Crickit:
+    """Represents a Crickit board. Provides a number of devices available via properties, such as
+    ``servo_1``. Devices are created on demand the first time they are referenced.
+
+    It's fine to refer a device multiple times via its property, but it's faster and results
+    in more compact code to assign a device to a variable.
+
+    .. code-block:: python
+
+      import time
+      from adafruit_crickit import crickit
+
+      # This is fine:
+      crickit.servo_1.angle = 0
+      time.sleep(1)
+      crickit.servo_1.angle = 90
+      time.sleep(1)
+
+      # This is slightly faster and more compact:
+      servo_1 = crickit.servo_1
+      servo_1.angle = 0
+      time.sleep(1)
+      servo_1.angle = 90
+      time.sleep(1)
+    """
+
+    SIGNAL1 = 2
+    """Signal 1 terminal"""
+    SIGNAL2 = 3
+    """Signal 2 terminal"""
+    SIGNAL3 = 40
+    """Signal 3 terminal"""
+    SIGNAL4 = 41
+    """Signal 4 terminal"""
+    SIGNAL5 = 11
+    """Signal 5 terminal"""
+    SIGNAL6 = 10
+    """Signal 6 terminal"""
+    SIGNAL7 = 9
+    """Signal 7 terminal"""
+    SIGNAL8 = 8
+    """Signal 8 terminal"""
+
+    __slots__ = (
+        "_batch_depth",
+        "_coalescer",
+        "_devices",
+        "_gpio_buf",
+        "_lock",
+        "_neopixel",
+        "_onboard_pixel",
+        "_pending_pwm",
+        "_profiler",
+        "_pwm_cache",
+        "_realtime",
+        "_recorder",
+        "_seesaw",
+        "_timer_claims",
+        "_timer_frequencies",
+        "_tripped",
+        "_watchdog",
+    )
+
+    def __init__(self, seesaw: "Seesaw"):
+        self._seesaw = seesaw
+        self._seesaw.pin_mapping = _load("adafruit_seesaw.crickit", "Crickit_Pinmap")
+        # Devices created so far, indexed by _SLOT_* constants.
+        self._devices = [None] * _SLOT_COUNT
+        self._neopixel = None
+        self._onboard_pixel = None
+        # PWM writes collected by batch(), keyed by pin. Later writes replace earlier ones.
+        self._pending_pwm = {}
+        self._batch_depth = 0
+        self._pwm_cache = PWMCache()
+        self._gpio_buf = bytearray(8)
+        self._profiler = None
+        self._recorder = None
+        self._realtime = None
+        self._watchdog = None
+        # Set when the watchdog makes the board safe. PWM writes are refused until the
+        # watchdog is re-armed.
+        self._tripped = False
+        self._coalescer = None
+        # Held around PWM writes and batches once another thread writes through this
+        # Crickit, such as a watchdog or coalescing thread. None until then.
+        self._lock = None
+        # Frequency requested for each timer, and the pins of devices that rely on it.
+        self._timer_frequencies = [None] * len(_TIMER_GROUPS)
+        self._timer_claims = [set() for _ in _TIMER_GROUPS]
+
+    @property
+    def seesaw(self) -> "Seesaw":
+        """The Seesaw object that talks to the Crickit. Use this object to manipulate the
+        signal pins that correspond to Crickit terminals.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          ss = crickit.seesaw
+          ss.pin_mode(crickit.SIGNAL4, ss.OUTPUT)
+          ss.digital_write(crickit.SIGNAL4], True)
+        """
+
+        return self._seesaw
+
+    @property
+    def servo_1(self) -> "Servo":
+        """``adafruit_motor.servo.Servo`` object on Servo 1 terminal"""
+        return self._devices[_SLOT_SERVO1] or self._servo(_SLOT_SERVO1)
+
+    @property
+    def servo_2(self) -> "Servo":
+        """``adafruit_motor.servo.Servo`` object on Servo 2 terminal"""
+        return self._devices[_SLOT_SERVO2] or self._servo(_SLOT_SERVO2)
+
+    @property
+    def servo_3(self) -> "Servo":
+        """``adafruit_motor.servo.Servo`` object on Servo 3 terminal"""
+        return self._devices[_SLOT_SERVO3] or self._servo(_SLOT_SERVO3)
+
+    @property
+    def servo_4(self) -> "Servo":
+        """``adafruit_motor.servo.Servo`` object on Servo 4 terminal"""
+        return self._devices[_SLOT_SERVO4] or self._servo(_SLOT_SERVO4)
+
+    @property
+    def continuous_servo_1(self) -> "ContinuousServo":
+        """``adafruit_motor.servo.ContinuousServo`` object on Servo 1 terminal"""
+        return self._devices[_SLOT_CONTINUOUS_SERVO1] or self._servo(_SLOT_CONTINUOUS_SERVO1)
+
+    @property
+    def continuous_servo_2(self) -> "ContinuousServo":
+        """``adafruit_motor.servo.ContinuousServo`` object on Servo 2 terminal"""
+        return self._devices[_SLOT_CONTINUOUS_SERVO2] or self._servo(_SLOT_CONTINUOUS_SERVO2)
+
+    @property
+    def continuous_servo_3(self) -> "ContinuousServo":
+        """``adafruit_motor.servo.ContinuousServo`` object on Servo 3 terminal"""
+        return self._devices[_SLOT_CONTINUOUS_SERVO3] or self._servo(_SLOT_CONTINUOUS_SERVO3)
+
+    @property
+    def continuous_servo_4(self) -> "ContinuousServo":
+        """``adafruit_motor.servo.ContinuousServo`` object on Servo 4 terminal"""
+        return self._devices[_SLOT_CONTINUOUS_SERVO4] or self._servo(_SLOT_CONTINUOUS_SERVO4)
+
+    # The _servo, _motor, _stepper, _drive and _touch methods create the device for a
+    # slot. The properties only call them when the slot is still empty.
+
+    def _servo(self, slot: int) -> Any:
+        servo_class = _load(
+            "adafruit_motor.servo", "Servo" if slot < _SLOT_CONTINUOUS_SERVO1 else "ContinuousServo"
+        )
+        pin = _SLOT_TERMINALS[slot]
+        self._release_timers((pin,))
+        pwm = _CrickitPWMOut(self, pin)
+        pwm.frequency = self._timer_frequencies[_timer(pin)] or _SERVO_FREQUENCY
+        device = servo_class(pwm)
+        self._devices[slot] = device
+        # Replaces any servo of the other kind on the same terminal.
+        self._devices[slot ^ 4] = None
+        return device
+
+    @property
+    def dc_motor_1(self) -> "DCMotor":
+        """``adafruit_motor.motor.DCMotor`` object on Motor 1 terminals"""
+        return self._devices[_SLOT_DC_MOTOR1] or self._motor(_SLOT_DC_MOTOR1)
+
+    @property
+    def dc_motor_2(self) -> "DCMotor":
+        """``adafruit_motor.motor.DCMotor`` object on Motor 2 terminals"""
+        return self._devices[_SLOT_DC_MOTOR2] or self._motor(_SLOT_DC_MOTOR2)
+
+    @property
+    def stepper_motor(self) -> "CrickitStepperMotor":
+        """`adafruit_crickit.stepper.CrickitStepperMotor` object on Motor 1 and Motor 2 terminals"""
+        return self._devices[_SLOT_STEPPER] or self._stepper(_SLOT_STEPPER)
+
+    @property
+    def drive_stepper_motor(self) -> "CrickitStepperMotor":
+        """`adafruit_crickit.stepper.CrickitStepperMotor` object on Drive terminals"""
+        return self._devices[_SLOT_DRIVE_STEPPER] or self._stepper(_SLOT_DRIVE_STEPPER)
+
+    @property
+    def feather_drive_stepper_motor(self) -> "CrickitStepperMotor":
+        """`adafruit_crickit.stepper.CrickitStepperMotor` object on Drive terminals
+        on Crickit FeatherWing
+        """
+        return self._devices[_SLOT_FEATHER_DRIVE_STEPPER] or self._stepper(
+            _SLOT_FEATHER_DRIVE_STEPPER
+        )
+
+    def _motor(self, slot: int) -> "DCMotor":
+        motor_class = _load("adafruit_motor.motor", "DCMotor")
+        self._release_timers(_SLOT_TERMINALS[slot])
+        device = motor_class(
+            *(_CrickitPWMOut(self, terminal) for terminal in _SLOT_TERMINALS[slot])
+        )
+        self._devices[slot] = device
+        return device
+
+    def _stepper(self, slot: int) -> "CrickitStepperMotor":
+        stepper_class = _load("adafruit_crickit.stepper", "CrickitStepperMotor")
+        self._release_timers(_SLOT_TERMINALS[slot])
+        device = stepper_class(
+            self, *(_CrickitPWMOut(self, terminal) for terminal in _SLOT_TERMINALS[slot])
+        )
+        self._devices[slot] = device
+        return device
+
+    @property
+    def drive_1(self) -> PWMOut:
+        """``adafruit_seesaw.pwmout.PWMOut`` object on Drive 1 terminal, with ``frequency=1000``"""
+        return self._devices[_SLOT_DRIVE1] or self._drive(_SLOT_DRIVE1)
+
+    @property
+    def drive_2(self) -> PWMOut:
+        """``adafruit_seesaw.pwmout.PWMOut`` object on Drive 2 terminal, with ``frequency=1000``"""
+        return self._devices[_SLOT_DRIVE2] or self._drive(_SLOT_DRIVE2)
+
+    @property
+    def drive_3(self) -> PWMOut:
+        """``adafruit_seesaw.pwmout.PWMOut`` object on Drive 3 terminal, with ``frequency=1000``"""
+        return self._devices[_SLOT_DRIVE3] or self._drive(_SLOT_DRIVE3)
+
+    @property
+    def drive_4(self) -> PWMOut:
+        """``adafruit_seesaw.pwmout.PWMOut`` object on Drive 4 terminal, with ``frequency=1000``"""
+        return self._devices[_SLOT_DRIVE4] or self._drive(_SLOT_DRIVE4)
+
+    feather_drive_1 = drive_4
+    """``adafruit_seesaw.pwmout.PWMOut`` object on Crickit Featherwing Drive 1 terminal,
+    with ``frequency=1000``
+    """
+    feather_drive_2 = drive_3
+    """``adafruit_seesaw.pwmout.PWMOut`` object on Crickit Featherwing Drive 2 terminal,
+    with ``frequency=1000``
+    """
+    feather_drive_3 = drive_2
+    """``adafruit_seesaw.pwmout.PWMOut`` object on Crickit Featherwing Drive 3 terminal,
+    with ``frequency=1000``
+    """
+    feather_drive_4 = drive_1
+    """``adafruit_seesaw.pwmout.PWMOut`` object on Crickit Featherwing Drive 4 terminal,
+    with ``frequency=1000``
+    """
+
+    def _drive(self, slot: int) -> PWMOut:
+        pin = _SLOT_TERMINALS[slot]
+        self._release_timers((pin,))
+        device = _CrickitPWMOut(self, pin)
+        device.frequency = self._timer_frequencies[_timer(pin)] or _DRIVE_FREQUENCY
+        self._devices[slot] = device
+        return device
+
+    @property
+    def touch_1(self) -> CrickitTouchIn:
+        """``adafruit_crickit.CrickitTouchIn`` object on Touch 1 terminal"""
+        return self._devices[_SLOT_TOUCH1] or self._touch(_SLOT_TOUCH1)
+
+    @property
+    def touch_2(self) -> CrickitTouchIn:
+        """``adafruit_crickit.CrickitTouchIn`` object on Touch 2 terminal"""
+        return self._devices[_SLOT_TOUCH2] or self._touch(_SLOT_TOUCH2)
+
+    @property
+    def touch_3(self) -> CrickitTouchIn:
+        """``adafruit_crickit.CrickitTouchIn`` object on Touch 3 terminal"""
+        return self._devices[_SLOT_TOUCH3] or self._touch(_SLOT_TOUCH3)
+
+    @property
+    def touch_4(self) -> CrickitTouchIn:
+        """``adafruit_crickit.CrickitTouchIn`` object on Touch 4 terminal"""
+        return self._devices[_SLOT_TOUCH4] or self._touch(_SLOT_TOUCH4)
+
+    def _touch(self, slot: int) -> CrickitTouchIn:
+        touch_in = CrickitTouchIn(self._seesaw, _SLOT_TERMINALS[slot])
+        self._devices[slot] = touch_in
+        return touch_in
+
+    def read_inputs(self) -> CrickitInputs:
+        """Read all four touch pads and all eight signal pins, and return them as a
+        `CrickitInputs` snapshot. The signal pins are read with a single bulk GPIO read;
+        seesaw has no bulk touch read, so each touch pad is one transaction.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          inputs = crickit.read_inputs()
+          if inputs.touched[0] and not inputs.signals[3]:
+              print("Touch 1 pressed while Signal 4 is low")
+        """
+        touch_raw = []
+        touched = []
+        devices = self._devices
+        for slot in range(_SLOT_TOUCH1, _SLOT_TOUCH4 + 1):
+            touch_in = devices[slot] or self._touch(slot)
+            raw_value = touch_in.raw_value
+            touch_raw.append(raw_value)
+            touched.append(raw_value > touch_in.threshold)
+
+        buf = self._gpio_buf
+        self._seesaw.read(_GPIO_BASE, _GPIO_BULK, buf)
+        signals = []
+        for pin in _SIGNAL_PINS:
+            # Port A is big-endian in buf[0:4], port B in buf[4:8].
+            index = (7 if pin >= 32 else 3) - ((pin & 31) >> 3)
+            signals.append(bool(buf[index] & (1 << (pin & 7))))
+
+        return CrickitInputs(tuple(touch_raw), tuple(touched), tuple(signals))
+
+    @property
+    def neopixel(self) -> "NeoPixel":
+        """```adafruit_seesaw.neopixel`` object on NeoPixel terminal.
+        Raises ValueError if ``init_neopixel`` has not been called.
+        """
+        if not self._neopixel:
+            raise ValueError("Call init_neopixel first")
+        return self._neopixel
+
+    def init_neopixel(
+        self,
+        n: int,
+        *,
+        bpp: int = 3,
+        brightness: float = 1.0,
+        auto_write: bool = True,
+        pixel_order: Union[str, Tuple] = None,
+    ) -> None:
+        """Set up a seesaw.NeoPixel object
+
+        .. note:: On the CPX Crickit board, the NeoPixel terminal is by default
+          controlled by CPX pin A1, and is not controlled by seesaw. So this object
+          will not be usable. Instead, use the regular NeoPixel library
+          and specify ``board.A1`` as the pin.
+
+        You can change the jumper connection on the bottom of the CPX Crickit board
+        to move control of the NeoPixel terminal to seesaw pin #20 (terminal.NEOPIXEL).
+        In addition, the Crickit FeatherWing always uses seesaw pin #20.
+        In either of those cases, this object will work.
+
+        .. code-block:: python
+
+          from adafruit_crickit.crickit import crickit
+
+          crickit.init_neopixel(24)
+          crickit.neopixel.fill((100, 0, 0))
+        """
+
+        self._neopixel = _load("adafruit_seesaw.neopixel", "NeoPixel")(
+            self._seesaw,
+            _NEOPIXEL,
+            n,
+            bpp=bpp,
+            brightness=brightness,
+            auto_write=auto_write,
+            pixel_order=pixel_order,
+        )
+
+    @property
+    def onboard_pixel(self) -> "NeoPixel":
+        """```adafruit_seesaw.neopixel`` object on the Seesaw on-board NeoPixel.
+        Initialize on-board NeoPixel and clear upon first use.
+        """
+        if not self._onboard_pixel:
+            self._onboard_pixel = _load("adafruit_seesaw.neopixel", "NeoPixel")(
+                self._seesaw,
+                _SS_PIXEL,
+                1,
+                bpp=3,
+                brightness=1.0,
+                auto_write=True,
+                pixel_order=None,
+            )
+            self._onboard_pixel.fill((0, 0, 0))
+        return self._onboard_pixel
+
+    def batch(self) -> _PWMBatch:
+        """Collect PWM changes made to servos, motors and drives, and send them together.
+
+        Inside the ``with`` block, duty cycle changes are only recorded. When the
+        outermost block exits, each changed channel is written once, with its last value,
+        back to back so the channels change at nearly the same time.
+        Batches may be nested.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          with crickit.batch():
+              crickit.dc_motor_1.throttle = 0.5
+              crickit.dc_motor_2.throttle = 0.5
+              crickit.drive_1.fraction = 1.0
+        """
+        return _PWMBatch(self)
+
+    def _write_pwm(self, pin: int, value: int) -> None:
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            if self._tripped:
+                raise ValueError("Outputs are held safe by the watchdog; call rearm() first")
+            realtime = self._realtime
+            if realtime is not None:
+                realtime.stage(pin, value)
+                if not self._batch_depth:
+                    realtime.flush()
+                return
+            coalescer = self._coalescer
+            if coalescer is not None:
+                coalescer.set(pin, value, not self._batch_depth)
+                return
+            if self._batch_depth:
+                self._pending_pwm[pin] = value
+                return
+            cache = self._pwm_cache
+            if cache.duty_cycles.get(pin) == value:
+                cache.hits += 1
+                return
+            cache.misses += 1
+            self._seesaw.analog_write(pin, value)
+            cache.duty_cycles[pin] = value
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _thread_safe(self) -> Any:
+        # Called when another thread will write through this Crickit. From then on, PWM
+        # writes and batches hold a reentrant lock, which is returned.
+        if self._lock is None:
+            self._lock = _load("threading", "RLock")()
+        return self._lock
+
+    def _write_pwm_freq(self, pin: int, frequency: int) -> None:
+        timer = _timer(pin)
+        self._claim_timer(timer, frequency, pin)
+        self._timer_claims[timer].add(pin)
+        self._set_timer(timer, frequency)
+
+    def _release_timers(self, pins: Tuple[int, ...]) -> None:
+        # A new device on these pins replaces whatever relied on their frequency before.
+        for pin in pins:
+            self._timer_claims[_timer(pin)].discard(pin)
+
+    def _claim_timer(self, timer: int, frequency: int, pin: Union[int, None]) -> None:
+        # Check that no device other than the one on ``pin`` relies on another frequency,
+        # and plan the timer for ``frequency``.
+        if not 1 <= frequency <= 0xFFFF:
+            raise ValueError("Frequency must be from 1 to 65535 Hz")
+        current = self._timer_frequencies[timer]
+        if frequency != current:
+            claims = self._timer_claims[timer]
+            for other in claims:
+                if other != pin:
+                    raise ValueError(f"PWM timer {_TIMER_NAMES[timer]} is in use at {current} Hz")
+            claims.clear()
+            self._timer_frequencies[timer] = frequency
+
+    def _set_timer(self, timer: int, frequency: int) -> None:
+        # Setting the frequency of any pin sets it for every pin on the timer.
+        pins = _TIMER_GROUPS[timer]
+        cache = self._pwm_cache
+        if cache.frequencies.get(pins[0]) == frequency:
+            cache.hits += 1
+            return
+        cache.misses += 1
+        self._seesaw.set_pwm_freq(pins[0], frequency)
+        for pin in pins:
+            cache.frequencies[pin] = frequency
+
+    def _flush_pwm(self) -> None:
+        # Only called with the lock held, if there is one.
+        if self._realtime is not None:
+            self._realtime.flush()
+            return
+        if self._coalescer is not None:
+            self._coalescer.wake()
+            return
+        cache = self._pwm_cache
+        duty_cycles = cache.duty_cycles
+        last_pin = None
+        last_value = 0
+        for pin, value in self._pending_pwm.items():
+            if duty_cycles.get(pin) == value:
+                cache.hits += 1
+                continue
+            cache.misses += 1
+            # Seesaw takes one channel per PWM write, so skip the settling delay
+            # between them and wait only after the last one.
+            if last_pin is not None:
+                self._seesaw.analog_write(last_pin, last_value, delay=0)
+                duty_cycles[last_pin] = last_value
+            last_pin = pin
+            last_value = value
+        if last_pin is not None:
+            self._seesaw.analog_write(last_pin, last_value)
+            duty_cycles[last_pin] = last_value
+        self._pending_pwm.clear()
+
+    def _make_safe(self, brake: bool, release_servos: bool) -> None:
+        # Put every device in its safe state with one flush, even if a batch is open, and
+        # refuse PWM writes from then on. Called with the lock held, if there is one, so
+        # no other thread writes meanwhile.
+        # Writes a stalled loop left pending would otherwise be flushed with the safe state.
+        self._pending_pwm.clear()
+        if self._realtime is not None:
+            self._realtime.discard()
+        if self._coalescer is not None:
+            self._coalescer.discard()
+        self._tripped = False
+        try:
+            self._write_safe_state(brake, release_servos)
+        finally:
+            self._tripped = True
+
+    def _write_safe_state(self, brake: bool, release_servos: bool) -> None:
+        devices = self._devices
+        with self.batch():
+            for slot in range(_SLOT_SERVO1, _SLOT_CONTINUOUS_SERVO1):
+                if devices[slot] and release_servos:
+                    devices[slot].fraction = None
+            for slot in range(_SLOT_CONTINUOUS_SERVO1, _SLOT_DC_MOTOR1):
+                if devices[slot]:
+                    devices[slot].throttle = None if release_servos else 0
+            for slot in (_SLOT_DC_MOTOR1, _SLOT_DC_MOTOR2):
+                if devices[slot]:
+                    # Throttle 0 shorts the motor, None lets it coast.
+                    devices[slot].throttle = 0 if brake else None
+            for slot in range(_SLOT_STEPPER, _SLOT_DRIVE1):
+                if devices[slot] and not brake:
+                    devices[slot].release()
+            for slot in range(_SLOT_DRIVE1, _SLOT_TOUCH1):
+                if devices[slot]:
+                    devices[slot].duty_cycle = 0
+        if self._batch_depth:
+            # The batch was nested in one left open by a stalled loop.
+            self._flush_pwm()
+
+    def set_pwm_frequency(self, timer: str, frequency: int) -> None:
+        """Run the PWM timer named ``timer`` at ``frequency`` Hz. Terminals that share a
+        timer always run at the same frequency. The timers are ``"servos"`` (Servo 1-4),
+        ``"motor_1"``, ``"motor_2"``, ``"drives_1_2"`` (Drive 1 and 2) and
+        ``"drives_3_4"`` (Drive 3 and 4).
+
+        Servos and drives created afterwards on that timer use this frequency instead of
+        their default, which is 50 Hz for servos and 1000 Hz for drives. Raises ValueError
+        if a device already on the timer was set up for a different frequency, as
+        changing it would change that device's timing. Setting a frequency already in
+        effect sends nothing.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          # Quieter solenoids, without changing servo timing.
+          crickit.set_pwm_frequency("drives_1_2", 20000)
+          crickit.drive_1.fraction = 0.5
+          crickit.servo_1.angle = 90
+        """
+        if timer not in _TIMER_NAMES:
+            raise ValueError(f"Unknown PWM timer {timer!r}")
+        index = _TIMER_NAMES.index(timer)
+        self._claim_timer(index, frequency, None)
+        self._set_timer(index, frequency)
+
+    @property
+    def pwm_frequencies(self) -> dict:
+        """The frequency in Hz planned for each PWM timer by `set_pwm_frequency` or by the
+        devices created on it, or ``None`` for a timer that has not been used.
+        """
+        return dict(zip(_TIMER_NAMES, self._timer_frequencies))
+
+    @property
+    def pwm_cache(self) -> PWMCache:
+        """The `PWMCache` that lets servos, motors and drives skip PWM writes that would
+        not change anything.
+        """
+        return self._pwm_cache
+
+    def enable_realtime(self, enabled: bool = True, *, devices: Tuple[str, ...] = ()) -> None:
+        """Start (or with ``enabled=False``, stop) writing PWM duty cycles without
+        allocating any memory, so a control loop is not stalled by garbage collection.
+        See `adafruit_crickit.realtime.RealtimePWM`. Cannot be changed inside a `batch`.
+
+        Device properties return the same object every time without allocating, once
+        the device exists. ``devices`` names devices to create now, so that creating them
+        does not happen inside the loop.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          crickit.enable_realtime(devices=("dc_motor_1", "dc_motor_2"))
+          left = crickit.dc_motor_1
+          right = crickit.dc_motor_2
+          batch = crickit.batch()
+          while True:
+              with batch:
+                  left.throttle = 0.5
+                  right.throttle = -0.5
+        """
+        if self._batch_depth:
+            raise ValueError("Cannot change realtime mode inside a batch")
+        if enabled and self._coalescer is not None:
+            raise ValueError("Realtime mode and coalescing cannot be enabled together")
+        for name in devices:
+            getattr(self, name)
+        if enabled and self._realtime is None:
+            self._realtime = _load("adafruit_crickit.realtime", "RealtimePWM")(self)
+        elif not enabled:
+            self._realtime = None
+
+    @property
+    def coalescer(self) -> "PWMCoalescer":
+        """The `adafruit_crickit.coalescer.PWMCoalescer` started by `enable_coalescing`,
+        with its statistics. Raises ValueError if ``enable_coalescing`` has not been called.
+        """
+        if self._coalescer is None:
+            raise ValueError("Call enable_coalescing first")
+        return self._coalescer
+
+    def enable_coalescing(self, enabled: bool = True, *, interval: float = 0.0) -> None:
+        """Start (or with ``enabled=False``, stop) sending PWM writes from a background
+        I/O thread that only sends the newest value of each terminal, so threads that set
+        values faster than the bus can carry them never wait on it. Needs ``threading``,
+        as on Linux boards running Blinka. See `adafruit_crickit.coalescer.PWMCoalescer`.
+        Cannot be changed inside a `batch`, or enabled together with `enable_stats` or
+        `enable_recording`. Stopping sends whatever is still waiting.
+
+        While coalescing, every seesaw operation takes turns on the bus with the I/O
+        thread, so reads such as touch, signal and analog reads may be made from any
+        thread. A `batch` collects the PWM writes of every thread until it exits: none
+        of them is sent while it is open. Stopping raises the error of a failed send, if
+        there was one.
+
+        :param float interval: Least seconds between the starts of two send cycles, or 0
+          to send as fast as the bus allows.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          crickit.enable_coalescing()
+          # In any number of threads:
+          crickit.servo_1.angle = read_joystick()
+          # Then:
+          print(crickit.coalescer.coalesced, crickit.coalescer.max_cycle_time)
+        """
+        if self._batch_depth:
+            raise ValueError("Cannot change coalescing inside a batch")
+        if enabled and self._coalescer is None:
+            if self._realtime is not None:
+                raise ValueError("Realtime mode and coalescing cannot be enabled together")
+            if self._profiler is not None or self._recorder is not None:
+                raise ValueError("Coalescing cannot be enabled with stats or recording")
+            self._coalescer = _load("adafruit_crickit.coalescer", "PWMCoalescer")(self, interval)
+        elif not enabled and self._coalescer is not None:
+            coalescer = self._coalescer
+            self._coalescer = None
+            coalescer.deinit()
+
+    @property
+    def watchdog(self) -> "SafetyWatchdog":
+        """The `adafruit_crickit.safety.SafetyWatchdog` started by `enable_watchdog`.
+        Raises ValueError if ``enable_watchdog`` has not been called.
+        """
+        if self._watchdog is None:
+            raise ValueError("Call enable_watchdog first")
+        return self._watchdog
+
+    def enable_watchdog(
+        self,
+        enabled: bool = True,
+        *,
+        timeout: float = 0.5,
+        motors: str = "coast",
+        servos: str = "hold",
+        hardware: bool = False,
+    ) -> None:
+        """Start (or with ``enabled=False``, stop) a watchdog that puts every device in a
+        safe state when `watchdog` is not fed for ``timeout`` seconds. ``motors``,
+        ``servos`` and ``hardware`` are described in
+        `adafruit_crickit.safety.SafetyWatchdog`. Starting it again replaces the
+        watchdog running before. Once the board has been made safe, writes to servos,
+        motors and drives raise ValueError until
+        `adafruit_crickit.safety.SafetyWatchdog.rearm` is called.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          crickit.enable_watchdog(timeout=0.25, motors="brake")
+          while True:
+              crickit.watchdog.feed()
+              crickit.dc_motor_1.throttle = 0.5
+        """
+        if self._watchdog is not None:
+            self._watchdog.deinit()
+            self._watchdog = None
+        if enabled:
+            self._watchdog = _load("adafruit_crickit.safety", "SafetyWatchdog")(
+                self, timeout, motors=motors, servos=servos, hardware=hardware
+            )
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        """Start (or with ``enabled=False``, stop) recording seesaw bus traffic for `stats`.
+        While stats are disabled, which is the default, the seesaw is not wrapped at all
+        and costs nothing extra.
+        """
+        if enabled and self._profiler is None:
+            if self._recorder is not None:
+                raise ValueError("Stats and recording cannot be enabled together")
+            if self._coalescer is not None:
+                raise ValueError("Coalescing cannot be enabled with stats or recording")
+            from adafruit_crickit.profiler import BusProfiler  # noqa: PLC0415
+
+            self._profiler = BusProfiler(self._seesaw)
+            self._profiler.install()
+        elif not enabled and self._profiler is not None:
+            self._profiler.uninstall()
+            self._profiler = None
+
+    def stats(self, *, reset: bool = False) -> dict:
+        """Bus traffic recorded since `enable_stats` was called or the stats were last reset.
+        Raises ValueError if ``enable_stats`` has not been called.
+
+        Returns a ``dict`` with the overall ``count`` of seesaw operations, ``bytes``
+        transferred, total ``time`` spent in them, ``elapsed`` wall time and
+        ``bytes_per_second``. ``terminals`` breaks the traffic down by seesaw pin
+        (or ``"gpio"``, ``"neopixel"``, ``"status"``), each with ``count``, ``bytes``,
+        ``time``, ``max`` and recent ``p50``/``p90``/``p99`` latency in seconds.
+        ``devices`` gives ``count``, ``bytes`` and ``time`` per device type.
+
+        :param bool reset: Start recording afresh after collecting the stats.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          crickit.enable_stats()
+          for _ in range(100):
+              crickit.servo_1.angle = 0
+              crickit.servo_1.angle = 180
+          print(crickit.stats()["devices"])
+        """
+        if self._profiler is None:
+            raise ValueError("Call enable_stats first")
+        summary = self._profiler.summary(self._device_types())
+        if reset:
+            self._profiler.reset()
+        return summary
+
+    def _device_types(self) -> dict:
+        # Name of the device type using each terminal.
+        device_types = {}
+        for slot, device in enumerate(self._devices):
+            if device is None:
+                continue
+            name = type(device).__name__
+            terminals = _SLOT_TERMINALS[slot]
+            if isinstance(terminals, int):
+                device_types[terminals] = name
+            else:
+                for terminal in terminals:
+                    device_types[terminal] = name
+        if self._neopixel:
+            device_types["neopixel"] = "NeoPixel"
+        return device_types
+
+    def enable_recording(self, enabled: bool = True, *, records: int = 256) -> None:
+        """Start (or with ``enabled=False``, stop) recording every seesaw operation into a
+        ring buffer that keeps the latest ``records`` operations, 16 bytes each.
+        Use `save_recording` to write them out for `adafruit_crickit.recorder.Recording`
+        to analyze. Recording and `enable_stats` cannot be enabled at the same time.
+        """
+        if enabled and self._recorder is None:
+            if self._profiler is not None:
+                raise ValueError("Stats and recording cannot be enabled together")
+            if self._coalescer is not None:
+                raise ValueError("Coalescing cannot be enabled with stats or recording")
+            from adafruit_crickit.recorder import BusRecorder  # noqa: PLC0415
+
+            self._recorder = BusRecorder(self._seesaw, records)
+            self._recorder.install()
+        elif not enabled and self._recorder is not None:
+            self._recorder.uninstall()
+            self._recorder = None
+
+    def save_recording(self, stream: "BinaryIO") -> None:
+        """Write the operations recorded since `enable_recording` to a binary ``stream``.
+        Raises ValueError if ``enable_recording`` has not been called.
+
+        .. code-block:: python
+
+          from adafruit_crickit import crickit
+
+          crickit.enable_recording(records=1024)
+          run_robot()
+          with open("/bus.bin", "wb") as stream:
+              crickit.save_recording(stream)
+        """
+        if self._recorder is None:
+            raise ValueError("Call enable_recording first")
+        self._recorder.save(stream, self._device_types())
+
+    def reset(self) -> None:
+        """Reset the whole Crickit board. PWM timers are set back to the frequencies
+        their devices were set up for, such as 2000 Hz for stepper coils.
+        """
+        self._seesaw.sw_reset()
+        self._pwm_cache.invalidate()
+        for timer, frequency in enumerate(self._timer_frequencies):
+            if frequency is not None:
+                self._set_timer(timer, frequency)
+
+
+def __getattr__(name: str) -> Any:
+    # Build the crickit singleton on first use rather than at import, since creating
+    # it resets and probes the board.
+    if name != "crickit":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import board  # noqa: PLC0415
+
+    crickit = None
+    # Sphinx's board is missing real pins so skip the constructor in that case.
+    if "I2C" in dir(board):
+        seesaw_class = _load("adafruit_seesaw.seesaw", "Seesaw")
+        crickit = Crickit(seesaw_class(board.I2C()))
+    globals()["crickit"] = crickit
+    return crickit
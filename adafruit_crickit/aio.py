@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.aio`
+==========================
+
+``asyncio`` access to a Crickit, so that steppers, touch pads and NeoPixels can be
+driven from concurrent tasks instead of ``time.sleep`` loops.
+
+Every bus operation is run through `AsyncCrickit.run`, which holds a single lock for
+the duration of the operation. Tasks queue on that lock in order, so one task can never
+interleave its seesaw transactions with a multi-step operation of another task.
+The I2C transfers themselves still block; what becomes non-blocking is the waiting
+between them.
+
+.. code-block:: python
+
+  import asyncio
+  from adafruit_crickit import crickit
+  from adafruit_crickit.aio import AsyncCrickit
+
+  acrickit = AsyncCrickit(crickit)
+
+  async def main():
+      await asyncio.gather(
+          acrickit.stepper_motor.step(200, 100),
+          acrickit.touch_1.wait_for_touch(),
+      )
+
+  asyncio.run(main())
+"""
+
+import asyncio
+import time
+
+from adafruit_motor import stepper
+
+try:
+    from typing import Any, Callable
+
+    from adafruit_motor.stepper import StepperMotor
+
+    from adafruit_crickit import Crickit, CrickitInputs, CrickitTouchIn
+except ImportError:
+    pass
+
+
+class AsyncStepper:
+    """Awaitable stepping of a ``StepperMotor``. Get one from an `AsyncCrickit` property
+    such as `AsyncCrickit.stepper_motor`.
+    """
+
+    def __init__(self, acrickit: "AsyncCrickit", motor: "StepperMotor"):
+        self._acrickit = acrickit
+        self.motor = motor
+        """The underlying ``adafruit_motor.stepper.StepperMotor``."""
+
+    async def step(self, steps: int, rate: float, *, style: int = stepper.SINGLE) -> None:
+        """Move ``steps`` steps at ``rate`` steps per second, yielding to other tasks
+        between steps. Negative ``steps`` move backward.
+        """
+        direction = stepper.FORWARD
+        if steps < 0:
+            direction = stepper.BACKWARD
+            steps = -steps
+        interval = 1 / rate
+        onestep = self.motor.onestep
+        run = self._acrickit.run
+        next_time = time.monotonic()
+        for _ in range(steps):
+            await run(onestep, direction=direction, style=style)
+            # Schedule against the start time so the rate does not drift.
+            next_time += interval
+            await asyncio.sleep(max(0, next_time - time.monotonic()))
+
+    async def release(self) -> None:
+        """Release the coils so the motor can spin freely."""
+        await self._acrickit.run(self.motor.release)
+
+
+class AsyncTouchIn:
+    """Awaitable reads of a `adafruit_crickit.CrickitTouchIn`. Get one from an
+    `AsyncCrickit` property such as `AsyncCrickit.touch_1`.
+    """
+
+    def __init__(self, acrickit: "AsyncCrickit", touch_in: "CrickitTouchIn"):
+        self._acrickit = acrickit
+        self.touch_in = touch_in
+        """The underlying `adafruit_crickit.CrickitTouchIn`."""
+
+    async def raw_value(self) -> int:
+        """The raw touch measurement."""
+        return await self._acrickit.run(self._read_raw)
+
+    async def value(self) -> bool:
+        """Whether the touch pad is being touched."""
+        return await self.raw_value() > self.touch_in.threshold
+
+    async def wait_for_touch(self, interval: float = 0.02) -> None:
+        """Wait until the pad is touched, checking every ``interval`` seconds."""
+        while not await self.value():
+            await asyncio.sleep(interval)
+
+    async def wait_for_release(self, interval: float = 0.02) -> None:
+        """Wait until the pad is no longer touched, checking every ``interval`` seconds."""
+        while await self.value():
+            await asyncio.sleep(interval)
+
+    def _read_raw(self) -> int:
+        return self.touch_in.raw_value
+
+
+class AsyncCrickit:
+    """Wraps a `adafruit_crickit.Crickit` for use from ``asyncio`` tasks.
+    The stepper and touch properties make a new wrapper on each access, so assign
+    them to a variable when using them in a loop.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit to control.
+    """
+
+    def __init__(self, crickit: "Crickit"):
+        self._crickit = crickit
+        self._lock = asyncio.Lock()
+
+    @property
+    def crickit(self) -> "Crickit":
+        """The wrapped `adafruit_crickit.Crickit`. Only use it directly from code that
+        does not await in the middle of a sequence of bus operations.
+        """
+        return self._crickit
+
+    async def run(self, function: "Callable", *args, **kwargs) -> "Any":
+        """Call ``function(*args, **kwargs)`` while holding the bus, and return its result.
+        Calls from different tasks are run one at a time, in the order they were made.
+
+        .. code-block:: python
+
+          await acrickit.run(crickit.neopixel.show)
+        """
+        async with self._lock:
+            return function(*args, **kwargs)
+
+    async def set(self, device: "Any", attribute: str, value: "Any") -> None:
+        """Set ``attribute`` of ``device`` to ``value`` while holding the bus.
+
+        .. code-block:: python
+
+          await acrickit.set(crickit.servo_1, "angle", 90)
+        """
+        async with self._lock:
+            setattr(device, attribute, value)
+
+    async def read_inputs(self) -> "CrickitInputs":
+        """Awaitable `adafruit_crickit.Crickit.read_inputs`."""
+        return await self.run(self._crickit.read_inputs)
+
+    async def poll_inputs(self, callback: "Callable", interval: float) -> None:
+        """Call ``callback`` with a fresh `adafruit_crickit.CrickitInputs` every
+        ``interval`` seconds, forever. Run it as a task:
+
+        .. code-block:: python
+
+          asyncio.create_task(acrickit.poll_inputs(print, 0.1))
+        """
+        while True:
+            callback(await self.read_inputs())
+            await asyncio.sleep(interval)
+
+    @property
+    def stepper_motor(self) -> AsyncStepper:
+        """`AsyncStepper` for the stepper motor on the Motor terminals."""
+        return AsyncStepper(self, self._crickit.stepper_motor)
+
+    @property
+    def drive_stepper_motor(self) -> AsyncStepper:
+        """`AsyncStepper` for the stepper motor on the Drive terminals."""
+        return AsyncStepper(self, self._crickit.drive_stepper_motor)
+
+    @property
+    def feather_drive_stepper_motor(self) -> AsyncStepper:
+        """`AsyncStepper` for the stepper motor on the Crickit FeatherWing Drive terminals."""
+        return AsyncStepper(self, self._crickit.feather_drive_stepper_motor)
+
+    @property
+    def touch_1(self) -> AsyncTouchIn:
+        """`AsyncTouchIn` for the Touch 1 terminal."""
+        return AsyncTouchIn(self, self._crickit.touch_1)
+
+    @property
+    def touch_2(self) -> AsyncTouchIn:
+        """`AsyncTouchIn` for the Touch 2 terminal."""
+        return AsyncTouchIn(self, self._crickit.touch_2)
+
+    @property
+    def touch_3(self) -> AsyncTouchIn:
+        """`AsyncTouchIn` for the Touch 3 terminal."""
+        return AsyncTouchIn(self, self._crickit.touch_3)
+
+    @property
+    def touch_4(self) -> AsyncTouchIn:
+        """`AsyncTouchIn` for the Touch 4 terminal."""
+        return AsyncTouchIn(self, self._crickit.touch_4)
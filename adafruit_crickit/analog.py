@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.analog`
+=========================
+
+Evenly spaced analog sampling of the Crickit signal pins.
+
+`AnalogSampler` reads the chosen signal pins round-robin, one ADC read at a time, on a
+fixed schedule, and stores the samples with their timestamps in a ring buffer that is
+allocated once. Each stored sample can be the average of several reads. Reads that the
+bus could not make in time are skipped and counted, so the real ceiling of the bus can
+be found by raising the rate until reads start being dropped.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.analog import AnalogSampler
+
+  sampler = AnalogSampler(crickit, (1, 2), rate=50, average=4)
+  while True:
+      sampler.update()
+      for sample in sampler.samples():
+          print(sample.signal, sample.value, sample.timestamp)
+"""
+
+import time
+from array import array
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    from typing import Iterator, Sequence, Tuple
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+_ADC_BASE = const(0x09)
+_ADC_CHANNEL_OFFSET = const(0x07)
+_SAMD09_HW_ID_CODE = const(0x55)
+# Timestamps are kept in milliseconds and wrap here, so they stay small ints on
+# CircuitPython and fit the ring buffer.
+_TIME_MASK = const(0x3FFFFFFF)
+
+# Seesaw pin of each signal terminal, Signal 1 to Signal 8.
+_SIGNAL_PINS = (2, 3, 40, 41, 11, 10, 9, 8)
+
+AnalogSample = namedtuple("AnalogSample", ("signal", "value", "timestamp"))
+"""A stored analog sample.
+
+``signal`` is the signal number, 1 to 8; ``value`` is the reading, 0 to 1023, averaged
+over ``average`` reads; ``timestamp`` is when the last of those reads was made, in
+seconds since the sampler started, to the millisecond. Timestamps wrap back to 0 every
+2**30 milliseconds, about 12.4 days.
+"""
+
+
+class AnalogSampler:
+    """Samples Crickit signal pins at a fixed rate into a ring buffer.
+
+    Call `update` as often as possible from your main loop, or `run` to sample for a
+    while, and take the samples out with `samples`. When the buffer is full, each new
+    sample replaces the oldest one, which is counted in `overwritten`.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the signal pins are on.
+    :param Sequence[int] signals: The signal numbers to sample, 1 to 8.
+    :param float rate: Samples to store per second, for each signal.
+    :param int average: How many reads to average into each stored sample, 1 to 255.
+    :param int size: How many samples the ring buffer holds.
+    :param float read_delay: Seconds to wait between requesting a reading and reading
+      it. The default is what ``Seesaw.analog_read`` waits.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        signals: "Sequence[int]",
+        rate: float,
+        *,
+        average: int = 1,
+        size: int = 256,
+        read_delay: float = 0.008,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 1 <= average <= 255:
+            raise ValueError("average must be 1 to 255")
+        seesaw = crickit.seesaw
+        registers = bytearray(len(signals))
+        for i, signal in enumerate(signals):
+            if not 1 <= signal <= 8:
+                raise ValueError("Signals are numbered 1 to 8")
+            pin = _SIGNAL_PINS[signal - 1]
+            if seesaw.chip_id == _SAMD09_HW_ID_CODE:
+                registers[i] = _ADC_CHANNEL_OFFSET + seesaw.pin_mapping.analog_pins.index(pin)
+            else:
+                registers[i] = _ADC_CHANNEL_OFFSET + pin
+        self._seesaw = seesaw
+        self._signals = tuple(signals)
+        self._registers = registers
+        self._rate = rate
+        self._average = average
+        self._read_delay = read_delay
+        # One read of one signal per interval.
+        self._interval = 1 / (rate * average * len(signals))
+        self._buf = bytearray(2)
+        # Per signal: the running sum and count of reads for the sample in progress,
+        # and the last sample stored.
+        self._sums = array("L", [0] * len(signals))
+        self._counts = bytearray(len(signals))
+        self._latest = array("H", bytes(2 * len(signals)))
+        # The ring buffer.
+        self._size = size
+        self._sample_signals = bytearray(size)
+        self._values = array("H", bytes(2 * size))
+        self._times = array("L", [0] * size)
+        self._head = 0
+        self._length = 0
+        self._start_time = time.monotonic()
+        self._next_read = self._start_time
+        self._signal_index = 0
+        self.reads = 0
+        """Number of ADC reads made."""
+        self.dropped = 0
+        """Number of reads skipped because they were not made in time."""
+        self.stored = 0
+        """Number of samples stored."""
+        self.overwritten = 0
+        """Number of samples lost because the buffer was full."""
+
+    def start(self) -> None:
+        """Start sampling afresh: empty the buffer and reset the counters."""
+        self._start_time = time.monotonic()
+        self._next_read = self._start_time
+        self._signal_index = 0
+        self._head = 0
+        self._length = 0
+        for i in range(len(self._signals)):
+            self._sums[i] = 0
+            self._counts[i] = 0
+        self.reads = 0
+        self.dropped = 0
+        self.stored = 0
+        self.overwritten = 0
+
+    def update(self) -> bool:
+        """Make the next read, if it is due. Returns ``True`` if a read was made."""
+        now = time.monotonic()
+        if now < self._next_read:
+            return False
+        index = self._signal_index
+        buf = self._buf
+        self._seesaw.read(_ADC_BASE, self._registers[index], buf, self._read_delay)
+        self.reads += 1
+        self._sums[index] += (buf[0] << 8) | buf[1]
+        self._counts[index] += 1
+        if self._counts[index] >= self._average:
+            self._store(index, self._sums[index] // self._counts[index], now)
+            self._sums[index] = 0
+            self._counts[index] = 0
+        interval = self._interval
+        self._next_read += interval
+        skipped = 0
+        if self._next_read <= now:
+            skipped = int((now - self._next_read) / interval) + 1
+            self.dropped += skipped
+            self._next_read += skipped * interval
+        # Skipped reads keep their place in the rotation, so each signal stays evenly spaced.
+        self._signal_index = (index + 1 + skipped) % len(self._signals)
+        return True
+
+    def _store(self, index: int, value: int, now: float) -> None:
+        size = self._size
+        position = (self._head + self._length) % size
+        if self._length == size:
+            self._head = (self._head + 1) % size
+            self.overwritten += 1
+        else:
+            self._length += 1
+        self._sample_signals[position] = index
+        self._values[position] = value
+        self._times[position] = int((now - self._start_time) * 1000) & _TIME_MASK
+        self._latest[index] = value
+        self.stored += 1
+
+    def samples(self) -> "Iterator[AnalogSample]":
+        """Take the stored samples out of the buffer, oldest first, as `AnalogSample`
+        objects."""
+        while self._length:
+            position = self._head
+            self._head = (position + 1) % self._size
+            self._length -= 1
+            yield AnalogSample(
+                self._signals[self._sample_signals[position]],
+                self._values[position],
+                self._times[position] / 1000,
+            )
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def latest(self) -> "Tuple[int, ...]":
+        """The last sample stored for each signal, in the order of ``signals``."""
+        return tuple(self._latest)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Samples stored per second, per signal, since sampling started."""
+        elapsed = time.monotonic() - self._start_time
+        return self.stored / len(self._signals) / elapsed if elapsed > 0 else 0.0
+
+    def run(self, duration: float) -> None:
+        """Sample for ``duration`` seconds, sleeping between reads."""
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            self.update()
+            delay = self._next_read - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.coalescer`
+============================
+
+Hands PWM writes to a background thread that sends only the newest value of each
+terminal, for hosts with ``threading``, such as Linux boards running Blinka. Use it
+through `adafruit_crickit.Crickit.enable_coalescing`.
+
+Threads that set servo angles or motor throttles faster than the I2C bus can carry them
+would otherwise queue up on the bus, each write waiting for all those before it. With
+coalescing, setting a value only stores it in the terminal's slot and wakes the I/O
+thread. Each cycle, the I/O thread takes the newest value of every terminal that
+changed and sends them back to back. Values replaced before they were sent are never
+sent at all, so the bus cannot fall behind and a value waits at most about two cycles.
+
+A value is stored before its slot is marked, and the I/O thread clears the mark before
+reading the value, so it never misses a newer one. The I/O thread takes values under
+the Crickit's lock, and takes none while a batch is open, so no part of a batch is sent
+before it exits. The bus is shared with a lock: while coalescing is enabled, the seesaw's ``read``
+and ``write`` are wrapped so that each operation, including both transactions of a
+register read, holds it, and a PWM write of the I/O thread cannot land in the middle of
+a read made by another thread.
+"""
+
+import threading
+import time
+
+from adafruit_crickit import _TIMER_GROUPS
+
+try:
+    from typing import Optional
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+
+class PWMCoalescer:
+    """Sends the PWM writes of a Crickit from a background thread, newest value per
+    terminal first.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit to write to.
+    :param float interval: Least seconds from the start of one cycle to the next, or 0
+      to send as fast as the bus allows.
+    """
+
+    def __init__(self, crickit: "Crickit", interval: float = 0.0):
+        self._crickit = crickit
+        self._seesaw = crickit.seesaw
+        self._interval = interval
+        # Batches are now entered and written through from more than one thread.
+        crickit._thread_safe()
+        self._bus_lock = threading.RLock()
+        self._install()
+        self._pins = tuple(pin for pins in _TIMER_GROUPS for pin in pins)
+        size = max(self._pins) + 1
+        # Indexed by seesaw pin: the newest value, whether it is waiting to be sent,
+        # and since when a value has been waiting.
+        self._values = [0] * size
+        self._pending = bytearray(size)
+        self._since = [0.0] * size
+        self._wake = threading.Event()
+        self._busy = False
+        self._running = True
+        self._error = None
+        self.coalesced = 0
+        """Number of values replaced by a newer one before they were sent."""
+        self.cycles = 0
+        """Number of cycles that sent at least one value."""
+        self.cycle_time = 0.0
+        """Seconds the last cycle took to send its values."""
+        self.max_cycle_time = 0.0
+        """Longest `cycle_time` so far."""
+        self.max_latency = 0.0
+        """Longest wait, in seconds, from a value being set until it, or a newer value
+        replacing it, was sent."""
+        self.max_depth = 0
+        """Most terminals waiting to be sent at the start of a cycle."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _install(self) -> None:
+        seesaw = self._seesaw
+        seesaw_class = type(seesaw)
+        bus_lock = self._bus_lock
+
+        def write(reg_base: int, reg: int, buf: "Optional[bytes]" = None) -> None:
+            with bus_lock:
+                seesaw_class.write(seesaw, reg_base, reg, buf)
+
+        def read(reg_base: int, reg: int, buf: bytearray, delay: float = 0.008) -> None:
+            # Holds the lock from the register request until the result is read.
+            with bus_lock:
+                seesaw_class.read(seesaw, reg_base, reg, buf, delay)
+
+        seesaw.write = write
+        seesaw.read = read
+
+    @property
+    def depth(self) -> int:
+        """Number of terminals with a value waiting to be sent."""
+        pending = self._pending
+        return sum(pending[pin] for pin in self._pins)
+
+    def set(self, pin: int, value: int, wake: bool = True) -> None:
+        """Store ``value`` as the newest duty cycle of ``pin``, and wake the I/O thread
+        unless ``wake`` is ``False``. Raises the error of a failed send, if there was one.
+        """
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+        self._values[pin] = value
+        if self._pending[pin]:
+            self.coalesced += 1
+        else:
+            self._since[pin] = time.monotonic()
+            self._pending[pin] = 1
+        if wake:
+            self._wake.set()
+
+    def discard(self) -> None:
+        """Drop every value waiting to be sent. Call with the Crickit's lock held."""
+        pending = self._pending
+        for pin in self._pins:
+            pending[pin] = 0
+
+    def wake(self) -> None:
+        """Wake the I/O thread to send whatever is waiting."""
+        self._wake.set()
+
+    def wait(self, timeout: "Optional[float]" = None) -> bool:
+        """Wait until every value set so far has been sent. Returns ``False`` if
+        ``timeout`` seconds passed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # The I/O thread is busy from before it takes values until they are sent.
+        while self._busy or self.depth:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wake.set()
+            time.sleep(0.0005)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._running:
+                return
+            start = time.monotonic()
+            self._busy = True
+            try:
+                self._cycle(start)
+            except Exception as error:
+                self._error = error
+            self._busy = False
+            if self._interval:
+                delay = start + self._interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+    def _cycle(self, start: float) -> None:
+        crickit = self._crickit
+        pending = self._pending
+        values = self._values
+        cache = crickit.pwm_cache
+        duty_cycles = cache.duty_cycles
+        changes = []
+        waiting = 0
+        oldest = start
+        lock = crickit._lock
+        lock.acquire()
+        try:
+            if crickit._batch_depth:
+                # Leave the values waiting; the batch wakes the thread when it exits.
+                return
+            for pin in self._pins:
+                if not pending[pin]:
+                    continue
+                # Clear the mark before reading, so a newer value marks the slot again.
+                pending[pin] = 0
+                value = values[pin]
+                waiting += 1
+                oldest = min(oldest, self._since[pin])
+                if duty_cycles.get(pin) == value:
+                    cache.hits += 1
+                    continue
+                cache.misses += 1
+                changes.append((pin, value))
+        finally:
+            lock.release()
+        self.max_depth = max(self.max_depth, waiting)
+        if not changes:
+            return
+        # Seesaw takes one channel per PWM write, so wait for it to settle only once.
+        last = len(changes) - 1
+        for i, (pin, value) in enumerate(changes):
+            self._seesaw.analog_write(pin, value, delay=0.001 if i == last else 0)
+            duty_cycles[pin] = value
+        now = time.monotonic()
+        self.cycle_time = now - start
+        self.max_cycle_time = max(self.max_cycle_time, self.cycle_time)
+        self.max_latency = max(self.max_latency, now - oldest)
+        self.cycles += 1
+
+    def deinit(self) -> None:
+        """Send whatever is waiting, then stop the I/O thread. Raises the error of a
+        failed send, if there was one."""
+        self.wait()
+        self._running = False
+        self._wake.set()
+        self._thread.join()
+        del self._seesaw.write
+        del self._seesaw.read
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.drive`
+========================
+
+Two-wheel differential drive on a pair of Crickit DC motors or continuous servos.
+
+`DifferentialDrive` takes a linear and an angular velocity, works out the speed of each
+wheel, and on each tick of a fixed control rate moves the wheel throttles toward those
+speeds within an acceleration limit. Both throttles of a tick are sent together as one
+`adafruit_crickit.Crickit.batch`, so the wheels change at nearly the same time and the
+robot does not yaw when a command changes. The acceleration limit scales both wheels'
+steps by the same factor, so the wheels reach their new speeds together as well.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.drive import DifferentialDrive
+
+  # Wheels 0.15 m apart, 0.5 m/s at full throttle.
+  drive = DifferentialDrive(
+      crickit, crickit.dc_motor_1, crickit.dc_motor_2,
+      track_width=0.15, max_speed=0.5, max_acceleration=1.0,
+  )
+  drive.set_velocity(0.3, 1.0)  # 0.3 m/s forward, turning left at 1 rad/s.
+  drive.run(2.0)
+  drive.stop()
+  drive.run(1.0)
+  print("Tick jitter:", drive.jitter)
+"""
+
+import math
+import time
+
+try:
+    from typing import Optional, Tuple, Union
+
+    from adafruit_motor.motor import DCMotor
+    from adafruit_motor.servo import ContinuousServo
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+
+class DifferentialDrive:
+    """Drives a robot with two wheels from linear and angular velocities.
+
+    Call `update` as often as possible from your main loop, or `run` to drive for a
+    while. Throttles only change on ticks of the control rate.
+
+    ``linear``, ``track_width``, ``max_speed`` and ``max_acceleration`` share one unit
+    of length, such as meters. The defaults make ``linear`` a fraction of full throttle,
+    and ``angular`` the throttle difference between the wheels, as in arcade drive.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the wheels are on.
+    :param left: The left wheel, such as ``crickit.dc_motor_1`` or
+      ``crickit.continuous_servo_1``.
+    :param right: The right wheel, such as ``crickit.dc_motor_2`` or
+      ``crickit.continuous_servo_2``.
+    :param float track_width: Distance between the wheels.
+    :param float max_speed: Wheel speed at full throttle, per second.
+    :param float max_acceleration: Most change in wheel speed, per second per second, or
+      ``None`` for no limit.
+    :param float deadband: Throttles closer to 0 than this are sent as 0, so the motors
+      do not hum without moving.
+    :param float rate: Control ticks per second.
+    :param bool invert_left: Reverse the left wheel, if it is mounted backward.
+    :param bool invert_right: Reverse the right wheel, if it is mounted backward.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        left: "Union[DCMotor, ContinuousServo]",
+        right: "Union[DCMotor, ContinuousServo]",
+        *,
+        track_width: float = 2.0,
+        max_speed: float = 1.0,
+        max_acceleration: "Optional[float]" = None,
+        deadband: float = 0.0,
+        rate: float = 50.0,
+        invert_left: bool = False,
+        invert_right: bool = False,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if track_width <= 0 or max_speed <= 0:
+            raise ValueError("track_width and max_speed must be positive")
+        if max_acceleration is not None and max_acceleration <= 0:
+            raise ValueError("max_acceleration must be positive")
+        if not 0.0 <= deadband < 1.0:
+            raise ValueError("deadband must be 0.0 to less than 1.0")
+        self._batch = crickit.batch()
+        self._left = left
+        self._right = right
+        self._left_sign = -1 if invert_left else 1
+        self._right_sign = -1 if invert_right else 1
+        self._half_track = track_width / 2
+        self._max_speed = max_speed
+        # In throttle per second.
+        self._max_step = None if max_acceleration is None else max_acceleration / max_speed
+        self._deadband = deadband
+        self._interval = 1 / rate
+        # Target and current throttle of each wheel, before inversion and deadband.
+        self._target_left = 0.0
+        self._target_right = 0.0
+        self._left_throttle = 0.0
+        self._right_throttle = 0.0
+        # Whether the wheels had reached their targets at the last tick.
+        self._settled = True
+        self._start_time = time.monotonic()
+        self._next_tick = self._start_time
+        self._last_tick = self._start_time
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+        self.ticks = 0
+        """Control ticks run."""
+        self.missed = 0
+        """Ticks skipped because `update` was not called before the next was due, while
+        the wheels were still ramping. Ticks passed while the wheels held steady at their
+        targets are not counted, nor are the gaps around them in `jitter`."""
+        self.max_lateness = 0.0
+        """Longest delay, in seconds, between when a tick was due and when it ran."""
+
+    def set_velocity(self, linear: float, angular: float) -> None:
+        """Set the velocity to drive at. The wheels ramp to it over the following ticks.
+
+        If a wheel would need more than full throttle, both wheels are slowed by the same
+        factor, so the robot keeps to the same curve.
+
+        :param float linear: Forward speed, per second. Negative drives backward.
+        :param float angular: Turn rate, in radians per second. Positive turns left.
+        """
+        turn = angular * self._half_track
+        self._set_targets((linear - turn) / self._max_speed, (linear + turn) / self._max_speed)
+
+    def tank(self, left: float, right: float) -> None:
+        """Set the throttle each wheel ramps to, from -1.0 to 1.0."""
+        if not (-1.0 <= left <= 1.0 and -1.0 <= right <= 1.0):
+            raise ValueError("Throttle must be between -1.0 and 1.0")
+        self._set_targets(left, right)
+
+    def _set_targets(self, left: float, right: float) -> None:
+        largest = max(abs(left), abs(right))
+        if largest > 1.0:
+            left /= largest
+            right /= largest
+        self._target_left = left
+        self._target_right = right
+
+    def stop(self, *, immediate: bool = False) -> None:
+        """Ramp both wheels down to a stop, or if ``immediate``, stop them now."""
+        self._target_left = 0.0
+        self._target_right = 0.0
+        if immediate:
+            self._left_throttle = 0.0
+            self._right_throttle = 0.0
+            self._send()
+
+    @property
+    def throttles(self) -> "Tuple[float, float]":
+        """The throttles last sent to the left and right wheels, before inversion."""
+        return self._output(self._left_throttle), self._output(self._right_throttle)
+
+    @property
+    def moving(self) -> bool:
+        """``True`` until both wheels have reached their target throttles."""
+        return (
+            self._left_throttle != self._target_left or self._right_throttle != self._target_right
+        )
+
+    def _output(self, throttle: float) -> float:
+        return 0.0 if abs(throttle) < self._deadband else throttle
+
+    def start(self) -> None:
+        """Start the tick schedule afresh and reset the tick statistics."""
+        self._start_time = time.monotonic()
+        self._next_tick = self._start_time
+        self._last_tick = self._start_time
+        self._interval_count = 0
+        self._interval_mean = 0.0
+        self._interval_m2 = 0.0
+        self.ticks = 0
+        self.missed = 0
+        self.max_lateness = 0.0
+
+    def update(self) -> bool:
+        """Run a control tick, if one is due. Returns ``True`` if a tick was run."""
+        now = time.monotonic()
+        if now < self._next_tick:
+            return False
+        interval = self._interval
+        resumed = self._settled and now - self._next_tick >= interval
+        if resumed:
+            # Nothing was left to do since the last tick, so the time since was idle
+            # rather than missed. Start the schedule afresh from now.
+            self._next_tick = now
+        self.max_lateness = max(self.max_lateness, now - self._next_tick)
+        dt = now - self._last_tick
+        self._last_tick = now
+        if self.ticks and not resumed:
+            # Welford's running variance of the time between ticks.
+            self._interval_count += 1
+            delta = dt - self._interval_mean
+            self._interval_mean += delta / self._interval_count
+            self._interval_m2 += delta * (dt - self._interval_mean)
+        # However long it has been, a tick moves the wheels at most one tick's worth, so
+        # the acceleration limit holds after a gap.
+        self._ramp(min(dt, interval))
+        self._send()
+        self._settled = not self.moving
+        self.ticks += 1
+        self._next_tick += interval
+        if self._next_tick <= now:
+            missed = int((now - self._next_tick) / interval) + 1
+            self.missed += missed
+            self._next_tick += missed * interval
+        return True
+
+    def _ramp(self, dt: float) -> None:
+        left_step = self._target_left - self._left_throttle
+        right_step = self._target_right - self._right_throttle
+        largest = max(abs(left_step), abs(right_step))
+        if self._max_step is None or largest <= self._max_step * dt:
+            self._left_throttle = self._target_left
+            self._right_throttle = self._target_right
+            return
+        # Shorten both steps alike, so both wheels reach their targets on the same tick.
+        scale = self._max_step * dt / largest
+        self._left_throttle += left_step * scale
+        self._right_throttle += right_step * scale
+
+    def _send(self) -> None:
+        with self._batch:
+            self._left.throttle = self._left_sign * self._output(self._left_throttle)
+            self._right.throttle = self._right_sign * self._output(self._right_throttle)
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation, in seconds, of the time between ticks since `start`."""
+        if self._interval_count < 2:
+            return 0.0
+        return math.sqrt(self._interval_m2 / (self._interval_count - 1))
+
+    @property
+    def mean_interval(self) -> float:
+        """Mean time, in seconds, between ticks since `start`."""
+        return self._interval_mean
+
+    @property
+    def achieved_rate(self) -> float:
+        """Control ticks per second achieved since `start`."""
+        elapsed = time.monotonic() - self._start_time
+        return self.ticks / elapsed if elapsed > 0 else 0.0
+
+    def run(self, duration: float) -> None:
+        """Drive for ``duration`` seconds, sleeping between ticks."""
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            self.update()
+            delay = min(self._next_tick, end) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.group`
+========================
+
+Several Crickits driven as one, possibly on more than one I2C bus.
+
+Devices are addressed by board and terminal, as ``group[board, terminal]``. Changes made
+inside `CrickitGroup.batch` are held, then sent bus by bus: the boards on one bus are
+flushed one after another, while separate buses are flushed at the same time, each by its
+own worker thread. An update of N boards on M buses takes about as long as the busiest
+bus, instead of the sum of all boards. Without ``threading``, as on CircuitPython, the
+buses are flushed one after another.
+
+.. code-block:: python
+
+  import board
+  from adafruit_crickit.group import CrickitGroup
+
+  group = CrickitGroup(((board.I2C(), 0x49), (board.I2C(), 0x4A)))
+  with group.batch():
+      group[0, "servo_1"].angle = 90
+      group[1, "servo_1"].angle = 90
+"""
+
+from adafruit_crickit import Crickit, _load
+
+try:
+    import threading
+except ImportError:
+    threading = None
+
+try:
+    from typing import Any, Callable, Iterable, Optional, Tuple, Union
+
+    from busio import I2C
+except ImportError:
+    pass
+
+
+def _flush(batches: list) -> None:
+    # Exit every batch even if an earlier board fails, so none is left open.
+    first_error = None
+    for batch in batches:
+        try:
+            batch.__exit__(None, None, None)
+        except Exception as error:
+            if first_error is None:
+                first_error = error
+    if first_error is not None:
+        raise first_error
+
+
+class _BusWorker:
+    """A thread that runs the flushes of one bus when asked to."""
+
+    def __init__(self):
+        self._go = threading.Lock()
+        self._go.acquire()
+        self._done = threading.Lock()
+        self._done.acquire()
+        self._job = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._go.acquire()
+            job = self._job
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as error:
+                self._error = error
+            self._done.release()
+
+    def start(self, job: Callable) -> None:
+        self._job = job
+        self._go.release()
+
+    def wait(self) -> "Optional[Exception]":
+        self._done.acquire()
+        error = self._error
+        self._error = None
+        return error
+
+    def stop(self) -> None:
+        self._job = None
+        self._go.release()
+        self._thread.join()
+
+
+class _GroupBatch:
+    """Context manager returned by `CrickitGroup.batch`."""
+
+    def __init__(self, group: "CrickitGroup"):
+        self._group = group
+
+    def __enter__(self) -> "CrickitGroup":
+        group = self._group
+        for batch in group._batches:
+            batch.__enter__()
+        return group
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._group._dispatch()
+
+
+class CrickitGroup:
+    """Several Crickits, grouped by the I2C bus they are on.
+
+    :param boards: Each board is either a `adafruit_crickit.Crickit`, or an
+      ``(i2c, address)`` tuple to create one from.
+    """
+
+    def __init__(self, boards: "Iterable[Union[Crickit, Tuple[I2C, int]]]"):
+        crickits = []
+        buses = {}
+        for board in boards:
+            crickit = board
+            if not isinstance(board, Crickit):
+                i2c, address = board
+                crickit = Crickit(_load("adafruit_seesaw.seesaw", "Seesaw")(i2c, address))
+            crickits.append(crickit)
+            buses.setdefault(id(crickit.seesaw.i2c_device.i2c), []).append(crickit.batch())
+        self._crickits = tuple(crickits)
+        # The batch of every board, and the same batches grouped by bus.
+        self._batches = tuple(batches for bus in buses.values() for batches in bus)
+        self._buses = tuple(tuple(batches) for batches in buses.values())
+        self._workers = None
+
+    def __len__(self) -> int:
+        return len(self._crickits)
+
+    def __iter__(self):
+        return iter(self._crickits)
+
+    def __getitem__(self, key: "Union[int, Tuple[int, str]]") -> "Any":
+        """``group[board]`` is the `adafruit_crickit.Crickit` at index ``board``, and
+        ``group[board, terminal]`` is its device named ``terminal``, such as ``"servo_1"``.
+        """
+        if isinstance(key, tuple):
+            board, terminal = key
+            return getattr(self._crickits[board], terminal)
+        return self._crickits[key]
+
+    @property
+    def bus_count(self) -> int:
+        """The number of I2C buses the boards are on."""
+        return len(self._buses)
+
+    def batch(self) -> _GroupBatch:
+        """Collect PWM changes on every board, then send them with the buses working in
+        parallel. See `adafruit_crickit.Crickit.batch`.
+
+        .. code-block:: python
+
+          with group.batch():
+              for board in range(len(group)):
+                  group[board, "drive_1"].fraction = 0.5
+        """
+        return _GroupBatch(self)
+
+    def _dispatch(self) -> None:
+        jobs = self._buses
+        if not jobs:
+            return
+        if threading is None or len(jobs) == 1:
+            for job in jobs:
+                _flush(job)
+            return
+        workers = self._workers
+        if workers is None:
+            # The calling thread flushes the last bus itself.
+            workers = self._workers = [_BusWorker() for _ in range(len(jobs) - 1)]
+        for worker, job in zip(workers, jobs):
+            worker.start(lambda job=job: _flush(job))
+        try:
+            _flush(jobs[-1])
+        finally:
+            errors = [worker.wait() for worker in workers]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def deinit(self) -> None:
+        """Stop the worker threads. A later `batch` starts them again."""
+        if self._workers:
+            for worker in self._workers:
+                worker.stop()
+        self._workers = None
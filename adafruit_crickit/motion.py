@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.motion`
+==========================
+
+Trapezoidal motion profiles for the Crickit stepper motors.
+
+`StepperMotion` moves a stepper to a target position, ramping up to a maximum speed at a
+fixed acceleration and back down again. The acceleration ramp is computed once per move,
+so each step only costs a table lookup, a time check and the ``onestep()`` call.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.motion import StepperMotion
+
+  motion = StepperMotion(crickit.stepper_motor)
+  motion.move_to(400, max_speed=200, acceleration=400)
+  print(motion.achieved_rate, "of", motion.planned_rate, "steps/sec")
+"""
+
+import math
+import time
+from array import array
+
+from adafruit_motor import stepper
+
+try:
+    from adafruit_motor.stepper import StepperMotor
+except ImportError:
+    pass
+
+
+class StepperMotion:
+    """Moves a ``StepperMotor`` along trapezoidal speed profiles and tracks its position.
+
+    Use `move_to` to block until a move is done, or `start` and then call `update`
+    from your main loop to step while doing other work.
+
+    :param ~adafruit_motor.stepper.StepperMotor motor: The motor, such as
+      ``crickit.stepper_motor`` or ``crickit.drive_stepper_motor``.
+    :param int style: Step style used for every step, such as ``stepper.DOUBLE``.
+      `position` is counted in steps of this style.
+    """
+
+    def __init__(self, motor: "StepperMotor", *, style: int = stepper.SINGLE):
+        self._motor = motor
+        self._style = style
+        self.position = 0
+        """Current position in steps. May be assigned to re-zero the motor."""
+        self._ramp = array("f")
+        self._direction = stepper.FORWARD
+        self._steps = 0
+        self._done = 0
+        self._ramp_steps = 0
+        self._ramp_time = 0.0
+        self._cruise_speed = 1.0
+        self._total_time = 0.0
+        self._start_time = 0.0
+        self._end_time = 0.0
+
+    def start(self, target: int, max_speed: float, acceleration: float) -> None:
+        """Plan a move to ``target`` and start it. Call `update` to perform the steps.
+
+        :param int target: Position to move to, in steps.
+        :param float max_speed: Top speed, in steps per second.
+        :param float acceleration: Acceleration and deceleration, in steps per second squared.
+        """
+        if max_speed <= 0 or acceleration <= 0:
+            raise ValueError("max_speed and acceleration must be positive")
+        steps = target - self.position
+        self._direction = stepper.FORWARD
+        if steps < 0:
+            self._direction = stepper.BACKWARD
+            steps = -steps
+
+        ramp_steps = min(int(max_speed * max_speed / (2 * acceleration)), steps // 2)
+        # Time at which each ramp step is taken, from s = a * t**2 / 2.
+        self._ramp = array("f", (math.sqrt(2 * (i + 1) / acceleration) for i in range(ramp_steps)))
+        if ramp_steps:
+            self._ramp_time = self._ramp[-1]
+            self._cruise_speed = acceleration * self._ramp_time
+        else:
+            self._ramp_time = 0.0
+            self._cruise_speed = min(max_speed, math.sqrt(2 * acceleration))
+        self._ramp_steps = ramp_steps
+        self._steps = steps
+        self._done = 0
+        self._total_time = 2 * self._ramp_time + (steps - 2 * ramp_steps) / self._cruise_speed
+        self._start_time = time.monotonic()
+        self._end_time = self._start_time
+
+    def _step_time(self, step: int) -> float:
+        # Time after the start of the move at which step number ``step`` (from 1) is due.
+        ramp_steps = self._ramp_steps
+        if step <= ramp_steps:
+            return self._ramp[step - 1]
+        remaining = self._steps - step
+        if remaining < ramp_steps:
+            if not remaining:
+                return self._total_time
+            return self._total_time - self._ramp[remaining - 1]
+        return self._ramp_time + (step - ramp_steps) / self._cruise_speed
+
+    def update(self) -> bool:
+        """Take every step that is due. Returns ``True`` while the move is still in progress.
+        Call this as often as possible; the step rate is limited by how often it is called.
+        """
+        steps = self._steps
+        done = self._done
+        if done >= steps:
+            return False
+        now = time.monotonic() - self._start_time
+        onestep = self._motor.onestep
+        direction = self._direction
+        delta = 1 if direction == stepper.FORWARD else -1
+        while done < steps and self._step_time(done + 1) <= now:
+            onestep(direction=direction, style=self._style)
+            done += 1
+            self.position += delta
+        self._done = done
+        if done >= steps:
+            self._end_time = time.monotonic()
+            return False
+        return True
+
+    def move_to(self, target: int, max_speed: float, acceleration: float) -> None:
+        """Move to ``target`` and return when the move is finished.
+        Takes the same arguments as `start`.
+        """
+        self.start(target, max_speed, acceleration)
+        while self.update():
+            delay = self._start_time + self._step_time(self._done + 1) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def stop(self) -> None:
+        """Abandon the current move immediately. `position` stays accurate."""
+        self._steps = self._done
+        self._end_time = time.monotonic()
+
+    @property
+    def moving(self) -> bool:
+        """``True`` while a move has steps left to take."""
+        return self._done < self._steps
+
+    @property
+    def planned_rate(self) -> float:
+        """Average speed of the planned move, in steps per second."""
+        if not self._total_time:
+            return 0.0
+        return self._steps / self._total_time
+
+    @property
+    def achieved_rate(self) -> float:
+        """Average speed actually achieved so far in the current or last move,
+        in steps per second. Lower than `planned_rate` when steps could not be sent
+        fast enough.
+        """
+        end = self._end_time if not self.moving else time.monotonic()
+        elapsed = end - self._start_time
+        if elapsed <= 0:
+            return 0.0
+        return self._done / elapsed
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.profiler`
+===========================
+
+Counts and times the seesaw I2C traffic of a Crickit. Use it through
+`adafruit_crickit.Crickit.enable_stats` and `adafruit_crickit.Crickit.stats`.
+
+The profiler hooks in by replacing the ``read`` and ``write`` methods of the ``Seesaw``
+object itself, and removes those replacements when disabled, so a Crickit that is
+not being profiled runs exactly the code it would without this module.
+"""
+
+import time
+from array import array
+
+from micropython import const
+
+try:
+    from typing import Dict, Optional, Union
+
+    from adafruit_seesaw.seesaw import Seesaw
+except ImportError:
+    pass
+
+_STATUS_BASE = const(0x00)
+_GPIO_BASE = const(0x01)
+_TIMER_BASE = const(0x08)
+_ADC_BASE = const(0x09)
+_NEOPIXEL_BASE = const(0x0E)
+_TOUCH_BASE = const(0x0F)
+
+_ADC_CHANNEL_OFFSET = const(0x07)
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+
+# Names for traffic that is not tied to one terminal.
+_LABELS = {
+    _STATUS_BASE: "status",
+    _GPIO_BASE: "gpio",
+    _NEOPIXEL_BASE: "neopixel",
+}
+_DEVICE_TYPES = {
+    "status": "Seesaw",
+    "gpio": "GPIO",
+    "neopixel": "NeoPixel",
+}
+
+# Indexes into the per-key counter lists.
+_COUNT = const(0)
+_BYTES = const(1)
+_TIME = const(2)
+_MAX = const(3)
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1e9
+
+
+class BusProfiler:
+    """Records count, bytes and latency of every seesaw operation, by terminal.
+    A register read, including its request and settling delay, counts as one operation.
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The seesaw to profile.
+    :param int history: How many of the latest operations to keep latencies of,
+      for percentiles.
+    """
+
+    def __init__(self, seesaw: "Seesaw", history: int = 256):
+        self._seesaw = seesaw
+        self._latencies = array("L", [0] * history)
+        self._latency_keys = [None] * history
+        self._latency_index = 0
+        self._latency_count = 0
+        self._reading = False
+        self.reset()
+
+    def install(self) -> None:
+        """Start recording."""
+        self._seesaw.write = self._write
+        self._seesaw.read = self._read
+
+    def uninstall(self) -> None:
+        """Stop recording, and restore the seesaw's own ``read`` and ``write``."""
+        del self._seesaw.write
+        del self._seesaw.read
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self._counters = {}
+        self._latency_index = 0
+        self._latency_count = 0
+        self._start = time.monotonic_ns()
+
+    def _key(self, reg_base: int, reg: int, buf: Optional[bytes]) -> Union[int, str]:
+        pin_mapping = self._seesaw.pin_mapping
+        if reg_base == _TIMER_BASE and buf:
+            return pin_mapping.pwm_pins[buf[0]]
+        if reg_base == _TOUCH_BASE:
+            return pin_mapping.touch_pins[reg - _TOUCH_CHANNEL_OFFSET]
+        if reg_base == _ADC_BASE:
+            return pin_mapping.analog_pins[reg - _ADC_CHANNEL_OFFSET]
+        return _LABELS.get(reg_base, "other")
+
+    def _record(self, key: Union[int, str], size: int, start: int) -> None:
+        elapsed = time.monotonic_ns() - start
+        counters = self._counters.get(key, None)
+        if counters is None:
+            counters = self._counters[key] = [0, 0, 0, 0]
+        counters[_COUNT] += 1
+        counters[_BYTES] += size
+        counters[_TIME] += elapsed
+        counters[_MAX] = max(counters[_MAX], elapsed)
+        index = self._latency_index
+        self._latencies[index] = min(elapsed, 0xFFFFFFFF)
+        self._latency_keys[index] = key
+        self._latency_index = (index + 1) % len(self._latencies)
+        self._latency_count += 1
+
+    def _write(self, reg_base: int, reg: int, buf: Optional[bytes] = None) -> None:
+        if self._reading:
+            # The register request of a read; recorded as part of the read.
+            type(self._seesaw).write(self._seesaw, reg_base, reg, buf)
+            return
+        start = time.monotonic_ns()
+        type(self._seesaw).write(self._seesaw, reg_base, reg, buf)
+        self._record(self._key(reg_base, reg, buf), 2 + (len(buf) if buf else 0), start)
+
+    def _read(self, reg_base: int, reg: int, buf: bytearray, delay: float = 0.008) -> None:
+        start = time.monotonic_ns()
+        self._reading = True
+        try:
+            type(self._seesaw).read(self._seesaw, reg_base, reg, buf, delay)
+        finally:
+            self._reading = False
+        self._record(self._key(reg_base, reg, None), 2 + len(buf), start)
+
+    def summary(self, device_types: Dict[int, str]) -> dict:
+        """Summarize what has been recorded. ``device_types`` maps seesaw pins to the
+        name of the device type using them. See `adafruit_crickit.Crickit.stats` for
+        the layout of the result.
+        """
+        elapsed = (time.monotonic_ns() - self._start) / 1e9
+        recent = min(self._latency_count, len(self._latencies))
+        latencies = {}
+        for i in range(recent):
+            latencies.setdefault(self._latency_keys[i], []).append(self._latencies[i])
+
+        terminals = {}
+        devices = {}
+        total_count = 0
+        total_bytes = 0
+        total_time = 0
+        for key, (count, size, duration, longest) in self._counters.items():
+            entry = {
+                "count": count,
+                "bytes": size,
+                "time": duration / 1e9,
+                "max": longest / 1e9,
+            }
+            ordered = sorted(latencies.get(key, ()))
+            if ordered:
+                entry["p50"] = _percentile(ordered, 0.5)
+                entry["p90"] = _percentile(ordered, 0.9)
+                entry["p99"] = _percentile(ordered, 0.99)
+            terminals[key] = entry
+
+            device_type = device_types.get(key, None) or _DEVICE_TYPES.get(key, "seesaw")
+            device = devices.setdefault(device_type, {"count": 0, "bytes": 0, "time": 0.0})
+            device["count"] += count
+            device["bytes"] += size
+            device["time"] += duration / 1e9
+
+            total_count += count
+            total_bytes += size
+            total_time += duration
+
+        return {
+            "elapsed": elapsed,
+            "count": total_count,
+            "bytes": total_bytes,
+            "time": total_time / 1e9,
+            "bytes_per_second": total_bytes / elapsed if elapsed else 0.0,
+            "terminals": terminals,
+            "devices": devices,
+        }
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.realtime`
+===========================
+
+PWM writes that allocate no memory, for control loops that cannot afford garbage
+collection pauses. Use it through `adafruit_crickit.Crickit.enable_realtime`.
+
+``Seesaw.analog_write`` builds two new buffers for every write, and
+`adafruit_crickit.Crickit.batch` collects changes in a ``dict`` that is emptied after
+every flush. In a tight loop on CircuitPython, that garbage soon triggers a collection,
+which stalls the loop for several milliseconds. `RealtimePWM` instead keeps one staging
+slot per PWM terminal and a single write buffer, all allocated up front, and writes the
+buffer to the I2C device itself.
+"""
+
+import time
+
+from adafruit_seesaw.seesaw import Seesaw
+from micropython import const
+
+from adafruit_crickit import _TIMER_GROUPS
+
+try:
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+_TIMER_BASE = const(0x08)
+_TIMER_PWM = const(0x01)
+_SAMD09_HW_ID_CODE = const(0x55)
+
+# The settling delay Seesaw.analog_write waits after a write.
+_SETTLE = 0.001
+
+
+class RealtimePWM:
+    """Stages and sends PWM duty cycles for every PWM terminal of a Crickit without
+    allocating. Duty cycles are only sent when they differ from the last one sent,
+    through the Crickit's `adafruit_crickit.PWMCache`.
+
+    While stats or recording are enabled, or when the seesaw is not a plain ``Seesaw``
+    (such as a `adafruit_crickit.simulator.FakeSeesaw`), writes go through the seesaw's
+    own ``write`` so they are still seen, using a preallocated view of the same buffer.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit to write to.
+    """
+
+    def __init__(self, crickit: "Crickit"):
+        seesaw = crickit.seesaw
+        self._crickit = crickit
+        self._seesaw = seesaw
+        self._i2c_device = seesaw.i2c_device
+        self._direct = type(seesaw).write is Seesaw.write
+        self._pins = tuple(pin for pins in _TIMER_GROUPS for pin in pins)
+        size = max(self._pins) + 1
+        # Indexed by seesaw pin: the PWM channel, the staged duty cycle and whether
+        # one is staged.
+        self._channels = bytearray(size)
+        pwm_pins = seesaw.pin_mapping.pwm_pins
+        for pin in self._pins:
+            if seesaw.chip_id == _SAMD09_HW_ID_CODE:
+                self._channels[pin] = pwm_pins.index(pin)
+            else:
+                self._channels[pin] = pin
+        self._staged = [0] * size
+        self._is_staged = bytearray(size)
+        self._staged_count = 0
+        # Register address, channel and duty cycle, as sent on the bus.
+        self._buffer = bytearray((_TIMER_BASE, _TIMER_PWM, 0, 0, 0))
+        self._data = memoryview(self._buffer)[2:]
+
+    def stage(self, pin: int, value: int) -> None:
+        """Stage ``value`` as the next duty cycle of ``pin``, replacing any staged before."""
+        if not self._is_staged[pin]:
+            self._is_staged[pin] = 1
+            self._staged_count += 1
+        self._staged[pin] = value
+
+    def discard(self) -> None:
+        """Drop every staged duty cycle without sending it."""
+        is_staged = self._is_staged
+        for pin in self._pins:
+            is_staged[pin] = 0
+        self._staged_count = 0
+
+    def flush(self) -> None:
+        """Send every staged duty cycle that differs from the last one sent, back to back,
+        then wait once for the seesaw to settle.
+        """
+        if not self._staged_count:
+            return
+        self._staged_count = 0
+        crickit = self._crickit
+        direct = self._direct and crickit._profiler is None and crickit._recorder is None
+        cache = crickit.pwm_cache
+        duty_cycles = cache.duty_cycles
+        staged = self._staged
+        is_staged = self._is_staged
+        sent = False
+        for pin in self._pins:
+            if not is_staged[pin]:
+                continue
+            is_staged[pin] = 0
+            value = staged[pin]
+            if duty_cycles.get(pin) == value:
+                cache.hits += 1
+                continue
+            cache.misses += 1
+            self._send(pin, value, direct)
+            duty_cycles[pin] = value
+            sent = True
+        if sent:
+            time.sleep(_SETTLE)
+
+    def _send(self, pin: int, value: int, direct: bool) -> None:
+        buffer = self._buffer
+        buffer[2] = self._channels[pin]
+        buffer[3] = value >> 8
+        buffer[4] = value & 0xFF
+        if not direct:
+            self._seesaw.write(_TIMER_BASE, _TIMER_PWM, self._data)
+            return
+        drdy = self._seesaw._drdy
+        if drdy is not None:
+            while drdy.value is False:
+                pass
+        with self._i2c_device as i2c:
+            i2c.write(buffer)
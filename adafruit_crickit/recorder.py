@@ -0,0 +1,342 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.recorder`
+===========================
+
+Records the seesaw I2C traffic of a Crickit into a fixed size ring buffer, and analyzes
+or replays the recordings on a host computer. Use it through
+`adafruit_crickit.Crickit.enable_recording` and `adafruit_crickit.Crickit.save_recording`.
+
+Each operation takes one 16 byte record: when it started and how long it took, whether
+it was a read or a write, the register, the terminal, the length of the data and its
+first five bytes. The buffer is allocated once, and recording an operation only stores
+into it, so the recorder allocates no memory of its own as it runs. On CircuitPython,
+times come from ``supervisor.ticks_ms()``, which returns a small integer, so they are
+kept in milliseconds; elsewhere they are kept in microseconds.
+
+`Recording` loads a saved recording, summarizes it, and replays it against a seesaw,
+such as a `adafruit_crickit.simulator.FakeSeesaw`.
+"""
+
+import time
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    from typing import BinaryIO, Dict, Optional, Union
+
+    from adafruit_seesaw.seesaw import Seesaw
+except ImportError:
+    pass
+
+
+_GPIO_BASE = const(0x01)
+_TIMER_BASE = const(0x08)
+_ADC_BASE = const(0x09)
+_NEOPIXEL_BASE = const(0x0E)
+_TOUCH_BASE = const(0x0F)
+
+_ADC_CHANNEL_OFFSET = const(0x07)
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+
+_MAGIC = b"CRKR"
+_VERSION = const(1)
+
+# Clock the times of a recording were taken from.
+_CLOCK_US = const(0)  # time.monotonic_ns() // 1000, wrapping at 32 bits.
+_CLOCK_MS = const(1)  # supervisor.ticks_ms(), wrapping at 29 bits.
+# Microseconds per tick, and the period the ticks wrap at, in microseconds, per clock.
+_CLOCK_UNITS = (1, 1000)
+_CLOCK_PERIODS = (1 << 32, 1000 << 29)
+
+# Record layout: time (4), duration (2), register base, register, terminal, flags,
+# data length, then up to five bytes of data.
+_RECORD_SIZE = const(16)
+_PAYLOAD_SIZE = const(5)
+_FLAG_READ = const(0x01)
+_NO_TERMINAL = const(0xFF)
+
+BusRecord = namedtuple(
+    "BusRecord",
+    ("time", "duration", "read", "reg_base", "reg", "terminal", "length", "payload"),
+)
+"""One recorded seesaw operation. ``time`` and ``duration`` are in microseconds, with
+millisecond resolution for recordings made on CircuitPython;
+``terminal`` is a seesaw pin, or ``None`` for traffic not tied to one terminal;
+``payload`` holds at most the first five bytes of the ``length`` bytes transferred.
+"""
+
+
+try:
+    from supervisor import ticks_ms as _ticks
+
+    _CLOCK = _CLOCK_MS
+    _TICKS_MASK = 0x1FFFFFFF
+except ImportError:
+
+    def _ticks() -> int:
+        return time.monotonic_ns() // 1000
+
+    _CLOCK = _CLOCK_US
+    _TICKS_MASK = 0xFFFFFFFF
+
+
+class BusRecorder:
+    """Records every seesaw operation into a ring buffer that keeps the latest
+    ``records`` operations. A register read, including its request, is one operation.
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The seesaw to record.
+    :param int records: How many operations to keep.
+    """
+
+    def __init__(self, seesaw: "Seesaw", records: int = 256):
+        self._seesaw = seesaw
+        self._buffer = bytearray(_RECORD_SIZE * records)
+        self._records = records
+        self._index = 0
+        self._count = 0
+        self._reading = False
+
+    def __len__(self) -> int:
+        return min(self._count, self._records)
+
+    def install(self) -> None:
+        """Start recording."""
+        self._seesaw.write = self._write
+        self._seesaw.read = self._read
+
+    def uninstall(self) -> None:
+        """Stop recording, and restore the seesaw's own ``read`` and ``write``."""
+        del self._seesaw.write
+        del self._seesaw.read
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self._index = 0
+        self._count = 0
+
+    def _terminal(self, reg_base: int, reg: int, buf: "Optional[bytes]") -> int:
+        pin_mapping = self._seesaw.pin_mapping
+        if reg_base == _TIMER_BASE and buf:
+            return pin_mapping.pwm_pins[buf[0]]
+        if reg_base == _TOUCH_BASE:
+            return pin_mapping.touch_pins[reg - _TOUCH_CHANNEL_OFFSET]
+        if reg_base == _ADC_BASE:
+            return pin_mapping.analog_pins[reg - _ADC_CHANNEL_OFFSET]
+        return _NO_TERMINAL
+
+    def _record(
+        self,
+        start: int,
+        flags: int,
+        reg_base: int,
+        reg: int,
+        terminal: int,
+        buf: "Optional[bytes]",
+    ) -> None:
+        duration = min((_ticks() - start) & _TICKS_MASK, 0xFFFF)
+        buffer = self._buffer
+        offset = self._index * _RECORD_SIZE
+        buffer[offset] = start & 0xFF
+        buffer[offset + 1] = (start >> 8) & 0xFF
+        buffer[offset + 2] = (start >> 16) & 0xFF
+        buffer[offset + 3] = (start >> 24) & 0xFF
+        buffer[offset + 4] = duration & 0xFF
+        buffer[offset + 5] = duration >> 8
+        buffer[offset + 6] = reg_base
+        buffer[offset + 7] = reg
+        buffer[offset + 8] = terminal
+        buffer[offset + 9] = flags
+        length = len(buf) if buf else 0
+        buffer[offset + 10] = min(length, 0xFF)
+        for i in range(min(length, _PAYLOAD_SIZE)):
+            buffer[offset + 11 + i] = buf[i]
+        self._index = (self._index + 1) % self._records
+        self._count += 1
+
+    def _write(self, reg_base: int, reg: int, buf: "Optional[bytes]" = None) -> None:
+        if self._reading:
+            # The register request of a read; recorded as part of the read.
+            type(self._seesaw).write(self._seesaw, reg_base, reg, buf)
+            return
+        start = _ticks()
+        type(self._seesaw).write(self._seesaw, reg_base, reg, buf)
+        self._record(start, 0, reg_base, reg, self._terminal(reg_base, reg, buf), buf)
+
+    def _read(self, reg_base: int, reg: int, buf: bytearray, delay: float = 0.008) -> None:
+        start = _ticks()
+        self._reading = True
+        try:
+            type(self._seesaw).read(self._seesaw, reg_base, reg, buf, delay)
+        finally:
+            self._reading = False
+        self._record(start, _FLAG_READ, reg_base, reg, self._terminal(reg_base, reg, None), buf)
+
+    def save(self, stream: "BinaryIO", device_types: "Dict[int, str]") -> None:
+        """Write the recorded operations, oldest first, to a binary ``stream``.
+        ``device_types`` maps seesaw pins to the name of the device type using them,
+        and is saved with the recording.
+        """
+        pins = [pin for pin in device_types if isinstance(pin, int)]
+        stream.write(_MAGIC)
+        stream.write(bytes((_VERSION, _RECORD_SIZE, len(pins), _CLOCK)))
+        for pin in pins:
+            name = device_types[pin].encode()
+            stream.write(bytes((pin, len(name))))
+            stream.write(name)
+        count = len(self)
+        stream.write(count.to_bytes(4, "little"))
+        view = memoryview(self._buffer)
+        if self._count > self._records:
+            stream.write(view[self._index * _RECORD_SIZE :])
+        stream.write(view[: self._index * _RECORD_SIZE])
+
+
+def _label(record: BusRecord) -> "Union[int, str]":
+    if record.terminal is not None:
+        return record.terminal
+    if record.reg_base == _NEOPIXEL_BASE:
+        return "neopixel"
+    if record.reg_base == _GPIO_BASE:
+        return "gpio"
+    return "other"
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Recording:
+    """A recording saved by `BusRecorder.save`, loaded for analysis on a host computer.
+
+    :param stream: A binary stream to read the recording from.
+    """
+
+    def __init__(self, stream: "BinaryIO"):
+        if stream.read(4) != _MAGIC:
+            raise ValueError("Not a Crickit bus recording")
+        version, record_size, pin_count = stream.read(3)
+        if version != _VERSION or record_size != _RECORD_SIZE:
+            raise ValueError("Unsupported recording version")
+        clock = stream.read(1)[0]
+        unit = _CLOCK_UNITS[clock]
+        # Timestamps wrap at this many microseconds.
+        self._period = _CLOCK_PERIODS[clock]
+        self.device_types = {}
+        """Name of the device type using each seesaw pin, when the recording was saved."""
+        for _ in range(pin_count):
+            pin, length = stream.read(2)
+            self.device_types[pin] = stream.read(length).decode()
+        count = int.from_bytes(stream.read(4), "little")
+        data = stream.read(count * _RECORD_SIZE)
+        self.records = []
+        """The `BusRecord` of every operation, oldest first."""
+        for i in range(count):
+            record = data[i * _RECORD_SIZE : (i + 1) * _RECORD_SIZE]
+            length = record[10]
+            self.records.append(
+                BusRecord(
+                    int.from_bytes(record[0:4], "little") * unit,
+                    int.from_bytes(record[4:6], "little") * unit,
+                    bool(record[9] & _FLAG_READ),
+                    record[6],
+                    record[7],
+                    None if record[8] == _NO_TERMINAL else record[8],
+                    length,
+                    bytes(record[11 : 11 + min(length, _PAYLOAD_SIZE)]),
+                )
+            )
+
+    def summary(self) -> dict:
+        """Summarize the recording. Returns a ``dict`` with the ``count`` of operations,
+        ``bytes`` transferred, the ``elapsed`` time the recording spans and the ``busy``
+        time spent in operations, in seconds, ``operations_per_second`` and
+        ``bytes_per_second``. ``terminals`` gives, for each terminal (or ``"gpio"``,
+        ``"neopixel"``, ``"other"``), its ``device`` type, ``writes``, ``redundant``
+        writes that repeated the previous write to the same register unchanged, and the
+        ``interval`` and ``jitter`` (standard deviation) between writes, in seconds.
+        """
+        records = self.records
+        if not records:
+            return {"count": 0, "bytes": 0, "elapsed": 0.0, "busy": 0.0, "terminals": {}}
+        first = records[0].time
+        # Unwrap the timestamps relative to the first record.
+        times = [(record.time - first) % self._period for record in records]
+        elapsed = (times[-1] + records[-1].duration) / 1e6
+        total_bytes = sum(2 + record.length for record in records)
+        busy = sum(record.duration for record in records) / 1e6
+
+        terminals = {}
+        last_payloads = {}
+        last_times = {}
+        intervals = {}
+        for record, at in zip(records, times):
+            label = _label(record)
+            entry = terminals.get(label, None)
+            if entry is None:
+                entry = terminals[label] = {
+                    "device": self.device_types.get(label, None),
+                    "writes": 0,
+                    "reads": 0,
+                    "redundant": 0,
+                }
+            if record.read:
+                entry["reads"] += 1
+                continue
+            entry["writes"] += 1
+            key = (record.reg_base, record.reg, label)
+            payload = (record.length, record.payload)
+            if last_payloads.get(key, None) == payload and record.length <= _PAYLOAD_SIZE:
+                entry["redundant"] += 1
+            last_payloads[key] = payload
+            if label in last_times:
+                intervals.setdefault(label, []).append((at - last_times[label]) / 1e6)
+            last_times[label] = at
+
+        for label, values in intervals.items():
+            mean = sum(values) / len(values)
+            ordered = sorted(values)
+            terminals[label]["interval"] = mean
+            terminals[label]["jitter"] = (
+                sum((value - mean) ** 2 for value in values) / len(values)
+            ) ** 0.5
+            terminals[label]["max_interval"] = ordered[-1]
+            terminals[label]["p99_interval"] = _percentile(ordered, 0.99)
+
+        return {
+            "count": len(records),
+            "bytes": total_bytes,
+            "elapsed": elapsed,
+            "busy": busy,
+            "operations_per_second": len(records) / elapsed if elapsed else 0.0,
+            "bytes_per_second": total_bytes / elapsed if elapsed else 0.0,
+            "terminals": terminals,
+        }
+
+    def replay(self, seesaw: "Seesaw", *, timing: bool = False) -> float:
+        """Send the recorded operations to ``seesaw`` again, and return the seconds it
+        took. Writes of more than five bytes were only partly recorded, so they are
+        skipped. Reads are repeated, and their results discarded.
+
+        :param bool timing: Wait between operations as long as they were apart when
+          recorded. Otherwise operations are sent back to back.
+        """
+        records = self.records
+        if not records:
+            return 0.0
+        first = records[0].time
+        start = time.monotonic()
+        for record in records:
+            if timing:
+                delay = start + ((record.time - first) % self._period) / 1e6 - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            if record.read:
+                seesaw.read(record.reg_base, record.reg, bytearray(record.length), 0)
+            elif record.length <= _PAYLOAD_SIZE:
+                seesaw.write(record.reg_base, record.reg, record.payload or None)
+        return time.monotonic() - start
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.safety`
+=========================
+
+Stops the Crickit actuators when the control loop stops feeding the watchdog. Use it
+through `adafruit_crickit.Crickit.enable_watchdog`.
+
+When `SafetyWatchdog.feed` has not been called for ``timeout`` seconds, every device
+the Crickit has created is put in its safe state in one batch, so the whole board is
+made safe with one flush: DC motors coast or brake, drives turn off, steppers release
+their coils, continuous servos stop, and positional servos hold or release.
+
+The seesaw has no timer that could do this on its own, so the watchdog is checked on
+the host. Where ``threading`` is available, as on Blinka hosts, a thread checks it, and
+catches a loop that hangs. The thread and the loop then share a lock around PWM writes,
+so the safe state is sent whole, and not mixed with writes from the loop. Otherwise, as
+on CircuitPython, it is checked by `feed` and
+`check`; pass ``hardware=True`` to also run the microcontroller's watchdog, which raises
+``watchdog.WatchDogTimeout`` in a loop that hangs. Using the watchdog as a context
+manager puts the board in its safe state if the loop raises, including that exception.
+
+Once made safe, the board stays safe: writes to servos, motors and drives raise
+ValueError, so a loop that was only late does not restart the motors without noticing.
+Call `SafetyWatchdog.rearm` to take control again. PWM writes staged by realtime mode or
+waiting in the coalescer but not yet sent are dropped, not sent with the safe state.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+
+  crickit.enable_watchdog(timeout=0.5, motors="brake")
+  with crickit.watchdog:
+      while True:
+          if crickit.watchdog.tripped:
+              crickit.watchdog.rearm()
+          crickit.watchdog.feed()
+          crickit.dc_motor_1.throttle = read_joystick()
+"""
+
+import time
+
+try:
+    import threading
+except ImportError:
+    threading = None
+
+try:
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+_MOTOR_STATES = ("coast", "brake")
+_SERVO_STATES = ("hold", "release")
+
+
+class SafetyWatchdog:
+    """Puts the devices of a Crickit in a safe state when not fed in time.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit to watch over.
+    :param float timeout: Seconds without a `feed` before the board is made safe.
+    :param str motors: ``"coast"`` to let DC motors spin down and release steppers, or
+      ``"brake"`` to short DC motors and leave steppers holding their position.
+    :param str servos: ``"hold"`` to keep servos at their angle, or ``"release"`` to
+      stop their pulses. Continuous servos are stopped either way.
+    :param bool hardware: Also run the microcontroller's watchdog, which raises
+      ``watchdog.WatchDogTimeout`` when not fed for ``timeout`` seconds. Only on
+      CircuitPython.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        timeout: float,
+        *,
+        motors: str = "coast",
+        servos: str = "hold",
+        hardware: bool = False,
+    ):
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if motors not in _MOTOR_STATES:
+            raise ValueError(f"motors must be one of {_MOTOR_STATES}")
+        if servos not in _SERVO_STATES:
+            raise ValueError(f"servos must be one of {_SERVO_STATES}")
+        self._crickit = crickit
+        self._timeout = timeout
+        self._brake = motors == "brake"
+        self._release_servos = servos == "release"
+        self._deadline = time.monotonic() + timeout
+        self._hardware = None
+        if hardware:
+            from microcontroller import watchdog  # noqa: PLC0415
+            from watchdog import WatchDogMode  # noqa: PLC0415
+
+            watchdog.timeout = timeout
+            watchdog.mode = WatchDogMode.RAISE
+            self._hardware = watchdog
+        self.tripped = False
+        """``True`` once the board has been made safe, until `rearm` is called."""
+        self.trips = 0
+        """Number of times the board has been made safe."""
+        self.time_to_safe = 0.0
+        """Seconds from the last `feed` until the board was safe, the last time it was
+        made safe. The timeout plus the time to notice and to send the flush."""
+        self.max_time_to_safe = 0.0
+        """Longest `time_to_safe` so far."""
+        self._running = True
+        self._thread = None
+        self._lock = None
+        if threading:
+            self._lock = crickit._thread_safe()
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        # Check a few times per timeout, so a trip comes at most a quarter late.
+        interval = self._timeout / 4
+        while not self._stop.wait(interval):
+            self.check()
+
+    def feed(self) -> None:
+        """Restart the timeout. Call this at least once per ``timeout`` from the control
+        loop. Also makes the board safe if the timeout has already passed. Once the board
+        has been made safe, feeding does not re-arm it; see `rearm`."""
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            if not self.check() and not self.tripped:
+                self._deadline = time.monotonic() + self._timeout
+        finally:
+            if lock is not None:
+                lock.release()
+        if self._hardware is not None:
+            self._hardware.feed()
+
+    def check(self) -> bool:
+        """Make the board safe if the timeout has passed. Returns ``True`` if this call
+        made it safe."""
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            if not self.tripped and self._running and time.monotonic() >= self._deadline:
+                self.trip()
+                return True
+            return False
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def rearm(self) -> None:
+        """Allow writes to the devices again after the board was made safe, and restart
+        the timeout. The devices stay in their safe state until written to."""
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            self._crickit._tripped = False
+            self.tripped = False
+            self._deadline = time.monotonic() + self._timeout
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def trip(self) -> None:
+        """Put every device of the Crickit in its safe state now, with one flush, and
+        refuse writes to them until `rearm` is called."""
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            self._crickit._make_safe(self._brake, self._release_servos)
+            time_to_safe = time.monotonic() - self._deadline + self._timeout
+            self.time_to_safe = time_to_safe
+            self.max_time_to_safe = max(self.max_time_to_safe, time_to_safe)
+            self.tripped = True
+            self.trips += 1
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def deinit(self) -> None:
+        """Stop watching. The board is left as it is, and accepts writes again."""
+        self._running = False
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._hardware is not None:
+            self._hardware.deinit()
+            self._hardware = None
+        self._crickit._tripped = False
+        self.tripped = False
+
+    def __enter__(self) -> "SafetyWatchdog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.trip()
+        self.deinit()
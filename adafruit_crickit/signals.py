@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.signals`
+==========================
+
+Rising and falling edges of the Crickit signal pins, driven by the seesaw's GPIO
+interrupt instead of polling the pins.
+
+`SignalEvents` enables the seesaw interrupt of each watched pin and watches the seesaw
+INT output, wired to a pin of the host. While nothing changes, no I2C traffic is sent at
+all. When INT goes low, the interrupt flags are read, which also clears them, and all the
+pins are read in one bulk GPIO read. A pin whose flag is set but whose level is unchanged
+pulsed and came back between reads, and produces both edges, so short pulses are not
+missed.
+
+Without an INT pin, the interrupt flags are polled instead, one read per poll.
+
+The seesaw only raises interrupts for its port A pins, so Signal 3 and Signal 4, which
+are on port B, cannot be watched.
+
+.. code-block:: python
+
+  import board
+  import digitalio
+  from adafruit_crickit import crickit
+  from adafruit_crickit.signals import SignalEvents
+
+  interrupt = digitalio.DigitalInOut(board.D6)
+  interrupt.pull = digitalio.Pull.UP
+  signals = SignalEvents(crickit, (1, 2), interrupt=interrupt)
+  for event in signals.events():
+      print("Signal", event.signal, "rose" if event.value else "fell")
+"""
+
+import time
+from collections import namedtuple
+
+from micropython import const
+
+try:
+    from typing import Iterator, Optional, Sequence, Tuple
+
+    from digitalio import DigitalInOut
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+_GPIO_BASE = const(0x01)
+_GPIO_BULK = const(0x04)
+_GPIO_INTFLAG = const(0x0A)
+
+# Seesaw pin of each signal terminal, Signal 1 to Signal 8.
+_SIGNAL_PINS = (2, 3, 40, 41, 11, 10, 9, 8)
+
+SignalEvent = namedtuple("SignalEvent", ("signal", "value", "timestamp"))
+"""An edge on a signal pin.
+
+``signal`` is the signal number, 1 to 8; ``value`` is ``True`` for a rising edge and
+``False`` for a falling one; ``timestamp`` is the ``time.monotonic()`` at which the
+interrupt was handled.
+"""
+
+
+class SignalEvents:
+    """Watches Crickit signal pins and turns their changes into `SignalEvent` objects.
+
+    Call `update` from your main loop, or iterate over `events`. Set `on_rise` and
+    `on_fall` to have events delivered to callbacks as well.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the signal pins are on.
+    :param Sequence[int] signals: The signal numbers to watch: 1, 2, 5, 6, 7 or 8.
+    :param ~digitalio.DigitalInOut interrupt: The host pin wired to the seesaw INT
+      output, which is active low and needs a pull up. Any object with a ``value`` will
+      do, such as a `adafruit_crickit.simulator.FakeInterruptPin`. If ``None``, the
+      interrupt flags are polled instead.
+    :param bool pull_up: Turn on the pull up of each watched pin, for switches to ground.
+    :param float poll_interval: Seconds `events` waits between checks, and without an
+      ``interrupt`` pin, the least time between reads of the interrupt flags.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        signals: "Sequence[int]",
+        *,
+        interrupt: "Optional[DigitalInOut]" = None,
+        pull_up: bool = True,
+        poll_interval: float = 0.001,
+    ):
+        mask = 0
+        for signal in signals:
+            if not 1 <= signal <= 8:
+                raise ValueError("Signals are numbered 1 to 8")
+            pin = _SIGNAL_PINS[signal - 1]
+            if pin >= 32:
+                raise ValueError(f"Signal {signal} cannot raise interrupts")
+            mask |= 1 << pin
+        self._seesaw = crickit.seesaw
+        self._signals = tuple(signals)
+        self._bits = tuple(1 << _SIGNAL_PINS[signal - 1] for signal in signals)
+        self._mask = mask
+        self._interrupt = interrupt
+        self._poll_interval = poll_interval
+        self._next_poll = 0.0
+        self._flags = bytearray(4)
+        self._levels = bytearray(8)
+        self.on_rise = None
+        """Called with the `SignalEvent` of every rising edge, if set."""
+        self.on_fall = None
+        """Called with the `SignalEvent` of every falling edge, if set."""
+        self.interrupts = 0
+        """Number of times the flags were read and found an interrupt pending."""
+        self.reads = 0
+        """Number of I2C register reads made since setup."""
+
+        seesaw = self._seesaw
+        seesaw.pin_mode_bulk(mask, seesaw.INPUT_PULLUP if pull_up else seesaw.INPUT)
+        seesaw.set_GPIO_interrupts(mask, True)
+        # Drop flags raised by the setup, and start from the current levels.
+        self._read(_GPIO_INTFLAG, self._flags)
+        self._read(_GPIO_BULK, self._levels)
+        levels = int.from_bytes(self._levels[0:4], "big")
+        self._values = [bool(levels & bit) for bit in self._bits]
+
+    def _read(self, reg: int, buf: bytearray) -> None:
+        self._seesaw.read(_GPIO_BASE, reg, buf)
+        self.reads += 1
+
+    @property
+    def values(self) -> "Tuple[bool, ...]":
+        """The level of each watched signal, as of the last interrupt, in the order of
+        ``signals``."""
+        return tuple(self._values)
+
+    def update(self) -> "Tuple[SignalEvent, ...]":
+        """Handle a pending interrupt, if there is one, and return the events it produced.
+        Returns an empty tuple, without any I2C traffic when there is an ``interrupt``
+        pin, if nothing changed.
+        """
+        now = time.monotonic()
+        if self._interrupt is not None:
+            if self._interrupt.value:
+                return ()
+        elif now < self._next_poll:
+            return ()
+        else:
+            self._next_poll = now + self._poll_interval
+        self._read(_GPIO_INTFLAG, self._flags)
+        flags = int.from_bytes(self._flags, "big") & self._mask
+        if not flags:
+            return ()
+        self.interrupts += 1
+        self._read(_GPIO_BULK, self._levels)
+        # Port A is big-endian in the first four bytes of the bulk read.
+        levels = int.from_bytes(self._levels[0:4], "big")
+        events = []
+        values = self._values
+        for i, bit in enumerate(self._bits):
+            if not flags & bit:
+                continue
+            value = bool(levels & bit)
+            if value == values[i]:
+                # Changed and changed back since the last read: a pulse.
+                self._event(events, self._signals[i], not value, now)
+            self._event(events, self._signals[i], value, now)
+            values[i] = value
+        return tuple(events)
+
+    def _event(self, events: list, signal: int, value: bool, now: float) -> None:
+        event = SignalEvent(signal, value, now)
+        events.append(event)
+        callback = self.on_rise if value else self.on_fall
+        if callback:
+            callback(event)
+
+    def events(self) -> "Iterator[SignalEvent]":
+        """Watch forever, sleeping ``poll_interval`` between checks, and yield each event
+        as it happens."""
+        while True:
+            yield from self.update()
+            time.sleep(self._poll_interval)
+
+    def deinit(self) -> None:
+        """Turn off the interrupts of the watched pins."""
+        self._seesaw.set_GPIO_interrupts(self._mask, False)
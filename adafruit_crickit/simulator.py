@@ -0,0 +1,359 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.simulator`
+============================
+
+A simulated Crickit seesaw, for running `adafruit_crickit.Crickit` code without hardware.
+
+`FakeSeesaw` is a ``Seesaw`` whose register reads and writes are handled in memory
+instead of over I2C. Everything above the register level, including the ``Seesaw``
+helper methods, runs unchanged, so transaction counts match real hardware.
+It models the parts of the Crickit register map that this library uses: PWM duty cycles
+and frequencies, GPIO direction, pulls, levels and interrupts, ADC and touch readings,
+the NeoPixel buffer, and software reset.
+
+.. code-block:: python
+
+  from adafruit_crickit import Crickit
+  from adafruit_crickit.simulator import FakeSeesaw
+
+  seesaw = FakeSeesaw(latency=0.0005)
+  crickit = Crickit(seesaw)
+  crickit.servo_1.angle = 90
+  print(seesaw.transactions, seesaw.duty_cycles)
+
+`FakeInterruptPin` is the host pin wired to the simulated seesaw's INT output.
+"""
+
+import time
+
+from adafruit_bus_device.i2c_device import I2CDevice
+from adafruit_seesaw.crickit import Crickit_Pinmap
+from adafruit_seesaw.seesaw import Seesaw
+from micropython import const
+
+from adafruit_crickit import _TIMER_GROUPS
+
+try:
+    import threading
+except ImportError:
+    threading = None
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+_STATUS_BASE = const(0x00)
+_GPIO_BASE = const(0x01)
+_TIMER_BASE = const(0x08)
+_ADC_BASE = const(0x09)
+_NEOPIXEL_BASE = const(0x0E)
+_TOUCH_BASE = const(0x0F)
+
+_STATUS_HW_ID = const(0x01)
+_STATUS_VERSION = const(0x02)
+_STATUS_OPTIONS = const(0x03)
+_STATUS_TEMP = const(0x04)
+_STATUS_SWRST = const(0x7F)
+
+_GPIO_DIRSET_BULK = const(0x02)
+_GPIO_DIRCLR_BULK = const(0x03)
+_GPIO_BULK = const(0x04)
+_GPIO_BULK_SET = const(0x05)
+_GPIO_BULK_CLR = const(0x06)
+_GPIO_BULK_TOGGLE = const(0x07)
+_GPIO_INTENSET = const(0x08)
+_GPIO_INTENCLR = const(0x09)
+_GPIO_INTFLAG = const(0x0A)
+_GPIO_PULLENSET = const(0x0B)
+_GPIO_PULLENCLR = const(0x0C)
+
+_TIMER_PWM = const(0x01)
+_TIMER_FREQ = const(0x02)
+
+_ADC_CHANNEL_OFFSET = const(0x07)
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+
+_NEOPIXEL_PIN = const(0x01)
+_NEOPIXEL_SPEED = const(0x02)
+_NEOPIXEL_BUF_LENGTH = const(0x03)
+_NEOPIXEL_BUF = const(0x04)
+_NEOPIXEL_SHOW = const(0x05)
+
+_SAMD09_HW_ID_CODE = const(0x55)
+_CRICKIT_PID = const(9999)
+
+
+class FakeI2CBus:
+    """A simulated I2C bus, with the locking API of ``busio.I2C``. Every `FakeSeesaw` on
+    the same bus holds the bus lock for the length of each transaction, so devices sharing
+    a bus take turns, as they would on real hardware.
+
+    :param float latency: Seconds each transaction on this bus takes.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        """Seconds each transaction on this bus takes."""
+        self._lock = threading.Lock() if threading else None
+        self._locked = False
+
+    def try_lock(self) -> bool:
+        """Attempt to grab the bus lock. Returns ``True`` on success."""
+        if self._lock:
+            return self._lock.acquire(False)
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus lock."""
+        if self._lock:
+            self._lock.release()
+        else:
+            self._locked = False
+
+
+class FakeSeesaw(Seesaw):
+    """A Crickit seesaw simulated in memory. Pass it to `adafruit_crickit.Crickit`.
+
+    :param float latency: Seconds each simulated I2C transaction takes. Ignored if
+      ``bus`` is given, since the bus sets the latency.
+    :param FakeI2CBus bus: The bus the seesaw is on. By default it gets a bus of its own.
+    :param int address: The seesaw's I2C address.
+    :param bool honor_delays: Also wait for the settling delay the ``Seesaw`` driver asks
+      for between a register read request and reading the result, as real hardware needs.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        *,
+        bus: Optional[FakeI2CBus] = None,
+        address: int = 0x49,
+        honor_delays: bool = False,
+    ):
+        # Seesaw.__init__ would probe a real I2C bus, so set up its state directly.
+        self._drdy = None
+        if bus is None:
+            bus = FakeI2CBus(latency)
+        self.i2c_device = I2CDevice(bus, address, probe=False)
+        self.chip_id = _SAMD09_HW_ID_CODE
+        self.pin_mapping = Crickit_Pinmap
+        self.honor_delays = honor_delays
+        """Whether register reads also wait for the driver's settling delay."""
+        self.transactions = 0
+        """Number of I2C transactions so far. A register read is two: request and read."""
+        self.bytes_written = 0
+        """Number of bytes written so far, including register addresses."""
+        self.bytes_read = 0
+        """Number of bytes read so far."""
+        self.resets = 0
+        """Number of software resets so far."""
+        self.touch_values = {pin: 300 for pin in Crickit_Pinmap.touch_pins}
+        """Raw reading returned for each touch pin. Assign to simulate touches."""
+        self.analog_values = {pin: 0 for pin in Crickit_Pinmap.analog_pins}
+        """Reading returned for each analog pin, 0-1023."""
+        # Levels of pins driven from outside the board, which a reset does not change.
+        self._input_levels = 0
+        self._driven_inputs = 0
+        self._reset_registers()
+
+    def _reset_registers(self) -> None:
+        self.duty_cycles = {}
+        """Current duty cycle of each PWM pin that has been written."""
+        self.frequencies = {}
+        """Current frequency of each PWM pin that has been written."""
+        self.output_mask = 0
+        """Bitmask of GPIO pins configured as outputs. Port B pins are bits 32-63."""
+        self.pull_mask = 0
+        """Bitmask of GPIO pins with a pull resistor enabled."""
+        self.output_levels = 0
+        """GPIO output register. Also selects pull up (1) or pull down (0) on inputs."""
+        self.interrupt_mask = 0
+        """Bitmask of GPIO pins with interrupts enabled."""
+        self.interrupt_flags = 0
+        """Bitmask of GPIO pins whose input changed since the flags were last read."""
+        self.neopixel_pin = None
+        """Pin the NeoPixel output is attached to."""
+        self.neopixel_buffer = bytearray()
+        """Contents of the NeoPixel buffer."""
+        self.neopixel_shows = 0
+        """Number of times the NeoPixel buffer has been shown."""
+
+    def set_input(self, pin: int, value: Optional[bool]) -> None:
+        """Drive the input ``pin`` externally high (``True``) or low (``False``), or stop
+        driving it (``None``) so it reads its pull resistor or floats low.
+        Sets the pin's interrupt flag if its level changes and its interrupt is enabled.
+        """
+        before = self.gpio_levels
+        bit = 1 << pin
+        if value is None:
+            self._driven_inputs &= ~bit
+        else:
+            self._driven_inputs |= bit
+            if value:
+                self._input_levels |= bit
+            else:
+                self._input_levels &= ~bit
+        changed = (before ^ self.gpio_levels) & self.interrupt_mask
+        self.interrupt_flags |= changed
+
+    @property
+    def gpio_levels(self) -> int:
+        """Current level of every GPIO pin as a bitmask. Outputs read back their output
+        level, undriven inputs read their pull resistor, and floating inputs read low.
+        """
+        outputs = self.output_levels & self.output_mask
+        driven = self._input_levels & self._driven_inputs & ~self.output_mask
+        pulled = self.output_levels & self.pull_mask & ~self._driven_inputs & ~self.output_mask
+        return outputs | driven | pulled
+
+    @property
+    def interrupt_line(self) -> bool:
+        """The level of the seesaw INT output, which is active low."""
+        return not self.interrupt_flags & self.interrupt_mask
+
+    @property
+    def latency(self) -> float:
+        """Seconds each simulated I2C transaction takes. Shared by all devices on the bus."""
+        return self.i2c_device.i2c.latency
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        self.i2c_device.i2c.latency = value
+
+    def _transaction(self) -> None:
+        self.transactions += 1
+        latency = self.i2c_device.i2c.latency
+        if latency:
+            with self.i2c_device:
+                time.sleep(latency)
+
+    def write(self, reg_base: int, reg: int, buf: Optional[bytes] = None) -> None:
+        """Handle a register write as the seesaw firmware would."""
+        self._transaction()
+        self.bytes_written += 2 + (len(buf) if buf else 0)
+        if buf is None:
+            if reg_base == _NEOPIXEL_BASE and reg == _NEOPIXEL_SHOW:
+                self.neopixel_shows += 1
+            return
+        if reg_base == _TIMER_BASE:
+            pin = self.pin_mapping.pwm_pins[buf[0]]
+            value = (buf[1] << 8) | buf[2]
+            if reg == _TIMER_PWM:
+                self.duty_cycles[pin] = value
+            elif reg == _TIMER_FREQ:
+                # Terminals that share a timer change frequency together.
+                for group in _TIMER_GROUPS:
+                    if pin in group:
+                        for shared in group:
+                            self.frequencies[shared] = value
+        elif reg_base == _GPIO_BASE:
+            self._write_gpio(reg, self._mask(buf))
+        elif reg_base == _NEOPIXEL_BASE:
+            self._write_neopixel(reg, buf)
+        elif reg_base == _STATUS_BASE and reg == _STATUS_SWRST:
+            self.resets += 1
+            self._reset_registers()
+
+    @staticmethod
+    def _mask(buf: bytes) -> int:
+        # Big-endian port A in the first four bytes, optional port B in the next four.
+        port_a = int.from_bytes(buf[0:4], "big")
+        port_b = int.from_bytes(buf[4:8], "big") if len(buf) >= 8 else 0
+        return port_a | (port_b << 32)
+
+    def _write_gpio(self, reg: int, mask: int) -> None:
+        before = self.gpio_levels
+        if reg == _GPIO_DIRSET_BULK:
+            self.output_mask |= mask
+        elif reg == _GPIO_DIRCLR_BULK:
+            self.output_mask &= ~mask
+        elif reg == _GPIO_BULK_SET:
+            self.output_levels |= mask
+        elif reg == _GPIO_BULK_CLR:
+            self.output_levels &= ~mask
+        elif reg == _GPIO_BULK_TOGGLE:
+            self.output_levels ^= mask
+        elif reg == _GPIO_PULLENSET:
+            self.pull_mask |= mask
+        elif reg == _GPIO_PULLENCLR:
+            self.pull_mask &= ~mask
+        elif reg == _GPIO_INTENSET:
+            self.interrupt_mask |= mask
+        elif reg == _GPIO_INTENCLR:
+            self.interrupt_mask &= ~mask
+        self.interrupt_flags |= (before ^ self.gpio_levels) & self.interrupt_mask
+
+    def _write_neopixel(self, reg: int, buf: bytes) -> None:
+        if reg == _NEOPIXEL_PIN:
+            self.neopixel_pin = buf[0]
+        elif reg == _NEOPIXEL_BUF_LENGTH:
+            self.neopixel_buffer = bytearray((buf[0] << 8) | buf[1])
+        elif reg == _NEOPIXEL_BUF:
+            offset = (buf[0] << 8) | buf[1]
+            data = buf[2:]
+            end = min(offset + len(data), len(self.neopixel_buffer))
+            self.neopixel_buffer[offset:end] = data[: end - offset]
+
+    def read(self, reg_base: int, reg: int, buf: bytearray, delay: float = 0.008) -> None:
+        """Handle a register read as the seesaw firmware would."""
+        self.write(reg_base, reg)
+        if self.honor_delays:
+            time.sleep(delay)
+        self._transaction()
+        self.bytes_read += len(buf)
+        value = 0
+        if reg_base == _STATUS_BASE:
+            if reg == _STATUS_HW_ID:
+                value = _SAMD09_HW_ID_CODE
+            elif reg == _STATUS_VERSION:
+                value = _CRICKIT_PID << 16
+            elif reg == _STATUS_TEMP:
+                # 25 degrees C in the seesaw's 16.16 fixed point.
+                value = 25 << 16
+            elif reg == _STATUS_OPTIONS:
+                value = (
+                    (1 << _GPIO_BASE)
+                    | (1 << _TIMER_BASE)
+                    | (1 << _ADC_BASE)
+                    | (1 << _NEOPIXEL_BASE)
+                    | (1 << _TOUCH_BASE)
+                )
+        elif reg_base == _GPIO_BASE:
+            if reg == _GPIO_BULK:
+                levels = self.gpio_levels
+                # Port A first, then port B.
+                value = ((levels & 0xFFFFFFFF) << 32) | (levels >> 32)
+                if len(buf) < 8:
+                    value >>= 32
+            elif reg == _GPIO_INTFLAG:
+                value = self.interrupt_flags & self.interrupt_mask & 0xFFFFFFFF
+                self.interrupt_flags &= ~value
+        elif reg_base == _ADC_BASE:
+            value = self.analog_values[self.pin_mapping.analog_pins[reg - _ADC_CHANNEL_OFFSET]]
+        elif reg_base == _TOUCH_BASE:
+            value = self.touch_values[self.pin_mapping.touch_pins[reg - _TOUCH_CHANNEL_OFFSET]]
+        buf[:] = value.to_bytes(len(buf), "big")
+
+
+class FakeInterruptPin:
+    """Stands in for the ``digitalio.DigitalInOut`` a host reads the seesaw INT output
+    with, such as the ``interrupt`` of `adafruit_crickit.signals.SignalEvents`.
+
+    :param FakeSeesaw seesaw: The seesaw whose INT output the pin is wired to.
+    """
+
+    def __init__(self, seesaw: FakeSeesaw):
+        self._seesaw = seesaw
+
+    @property
+    def value(self) -> bool:
+        """The level of the INT line: ``False`` while an enabled interrupt is pending."""
+        return self._seesaw.interrupt_line
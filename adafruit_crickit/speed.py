@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.speed`
+========================
+
+Closed-loop speed control of the Crickit DC motors, with encoders on the signal pins.
+
+`MotorSpeedControl` samples every encoder with one bulk GPIO read, counting the rising
+edges of each, and at a fixed control rate runs a PID loop per motor that sets its
+throttle to hold `SpeedLoop.target_rpm`. The throttles of all motors are sent together as
+one `adafruit_crickit.Crickit.batch`.
+
+An edge is only seen if the encoder signal stays high and then low for at least one
+sample each, so the sample rate must be more than twice the encoder's pulse rate at full
+speed. Sampling and control together must also fit in the bus ``budget``.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.speed import MotorSpeedControl
+
+  control = MotorSpeedControl(crickit, rate=20, sample_rate=400)
+  wheel = control.add(crickit.dc_motor_1, crickit.SIGNAL1, pulses_per_revolution=12)
+  wheel.target_rpm = 120
+  while True:
+      control.update()
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional
+
+    from adafruit_motor.motor import DCMotor
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+_GPIO_BASE = const(0x01)
+_GPIO_BULK = const(0x04)
+
+
+class SpeedLoop:
+    """The speed control of one motor. Get one from `MotorSpeedControl.add`."""
+
+    def __init__(
+        self,
+        motor: "DCMotor",
+        signal: int,
+        pulses_per_revolution: int,
+        kp: float,
+        ki: float,
+        kd: float,
+    ):
+        self.motor = motor
+        """The ``adafruit_motor.motor.DCMotor`` being controlled."""
+        # Port A is big-endian in the bulk read's bytes 0-3, port B in bytes 4-7.
+        self._index = (7 if signal >= 32 else 3) - ((signal & 31) >> 3)
+        self._bit = 1 << (signal & 7)
+        self._pulses_per_revolution = pulses_per_revolution
+        self.kp = kp
+        """Proportional gain, in throttle per rpm of error."""
+        self.ki = ki
+        """Integral gain, in throttle per rpm second of error."""
+        self.kd = kd
+        """Derivative gain, in throttle per rpm per second of change in speed."""
+        self.target_rpm = 0.0
+        """The speed to hold, in revolutions per minute. Negative runs the motor backward."""
+        self.measured_rpm = 0.0
+        """The speed measured over the last control period, in revolutions per minute."""
+        self.pulses = 0
+        """Encoder pulses counted in total."""
+        self._level = False
+        self._period_pulses = 0
+        self._integral = 0.0
+
+    def _sample(self, buf: bytearray) -> None:
+        level = bool(buf[self._index] & self._bit)
+        if level and not self._level:
+            self._period_pulses += 1
+        self._level = level
+
+    def _control(self, dt: float) -> None:
+        throttle = self.motor.throttle or 0.0
+        rpm = self._period_pulses * 60 / (self._pulses_per_revolution * dt)
+        self.pulses += self._period_pulses
+        self._period_pulses = 0
+        # A single channel encoder cannot tell direction, so go by the throttle.
+        if throttle < 0:
+            rpm = -rpm
+        previous = self.measured_rpm
+        self.measured_rpm = rpm
+        target = self.target_rpm
+        if not target:
+            self._integral = 0.0
+            self.motor.throttle = 0
+            return
+        error = target - rpm
+        integral = self._integral + error * dt
+        # Keep the integral term within full throttle, so it cannot wind up.
+        if self.ki:
+            limit = 1 / self.ki
+            integral = min(max(integral, -limit), limit)
+        self._integral = integral
+        # Derivative of the measurement rather than the error, so target changes do not kick.
+        derivative = (rpm - previous) / dt
+        output = self.kp * error + self.ki * integral - self.kd * derivative
+        self.motor.throttle = min(max(output, -1.0), 1.0)
+
+
+class MotorSpeedControl:
+    """Holds DC motors at target speeds, using encoders on the Crickit signal pins.
+
+    Call `update` as often as possible from your main loop. It samples the encoders when a
+    sample is due and runs the control loops when a control period is due.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the motors are on.
+    :param float rate: Control loop runs per second.
+    :param float sample_rate: Encoder samples per second.
+    :param float budget: Most I2C operations per second to spend, or ``None`` for no
+      limit. Each sample is one bulk GPIO read, and each control period up to two PWM
+      writes per motor.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        *,
+        rate: float = 20.0,
+        sample_rate: float = 400.0,
+        budget: "Optional[float]" = None,
+    ):
+        if rate <= 0 or sample_rate < rate:
+            raise ValueError("rate must be positive and sample_rate at least rate")
+        self._crickit = crickit
+        self._batch = crickit.batch()
+        self._rate = rate
+        self._sample_rate = sample_rate
+        self._budget = budget
+        self._buf = bytearray(8)
+        self._loops = []
+        self._start_time = time.monotonic()
+        self._next_sample = self._start_time
+        self._next_control = self._start_time + 1 / rate
+        self._last_control = self._start_time
+        self.samples = 0
+        """Encoder samples taken."""
+        self.missed_samples = 0
+        """Samples that were due but skipped because `update` was not called in time."""
+        self.control_periods = 0
+        """Control loop runs."""
+        self.max_lateness = 0.0
+        """Longest delay, in seconds, between when a control run was due and when it ran."""
+
+    def add(
+        self,
+        motor: "DCMotor",
+        signal: int,
+        pulses_per_revolution: int,
+        *,
+        kp: float = 0.002,
+        ki: float = 0.02,
+        kd: float = 0.0,
+    ) -> SpeedLoop:
+        """Control ``motor`` using the encoder on signal pin ``signal``, such as
+        ``crickit.SIGNAL1``. Raises ValueError if the extra writes would not fit in the
+        bus budget.
+
+        :param int pulses_per_revolution: Encoder pulses per revolution of the shaft
+          being measured.
+        :param float kp: Proportional gain. See `SpeedLoop.kp`.
+        :param float ki: Integral gain. See `SpeedLoop.ki`.
+        :param float kd: Derivative gain. See `SpeedLoop.kd`.
+        """
+        if self._budget is not None:
+            operations = self._sample_rate + 2 * (len(self._loops) + 1) * self._rate
+            if operations > self._budget:
+                raise ValueError(f"Needs {operations} operations/sec, over the bus budget")
+        seesaw = self._crickit.seesaw
+        seesaw.pin_mode(signal, seesaw.INPUT_PULLUP)
+        loop = SpeedLoop(motor, signal, pulses_per_revolution, kp, ki, kd)
+        self._loops.append(loop)
+        return loop
+
+    def update(self) -> None:
+        """Sample the encoders and run the control loops, if they are due."""
+        now = time.monotonic()
+        if now >= self._next_sample:
+            self._crickit.seesaw.read(_GPIO_BASE, _GPIO_BULK, self._buf)
+            for loop in self._loops:
+                loop._sample(self._buf)
+            self.samples += 1
+            interval = 1 / self._sample_rate
+            self._next_sample += interval
+            if self._next_sample <= now:
+                missed = int((now - self._next_sample) / interval) + 1
+                self.missed_samples += missed
+                self._next_sample += missed * interval
+        if now >= self._next_control:
+            self.max_lateness = max(self.max_lateness, now - self._next_control)
+            dt = now - self._last_control
+            self._last_control = now
+            with self._batch:
+                for loop in self._loops:
+                    loop._control(dt)
+            self.control_periods += 1
+            self._next_control += 1 / self._rate
+            # After a long stall, start counting periods from now.
+            self._next_control = max(self._next_control, now)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Control loop runs per second achieved since the controller was created."""
+        elapsed = time.monotonic() - self._start_time
+        return self.control_periods / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def achieved_sample_rate(self) -> float:
+        """Encoder samples per second achieved since the controller was created."""
+        elapsed = time.monotonic() - self._start_time
+        return self.samples / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.stepper`
+==========================
+
+The stepper motor driver used by `adafruit_crickit.Crickit`. Imported the first time a
+stepper property such as `adafruit_crickit.Crickit.stepper_motor` is used.
+"""
+
+from array import array
+
+from adafruit_motor.stepper import StepperMotor
+
+try:
+    from adafruit_seesaw.pwmout import PWMOut
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+
+class CrickitStepperMotor(StepperMotor):
+    """A ``StepperMotor`` tuned for the Crickit. This is what
+    `adafruit_crickit.Crickit.stepper_motor`, `adafruit_crickit.Crickit.drive_stepper_motor`
+    and `adafruit_crickit.Crickit.feather_drive_stepper_motor` return.
+
+    Coil duty cycles are looked up in tables computed once per motor instead of being
+    recalculated on every step, and the writes of one step are sent together as a
+    `adafruit_crickit.Crickit.batch`, in which the Crickit's `adafruit_crickit.PWMCache`
+    skips coils whose duty cycle does not change.
+    The MICROSTEP table is only built the first time it is needed.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the coils belong to.
+    :param int microsteps: Number of microsteps between full steps.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        ain1: "PWMOut",
+        ain2: "PWMOut",
+        bin1: "PWMOut",
+        bin2: "PWMOut",
+        *,
+        microsteps: int = 16,
+    ):
+        # Batches hold no state of their own, so one can be reused for every step.
+        self._batch = crickit.batch()
+        self._step_table = None
+        self._microstep_table = None
+        super().__init__(ain1, ain2, bin1, bin2, microsteps=microsteps)
+
+    def _build_table(self, positions: int, stride: int, microstepping: bool) -> array:
+        # Four duty cycles per position, computed the same way as StepperMotor does.
+        microsteps = self._microsteps
+        curve = self._curve
+        table = array("H", bytes(8 * positions))
+        for position in range(positions):
+            microstep_position = position * stride
+            trailing_coil = (microstep_position // microsteps) % 4
+            leading_coil = (trailing_coil + 1) % 4
+            microstep = microstep_position % microsteps
+            leading = curve[microstep]
+            trailing = curve[microsteps - microstep]
+            # Full torque for DOUBLE steps, as in StepperMotor.
+            if not microstepping and leading == trailing and leading > 0:
+                leading = trailing = 0xFFFF
+            table[4 * position + leading_coil] = leading
+            table[4 * position + trailing_coil] = trailing
+        return table
+
+    def _update_coils(self, *, microstepping: bool = False) -> None:
+        if microstepping:
+            table = self._microstep_table
+            if table is None:
+                table = self._microstep_table = self._build_table(
+                    4 * self._microsteps, 1, microstepping=True
+                )
+            index = 4 * (self._current_microstep % (4 * self._microsteps))
+        else:
+            # SINGLE, DOUBLE and INTERLEAVE positions are always half-step aligned.
+            table = self._step_table
+            if table is None:
+                table = self._step_table = self._build_table(
+                    8, self._microsteps // 2, microstepping=False
+                )
+            index = 4 * ((self._current_microstep // (self._microsteps // 2)) % 8)
+        self._write_coils(table, index)
+
+    def _write_coils(self, table: array, index: int) -> None:
+        coils = self._coil
+        with self._batch:
+            for i in range(4):
+                coils[i].duty_cycle = table[index + i]
+
+    def release(self) -> None:
+        """Releases all the coils so the motor can free spin, also won't use any power"""
+        self._write_coils(array("H", (0, 0, 0, 0)), 0)
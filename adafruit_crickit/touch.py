@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.touch`
+========================
+
+Press and release events from the Crickit capacitive touch pads.
+
+`TouchPads` polls the pads and keeps a rolling baseline for each one, so the touch
+threshold follows slow drift from humidity and temperature. A pad is pressed when its
+reading rises ``threshold`` above the baseline, and released when it falls back more
+than ``hysteresis`` below that, each only after ``debounce`` readings in a row agree.
+Polling is fast while a pad is touched or was recently active and slow when idle, and is
+never faster than the bus ``budget`` allows.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.touch import TouchPads
+
+  pads = TouchPads(crickit)
+  for event in pads.events():
+      print("Touch", event.pad, "pressed" if event.pressed else "released")
+"""
+
+import time
+from collections import namedtuple
+
+try:
+    from typing import Iterator, Optional, Sequence, Tuple
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+TouchEvent = namedtuple("TouchEvent", ("pad", "pressed", "raw_value", "timestamp"))
+"""A press or release of a touch pad.
+
+``pad`` is the pad number, 1 to 4; ``pressed`` is ``True`` for a press and ``False``
+for a release; ``raw_value`` is the reading that completed the debounce; ``timestamp``
+is the ``time.monotonic()`` of that reading.
+"""
+
+
+class TouchPads:
+    """Polls Crickit touch pads and turns their readings into `TouchEvent` objects.
+
+    Call `update` from your main loop, or iterate over `events`. Set `on_press` and
+    `on_release` to have events delivered to callbacks as well.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the pads are on.
+    :param Sequence[int] pads: The pad numbers to watch, from 1 to 4.
+    :param int threshold: How far above the baseline a reading must rise to be a press.
+    :param int hysteresis: How far below the press level a reading must fall to be
+      a release.
+    :param int debounce: How many readings in a row it takes to press or release.
+    :param float drift: How quickly the baseline follows readings while a pad is not
+      touched, as a fraction of the difference per reading.
+    :param float fast_interval: Seconds between polls while pads are active.
+    :param float slow_interval: Seconds between polls while pads are idle.
+    :param float idle_timeout: Seconds without activity after which polling slows down.
+    :param float budget: Most touch reads per second to spend, or ``None`` for no limit.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        pads: "Sequence[int]" = (1, 2, 3, 4),
+        *,
+        threshold: int = 100,
+        hysteresis: int = 30,
+        debounce: int = 2,
+        drift: float = 1 / 32,
+        fast_interval: float = 0.01,
+        slow_interval: float = 0.1,
+        idle_timeout: float = 1.0,
+        budget: "Optional[float]" = 200.0,
+    ):
+        if debounce < 1:
+            raise ValueError("debounce must be at least 1")
+        self._pads = tuple(pads)
+        self._touch_ins = tuple(getattr(crickit, f"touch_{pad}") for pad in pads)
+        self._threshold = threshold
+        self._hysteresis = hysteresis
+        self._debounce = debounce
+        self._drift = drift
+        self._fast_interval = fast_interval
+        self._slow_interval = slow_interval
+        self._idle_timeout = idle_timeout
+        self._budget = budget
+        self._baselines = [float(touch_in.raw_value) for touch_in in self._touch_ins]
+        self._pressed = [False] * len(self._pads)
+        # Readings in a row that disagree with the current state of each pad.
+        self._counts = [0] * len(self._pads)
+        now = time.monotonic()
+        self._last_activity = now
+        self._next_poll = now
+        self.reads = len(self._pads)
+        """Number of touch reads made, including the initial calibration."""
+        self.on_press = None
+        """Called with the `TouchEvent` of every press, if set."""
+        self.on_release = None
+        """Called with the `TouchEvent` of every release, if set."""
+        for i in range(len(self._pads)):
+            self._set_threshold(i)
+
+    def _set_threshold(self, i: int) -> None:
+        # Keep the pad's own value property in step with the calibration.
+        self._touch_ins[i].threshold = int(self._baselines[i]) + self._threshold
+
+    @property
+    def interval(self) -> float:
+        """Seconds until the next poll after this one, given current activity and budget."""
+        interval = self._slow_interval
+        if True in self._pressed or time.monotonic() - self._last_activity < self._idle_timeout:
+            interval = self._fast_interval
+        if self._budget:
+            interval = max(interval, len(self._pads) / self._budget)
+        return interval
+
+    @property
+    def pressed(self) -> "Tuple[bool, ...]":
+        """Whether each watched pad is pressed, in the order of ``pads``."""
+        return tuple(self._pressed)
+
+    @property
+    def baselines(self) -> "Tuple[int, ...]":
+        """The current baseline reading of each watched pad, in the order of ``pads``."""
+        return tuple(int(baseline) for baseline in self._baselines)
+
+    def update(self) -> "Tuple[TouchEvent, ...]":
+        """Poll the pads if a poll is due, and return the events it produced.
+        Returns an empty tuple when no poll was due or nothing changed.
+        """
+        now = time.monotonic()
+        if now < self._next_poll:
+            return ()
+        events = []
+        threshold = self._threshold
+        baselines = self._baselines
+        pressed = self._pressed
+        counts = self._counts
+        for i, touch_in in enumerate(self._touch_ins):
+            raw_value = touch_in.raw_value
+            level = raw_value - baselines[i]
+            if pressed[i]:
+                touching = level >= threshold - self._hysteresis
+            else:
+                touching = level > threshold
+            if touching == pressed[i]:
+                counts[i] = 0
+                if not touching:
+                    baselines[i] += (raw_value - baselines[i]) * self._drift
+                    self._set_threshold(i)
+                continue
+            self._last_activity = now
+            counts[i] += 1
+            if counts[i] < self._debounce:
+                continue
+            counts[i] = 0
+            pressed[i] = touching
+            event = TouchEvent(self._pads[i], touching, raw_value, now)
+            events.append(event)
+            callback = self.on_press if touching else self.on_release
+            if callback:
+                callback(event)
+        self.reads += len(self._touch_ins)
+        self._next_poll = now + self.interval
+        return tuple(events)
+
+    def events(self) -> "Iterator[TouchEvent]":
+        """Poll forever, sleeping between polls, and yield each event as it happens."""
+        while True:
+            yield from self.update()
+            delay = self._next_poll - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
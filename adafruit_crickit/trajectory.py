@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.trajectory`
+=============================
+
+Smooth, coordinated motion of several servos from keyframes.
+
+`ServoTrajectory` takes keyframes for any of the Crickit servos, and turns them into a
+table of duty cycles, one per servo per tick of a fixed control rate. While running, each
+tick only looks up the duty cycles due and sends them together as one
+`adafruit_crickit.Crickit.batch`. Servos that are holding still cost no bus traffic.
+Ticks that could not be sent in time are skipped and counted, so the control rate can be
+sized to what the bus can carry.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.trajectory import ServoTrajectory, ease_in_out
+
+  trajectory = ServoTrajectory(crickit, rate=50)
+  trajectory.add(crickit.servo_1, ((0, 0), (1.0, 180, ease_in_out), (2.0, 90)))
+  trajectory.add(crickit.servo_2, ((0, 180), (2.0, 0, ease_in_out)))
+  trajectory.run()
+  print(trajectory.missed, "of", trajectory.ticks, "ticks missed")
+"""
+
+import time
+from array import array
+
+try:
+    from typing import Callable, Sequence, Tuple, Union
+
+    from adafruit_motor.servo import ContinuousServo, Servo
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+
+def linear(t: float) -> float:
+    """Constant speed."""
+    return t
+
+
+def ease_in(t: float) -> float:
+    """Start slowly and speed up."""
+    return t * t
+
+
+def ease_out(t: float) -> float:
+    """Start quickly and slow down."""
+    return t * (2 - t)
+
+
+def ease_in_out(t: float) -> float:
+    """Speed up, then slow down."""
+    return t * t * (3 - 2 * t)
+
+
+class ServoTrajectory:
+    """Plays keyframed moves on several servos at once, at a fixed control rate.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the servos are on.
+    :param float rate: Control ticks per second.
+    """
+
+    def __init__(self, crickit: "Crickit", rate: float = 50.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._batch = crickit.batch()
+        self._interval = 1 / rate
+        self._pwms = []
+        self._schedules = []
+        self._tick_count = 0
+        self._next_tick = 0
+        self._start_time = 0.0
+        self.ticks = 0
+        """Number of ticks sent in the current or last run."""
+        self.missed = 0
+        """Number of ticks skipped because they were not sent before the next was due."""
+        self.max_lateness = 0.0
+        """Longest delay, in seconds, between when a tick was due and when its writes
+        were done."""
+
+    def add(
+        self,
+        servo: "Union[Servo, ContinuousServo]",
+        keyframes: "Sequence[Tuple]",
+    ) -> None:
+        """Add a servo and its keyframes, and compute its schedule.
+
+        Each keyframe is ``(time, value)`` or ``(time, value, easing)``. ``time`` is in
+        seconds from the start of the run and must increase from one keyframe to the next.
+        ``value`` is an angle for a ``Servo`` and a throttle for a ``ContinuousServo``.
+        ``easing`` shapes the move from the previous keyframe to this one; it takes and
+        returns a fraction from 0.0 to 1.0, such as `ease_in_out`, and defaults to `linear`.
+        Before the first keyframe the servo holds the first value, and after the last
+        keyframe it holds the last.
+
+        :param servo: A servo of the Crickit, such as ``crickit.servo_1``.
+        :param keyframes: The keyframes of the servo.
+        """
+        if not keyframes:
+            raise ValueError("At least one keyframe is needed")
+        to_fraction = self._converter(servo)
+        frames = []
+        previous_time = None
+        for keyframe in keyframes:
+            at, value = keyframe[0], keyframe[1]
+            easing = keyframe[2] if len(keyframe) > 2 else linear
+            if previous_time is not None and at <= previous_time:
+                raise ValueError("Keyframe times must increase")
+            previous_time = at
+            frames.append((at, to_fraction(value), easing))
+
+        schedule = self._schedule(frames, servo._min_duty, servo._duty_range)
+        self._pwms.append(servo._pwm_out)
+        self._schedules.append(schedule)
+        self._tick_count = max(self._tick_count, len(schedule))
+
+    def _tick_at(self, seconds: float) -> int:
+        # The last tick due by ``seconds``. Allow a thousandth of a tick for float error,
+        # so that a time on a tick, such as 0.3 s at 0.1 s per tick, counts that tick.
+        return int(seconds / self._interval + 0.001)
+
+    def _schedule(self, frames: list, min_duty: int, duty_range: int) -> array:
+        # The duty cycle of every tick from the start to the last keyframe.
+        ticks = self._tick_at(frames[-1][0]) + 1
+        schedule = array("H", bytes(2 * ticks))
+        segment = 0
+        for tick in range(ticks):
+            at = tick * self._interval
+            while segment < len(frames) - 1 and frames[segment + 1][0] <= at:
+                segment += 1
+            start_time, fraction, _ = frames[segment]
+            if segment < len(frames) - 1 and at > start_time:
+                end_time, end_fraction, easing = frames[segment + 1]
+                progress = easing((at - start_time) / (end_time - start_time))
+                fraction += (end_fraction - fraction) * progress
+            schedule[tick] = min_duty + int(fraction * duty_range)
+        # The last tick lands exactly on the last keyframe.
+        schedule[-1] = min_duty + int(frames[-1][1] * duty_range)
+        return schedule
+
+    @staticmethod
+    def _converter(servo: "Union[Servo, ContinuousServo]") -> "Callable[[float], float]":
+        actuation_range = getattr(servo, "actuation_range", None)
+        if actuation_range is None:
+
+            def throttle(value: float) -> float:
+                if not -1.0 <= value <= 1.0:
+                    raise ValueError("Throttle must be between -1.0 and 1.0")
+                return (value + 1) / 2
+
+            return throttle
+
+        def angle(value: float) -> float:
+            if not 0 <= value <= actuation_range:
+                raise ValueError("Angle out of range")
+            return value / actuation_range
+
+        return angle
+
+    def clear(self) -> None:
+        """Remove all servos and their keyframes."""
+        self._pwms = []
+        self._schedules = []
+        self._tick_count = 0
+        self._next_tick = 0
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first tick to the last."""
+        return max(0, self._tick_count - 1) * self._interval
+
+    @property
+    def running(self) -> bool:
+        """``True`` while ticks remain to be sent."""
+        return self._next_tick < self._tick_count
+
+    def start(self) -> None:
+        """Start playing from the beginning. Call `update` to send the ticks."""
+        self._start_time = time.monotonic()
+        self._next_tick = 0
+        self.ticks = 0
+        self.missed = 0
+        self.max_lateness = 0.0
+
+    def update(self) -> bool:
+        """Send the latest tick that is due, if one is. Returns ``True`` while the run is
+        still in progress. Ticks passed over since the last update are counted in `missed`.
+        """
+        tick = self._next_tick
+        count = self._tick_count
+        if tick >= count:
+            return False
+        elapsed = time.monotonic() - self._start_time
+        due = min(self._tick_at(elapsed), count - 1)
+        if due < tick:
+            return True
+        self.missed += due - tick
+        with self._batch:
+            for pwm, schedule in zip(self._pwms, self._schedules):
+                pwm.duty_cycle = schedule[min(due, len(schedule) - 1)]
+        lateness = time.monotonic() - self._start_time - due * self._interval
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.ticks += 1
+        self._next_tick = due + 1
+        return self._next_tick < count
+
+    def run(self) -> None:
+        """Play every keyframe and return when the last one has been reached."""
+        self.start()
+        while self.update():
+            delay = self._start_time + self._next_tick * self._interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_crickit.waveform`
+===========================
+
+Timed pulse and fade sequences on the Crickit drive terminals, for solenoids and LEDs.
+
+`WaveformPlayer` compiles ``(time, terminal, duty)`` changes into a timeline sorted by
+time, where changes that fall together are merged into one event, sent as one
+`adafruit_crickit.Crickit.batch`. Playing follows the timeline from its start time
+rather than sleeping from one event to the next, so time spent sending does not add up
+to drift, and events that come due together while the player was held up are sent in
+one flush. How late each event was sent is kept in `WaveformPlayer.lateness`.
+
+.. code-block:: python
+
+  from adafruit_crickit import crickit
+  from adafruit_crickit.waveform import WaveformPlayer
+
+  # Fire the solenoid on Drive 1 for 50 ms, and fade the LED on Drive 2 up while it does.
+  player = WaveformPlayer(
+      crickit,
+      (
+          (0.0, crickit.drive_1, 1.0),
+          (0.05, crickit.drive_1, 0.0),
+          (0.0, crickit.drive_2, 0.0),
+          (0.025, crickit.drive_2, 0.5),
+          (0.05, crickit.drive_2, 1.0),
+      ),
+  )
+  player.run()
+  print("Worst lateness:", player.max_lateness)
+"""
+
+import time
+from array import array
+
+try:
+    from typing import Iterable, Tuple
+
+    from adafruit_seesaw.pwmout import PWMOut
+
+    from adafruit_crickit import Crickit
+except ImportError:
+    pass
+
+# The last part of a wait before an event is spent polling the clock rather than
+# sleeping, since sleeps can overshoot by about this much.
+_SPIN = 0.001
+
+
+class WaveformPlayer:
+    """Plays a timeline of duty cycle changes on the Crickit drives.
+
+    :param ~adafruit_crickit.Crickit crickit: The Crickit the drives are on.
+    :param segments: The changes to play, each ``(time, terminal, duty)``: ``time`` in
+      seconds from the start of the timeline, ``terminal`` a drive such as
+      ``crickit.drive_1``, and ``duty`` the fraction of full on, from 0.0 to 1.0.
+    :param float merge_window: Changes less than this many seconds after the first
+      change of an event are sent with it, in the same flush.
+    """
+
+    def __init__(
+        self,
+        crickit: "Crickit",
+        segments: "Iterable[Tuple[float, PWMOut, float]]" = (),
+        *,
+        merge_window: float = 0.0005,
+    ):
+        self._batch = crickit.batch()
+        self._merge_window = merge_window
+        self._times = array("f")
+        self._changes = ()
+        self._next_event = 0
+        self._start_time = 0.0
+        self.lateness = array("f")
+        """For each event of the timeline, in order, how many seconds after it was due
+        its flush was done, in the current or last run."""
+        self.flushes = 0
+        """Number of flushes sent in the current or last run."""
+        self.compile(segments)
+
+    def compile(self, segments: "Iterable[Tuple[float, PWMOut, float]]") -> None:
+        """Replace the timeline with one built from ``segments``."""
+        times = []
+        changes = []
+        for at, terminal, duty in sorted(segments, key=lambda segment: segment[0]):
+            if at < 0:
+                raise ValueError("Times must not be negative")
+            if not 0.0 <= duty <= 1.0:
+                raise ValueError("Duty must be 0.0 to 1.0")
+            change = (terminal, int(duty * 0xFFFF))
+            if times and at - times[-1] < self._merge_window:
+                changes[-1].append(change)
+            else:
+                times.append(at)
+                changes.append([change])
+        self._times = array("f", times)
+        self._changes = tuple(tuple(event) for event in changes)
+        self.lateness = array("f", bytes(4 * len(times)))
+        self._next_event = 0
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the start of the timeline to its last event."""
+        return self._times[-1] if self._times else 0.0
+
+    @property
+    def running(self) -> bool:
+        """``True`` while events remain to be sent."""
+        return self._next_event < len(self._times)
+
+    @property
+    def max_lateness(self) -> float:
+        """Latest any event sent so far was, in seconds."""
+        played = self.lateness[: self._next_event]
+        return max(played) if played else 0.0
+
+    @property
+    def mean_lateness(self) -> float:
+        """Mean lateness of the events sent so far, in seconds."""
+        if not self._next_event:
+            return 0.0
+        return sum(self.lateness[: self._next_event]) / self._next_event
+
+    def start(self) -> None:
+        """Start playing from the beginning. Call `update` to send the events."""
+        self._start_time = time.monotonic()
+        self._next_event = 0
+        self.flushes = 0
+
+    def update(self) -> bool:
+        """Send every event that is due, in one flush. Returns ``True`` while the run is
+        still in progress."""
+        times = self._times
+        count = len(times)
+        index = self._next_event
+        if index >= count:
+            return False
+        elapsed = time.monotonic() - self._start_time
+        if times[index] > elapsed:
+            return True
+        first = index
+        with self._batch:
+            while index < count and times[index] <= elapsed:
+                for terminal, duty_cycle in self._changes[index]:
+                    terminal.duty_cycle = duty_cycle
+                index += 1
+        done = time.monotonic() - self._start_time
+        for i in range(first, index):
+            self.lateness[i] = done - times[i]
+        self.flushes += 1
+        self._next_event = index
+        return index < count
+
+    def run(self) -> None:
+        """Play the whole timeline and return after its last event."""
+        self.start()
+        while self.update():
+            due = self._start_time + self._times[self._next_event]
+            delay = due - time.monotonic() - _SPIN
+            if delay > 0:
+                time.sleep(delay)
+            while time.monotonic() < due:
+                pass
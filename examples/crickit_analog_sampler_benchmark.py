@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Sample two simulated potentiometers on Signal 1 and 2 with AnalogSampler at rising
+# rates, and report the rate achieved, the reads dropped and how evenly the samples are
+# spaced. For comparison, also time back to back analog_read() calls.
+# Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.analog import AnalogSampler
+from adafruit_crickit.simulator import FakeSeesaw
+
+DURATION = 1.0
+READ_DELAY = 0.0005
+
+# Each simulated I2C transaction takes 0.2 ms, and reads wait for the settling delay.
+seesaw = FakeSeesaw(latency=0.0002, honor_delays=True)
+crickit = Crickit(seesaw)
+seesaw.analog_values[crickit.SIGNAL1] = 512
+seesaw.analog_values[crickit.SIGNAL2] = 100
+
+
+def spacing(times):
+    intervals = [b - a for a, b in zip(times, times[1:])]
+    mean = sum(intervals) / len(intervals)
+    jitter = (sum((i - mean) ** 2 for i in intervals) / len(intervals)) ** 0.5
+    return mean, jitter
+
+
+print("Back to back analog_read() of Signal 1:")
+times = []
+end = time.monotonic() + DURATION
+while time.monotonic() < end:
+    seesaw.analog_read(crickit.SIGNAL1, delay=READ_DELAY)
+    times.append(time.monotonic())
+mean, jitter = spacing(times)
+rate = len(times) / DURATION
+print(f"  {rate:7.1f} reads/s, spacing {mean * 1000:.2f} ms +- {jitter * 1000:.3f}")
+
+print("AnalogSampler on Signal 1 and 2, per signal:")
+for rate in (50, 100, 200, 400, 800):
+    sampler = AnalogSampler(crickit, (1, 2), rate, size=4096, read_delay=READ_DELAY)
+    sampler.run(DURATION)
+    times = [sample.timestamp for sample in sampler.samples() if sample.signal == 1]
+    mean, jitter = spacing(times)
+    print(
+        f"  target {rate:4}/s: achieved {sampler.achieved_rate:6.1f}/s, "
+        f"{sampler.dropped:4} reads dropped, spacing {mean * 1000:.2f} ms +- {jitter * 1000:.3f}"
+    )
+
+sampler = AnalogSampler(crickit, (1,), 100, average=8, read_delay=READ_DELAY)
+sampler.run(0.2)
+print(f"Averaging 8 reads per sample: {sampler.reads} reads, {sampler.stored} samples")
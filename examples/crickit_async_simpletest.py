@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Crickit library demo - run a stepper motor, watch a touch pad and animate
+# NeoPixels at the same time with asyncio.
+
+import asyncio
+
+from adafruit_crickit import crickit
+from adafruit_crickit.aio import AsyncCrickit
+
+acrickit = AsyncCrickit(crickit)
+crickit.init_neopixel(8, auto_write=False)
+
+
+async def spin():
+    motor = acrickit.stepper_motor
+    while True:
+        await motor.step(200, 100)
+        await motor.step(-200, 100)
+
+
+async def watch_touch():
+    touch = acrickit.touch_1
+    while True:
+        await touch.wait_for_touch()
+        print("Touched terminal Touch 1")
+        await touch.wait_for_release()
+
+
+async def animate():
+    pixels = crickit.neopixel
+    position = 0
+    while True:
+        pixels.fill((0, 0, 0))
+        pixels[position] = (0, 0, 64)
+        await acrickit.run(pixels.show)
+        position = (position + 1) % len(pixels)
+        await asyncio.sleep(0.1)
+
+
+async def main():
+    await asyncio.gather(spin(), watch_touch(), animate())
+
+
+asyncio.run(main())
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Count the seesaw PWM writes needed to update both DC motors and all four Drive
+# terminals, with and without crickit.batch(), and how many writes the PWM cache
+# skips when a control loop repeats its setpoints. Runs without a Crickit attached.
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+
+def update(crickit, throttle):
+    crickit.dc_motor_1.throttle = throttle
+    crickit.dc_motor_2.throttle = throttle
+    # A second setpoint in the same tick, as a control loop might produce.
+    crickit.dc_motor_1.throttle = -throttle
+    for drive in (crickit.drive_1, crickit.drive_2, crickit.drive_3, crickit.drive_4):
+        drive.fraction = abs(throttle)
+
+
+seesaw = FakeSeesaw()
+crickit = Crickit(seesaw)
+# Create the devices up front so their setup writes are not counted.
+update(crickit, 0.0)
+
+seesaw.transactions = 0
+update(crickit, 0.5)
+unbatched = seesaw.transactions
+
+seesaw.transactions = 0
+with crickit.batch():
+    update(crickit, 0.25)
+batched = seesaw.transactions
+
+seesaw.transactions = 0
+crickit.pwm_cache.hits = crickit.pwm_cache.misses = 0
+for _ in range(100):
+    with crickit.batch():
+        update(crickit, 0.25)
+repeated = seesaw.transactions
+
+print("unbatched:", unbatched, "transactions")
+print("batched:  ", batched, "transactions")
+print("100 repeated ticks:", repeated, "transactions")
+print("cache hits:", crickit.pwm_cache.hits, "misses:", crickit.pwm_cache.misses)
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Four threads each set one servo or motor a thousand times a second for two seconds,
+# more than the simulated bus can carry. Without coalescing every set waits its turn on
+# the bus; with coalescing, sets return at once and the I/O thread sends only the newest
+# value of each terminal. Reports how long sets took, how many were made, and the
+# coalescer's statistics. Then checks that a batch held open while another thread wakes
+# the I/O thread sends nothing until it exits. Runs without a Crickit attached.
+
+import threading
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+DURATION = 2.0
+RATE = 1000
+
+
+def run(coalescing):
+    # Each simulated I2C transaction takes 0.5 ms.
+    seesaw = FakeSeesaw(latency=0.0005)
+    crickit = Crickit(seesaw)
+    crickit.enable_coalescing(coalescing)
+    setters = (
+        lambda i: setattr(crickit.servo_1, "angle", i % 180),
+        lambda i: setattr(crickit.servo_2, "angle", 179 - i % 180),
+        lambda i: setattr(crickit.dc_motor_1, "throttle", (i % 200 - 100) / 100),
+        lambda i: setattr(crickit.drive_1, "fraction", i % 100 / 100),
+    )
+    for setter in setters:
+        setter(0)
+    results = []
+
+    def worker(setter):
+        count = 0
+        longest = 0.0
+        start = time.monotonic()
+        next_time = start
+        while time.monotonic() - start < DURATION:
+            before = time.monotonic()
+            setter(count)
+            longest = max(longest, time.monotonic() - before)
+            count += 1
+            next_time += 1 / RATE
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        results.append((count, longest))
+
+    threads = [threading.Thread(target=worker, args=(setter,)) for setter in setters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sets = sum(count for count, _ in results)
+    longest = max(longest for _, longest in results)
+    name = "coalescing" if coalescing else "direct"
+    print(f"{name:10}: {sets / DURATION:6.0f} sets/s, longest set {longest * 1000:6.2f} ms")
+    if coalescing:
+        coalescer = crickit.coalescer
+        coalescer.wait()
+        # The newest value of every terminal has reached the board.
+        for pwm in (crickit.servo_1._pwm_out, crickit.drive_1):
+            assert seesaw.duty_cycles[pwm._pin] == pwm.duty_cycle
+        print(
+            f"            {coalescer.cycles} cycles, {coalescer.coalesced} values coalesced, "
+            f"max depth {coalescer.max_depth}, max cycle {coalescer.max_cycle_time * 1000:.2f} ms, "
+            f"max latency {coalescer.max_latency * 1000:.2f} ms"
+        )
+        crickit.enable_coalescing(False)
+
+
+print(f"{4 * RATE} sets/s wanted")
+run(False)
+run(True)
+
+
+def other_thread(crickit, motor):
+    motor.throttle = 0.5
+    crickit.coalescer.wake()
+
+
+def check_batch():
+    seesaw = FakeSeesaw(latency=0.0005)
+    crickit = Crickit(seesaw)
+    crickit.enable_coalescing()
+    servo, drive, motor = crickit.servo_1, crickit.drive_1, crickit.dc_motor_1
+    servo.angle = 0
+    drive.fraction = 0
+    crickit.coalescer.wait()
+    with crickit.batch():
+        servo.angle = 90
+        drive.fraction = 0.5
+        # Another thread writes and wakes the I/O thread, as a cycle already running
+        # would pick up the batch's values.
+        thread = threading.Thread(target=other_thread, args=(crickit, motor))
+        thread.start()
+        thread.join()
+        time.sleep(0.05)
+        early = [
+            seesaw.duty_cycles.get(pwm._pin) == pwm.duty_cycle for pwm in (servo._pwm_out, drive)
+        ]
+    crickit.coalescer.wait()
+    assert not any(early), "part of an open batch was sent"
+    for pwm in (servo._pwm_out, drive):
+        assert seesaw.duty_cycles[pwm._pin] == pwm.duty_cycle
+    crickit.enable_coalescing(False)
+    print("open batch: nothing sent until it exited")
+
+
+check_batch()
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Drive a simulated two-wheel robot straight through a series of speed changes, first by
+# setting the two motor throttles one after the other, then with DifferentialDrive,
+# without and with an acceleration limit.
+# Every change sent to one wheel before the other turns the robot a little; reports how
+# far the robot turned in total each way, and the tick rate and jitter DifferentialDrive
+# kept.
+# Runs without a Crickit attached.
+
+import math
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.drive import DifferentialDrive
+from adafruit_crickit.simulator import FakeSeesaw
+
+TRACK_WIDTH = 0.15  # Meters between the wheels.
+MAX_SPEED = 0.5  # Meters per second at full throttle.
+RATE = 50
+# (time, meters per second) commands, all straight ahead.
+COMMANDS = ((0.0, 0.2), (0.5, 0.5), (1.0, -0.3), (1.5, 0.4), (2.0, 0.0))
+DURATION = 2.5
+
+
+class TimedSeesaw(FakeSeesaw):
+    # Keeps the throttle of each wheel after every write, with its time.
+    def __init__(self, latency):
+        super().__init__(latency)
+        self.timeline = []
+
+    def write(self, reg_base, reg, buf=None):
+        super().write(reg_base, reg, buf)
+        duty = self.duty_cycles.get
+        # Motor 1 is driven by seesaw pins 22 and 23, motor 2 by pins 19 and 18.
+        left = (duty(22, 0) - duty(23, 0)) / 0xFFFF
+        right = (duty(19, 0) - duty(18, 0)) / 0xFFFF
+        self.timeline.append((time.monotonic(), left, right))
+
+
+def turning(seesaw):
+    # Integrate the turn rate of the robot over the recorded throttles, either way, since
+    # turns left and right would otherwise cancel out.
+    turned = 0.0
+    timeline = seesaw.timeline
+    for (at, left, right), (after, _, _) in zip(timeline, timeline[1:]):
+        turned += abs(right - left) * MAX_SPEED / TRACK_WIDTH * (after - at)
+    return math.degrees(turned)
+
+
+def command_at(elapsed):
+    speed = 0.0
+    for at, value in COMMANDS:
+        if at <= elapsed:
+            speed = value
+    return speed
+
+
+def separate(seesaw, crickit):
+    left, right = crickit.dc_motor_1, crickit.dc_motor_2
+    start = time.monotonic()
+    while time.monotonic() - start < DURATION:
+        throttle = command_at(time.monotonic() - start) / MAX_SPEED
+        left.throttle = throttle
+        right.throttle = throttle
+        time.sleep(1 / RATE)
+
+
+def differential(seesaw, crickit, max_acceleration=None):
+    drive = DifferentialDrive(
+        crickit,
+        crickit.dc_motor_1,
+        crickit.dc_motor_2,
+        track_width=TRACK_WIDTH,
+        max_speed=MAX_SPEED,
+        max_acceleration=max_acceleration,
+        deadband=0.05,
+        rate=RATE,
+    )
+    drive.start()
+    start = time.monotonic()
+    while time.monotonic() - start < DURATION:
+        drive.set_velocity(command_at(time.monotonic() - start), 0.0)
+        drive.update()
+        time.sleep(0.0005)
+    return drive
+
+
+def ramped(seesaw, crickit):
+    return differential(seesaw, crickit, max_acceleration=2.0)
+
+
+for name, driver in (
+    ("separate writes", separate),
+    ("DifferentialDrive", differential),
+    ("ramped at 2 m/s2", ramped),
+):
+    # Each simulated I2C transaction takes 0.5 ms.
+    seesaw = TimedSeesaw(latency=0.0005)
+    crickit = Crickit(seesaw)
+    # Create the motors up front so their setup writes are not counted.
+    crickit.dc_motor_1.throttle = crickit.dc_motor_2.throttle = 0
+    seesaw.timeline.clear()
+    drive = driver(seesaw, crickit)
+    print(f"{name:17}: turned {turning(seesaw):5.2f} degrees")
+    if drive:
+        print(
+            f"{'':17}  {drive.achieved_rate:.1f} of {RATE} ticks/s, {drive.missed} missed,"
+            f" jitter {drive.jitter * 1000:.2f} ms,"
+            f" max lateness {drive.max_lateness * 1000:.2f} ms"
+        )
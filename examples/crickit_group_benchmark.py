@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Update four servos on each of four Crickits, on two simulated I2C buses, first board
+# by board and then with CrickitGroup, which flushes the two buses in parallel. Also
+# checks that a batch of an empty group does nothing.
+# Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.group import CrickitGroup
+from adafruit_crickit.simulator import FakeI2CBus, FakeSeesaw
+
+ROUNDS = 20
+SERVOS = ("servo_1", "servo_2", "servo_3", "servo_4")
+
+# Each simulated I2C transaction takes 1 ms.
+buses = (FakeI2CBus(latency=0.001), FakeI2CBus(latency=0.001))
+seesaws = [FakeSeesaw(bus=bus, address=address) for bus in buses for address in (0x49, 0x4A)]
+group = CrickitGroup(Crickit(seesaw) for seesaw in seesaws)
+
+
+def update(i):
+    for board in range(len(group)):
+        for servo in SERVOS:
+            group[board, servo].angle = 45 + 90 * (i % 2)
+
+
+# Create the servos before measuring.
+update(0)
+
+start = time.monotonic()
+for i in range(1, ROUNDS + 1):
+    for crickit in group:
+        with crickit.batch():
+            for servo in SERVOS:
+                getattr(crickit, servo).angle = 45 + 90 * (i % 2)
+sequential = (time.monotonic() - start) / ROUNDS
+
+start = time.monotonic()
+for i in range(1, ROUNDS + 1):
+    with group.batch():
+        update(i)
+parallel = (time.monotonic() - start) / ROUNDS
+group.deinit()
+
+print(len(group), "boards on", group.bus_count, "buses")
+print("board by board:", sequential * 1000, "ms/update")
+print("CrickitGroup:  ", parallel * 1000, "ms/update")
+
+empty = CrickitGroup(())
+with empty.batch():
+    pass
+print("empty group: batch sent nothing")
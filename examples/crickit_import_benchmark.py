@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Measure the time and heap used by importing adafruit_crickit, creating the crickit
+# singleton, and using the first device. Drivers are only loaded when first needed,
+# so the import itself should be cheap. For comparison, first measure what importing
+# used to cost, when every driver was imported and the seesaw was set up at import
+# time, then unload those modules again. Run this as the first thing after a reset.
+
+import gc
+import sys
+import time
+
+try:
+    # CircuitPython
+    mem_used = gc.mem_alloc
+except AttributeError:
+    # CPython
+    import tracemalloc
+
+    tracemalloc.start()
+
+    def mem_used():
+        return tracemalloc.get_traced_memory()[0]
+
+
+def measure(label, function):
+    gc.collect()
+    before = mem_used()
+    start = time.monotonic()
+    function()
+    elapsed = time.monotonic() - start
+    gc.collect()
+    used = mem_used() - before
+    print(label, elapsed * 1000, "ms,", used, "bytes")
+    return elapsed, used
+
+
+modules = {}
+
+
+def import_eager():
+    # What importing adafruit_crickit did before drivers were loaded lazily.
+    import board  # noqa: PLC0415
+    from adafruit_motor.motor import DCMotor  # noqa: PLC0415, F401
+    from adafruit_motor.servo import ContinuousServo, Servo  # noqa: PLC0415, F401
+    from adafruit_motor.stepper import StepperMotor  # noqa: PLC0415, F401
+    from adafruit_seesaw.crickit import Crickit_Pinmap  # noqa: PLC0415, F401
+    from adafruit_seesaw.neopixel import NeoPixel  # noqa: PLC0415, F401
+    from adafruit_seesaw.pwmout import PWMOut  # noqa: PLC0415, F401
+    from adafruit_seesaw.seesaw import Seesaw  # noqa: PLC0415
+
+    import adafruit_crickit  # noqa: PLC0415, F401
+
+    if "I2C" in dir(board):
+        modules["seesaw"] = Seesaw(board.I2C())
+
+
+def import_crickit():
+    import adafruit_crickit  # noqa: PLC0415
+
+    modules["crickit"] = adafruit_crickit
+
+
+def create_singleton():
+    return modules["crickit"].crickit
+
+
+def first_servo():
+    crickit = modules["crickit"].crickit
+    if crickit:
+        crickit.servo_1.angle = 90
+
+
+def first_stepper():
+    crickit = modules["crickit"].crickit
+    if crickit:
+        crickit.stepper_motor.onestep()
+
+
+loaded = set(sys.modules)
+eager_time, eager_heap = measure("eager import (before):  ", import_eager)
+# Unload everything the eager import brought in, so the lazy path starts afresh.
+modules.clear()
+for name in set(sys.modules) - loaded:
+    del sys.modules[name]
+gc.collect()
+
+lazy_time, lazy_heap = measure("import adafruit_crickit:", import_crickit)
+measure("create crickit:         ", create_singleton)
+measure("first servo:            ", first_servo)
+measure("first stepper:          ", first_stepper)
+
+print("import saves", (eager_time - lazy_time) * 1000, "ms,", eager_heap - lazy_heap, "bytes")
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compare reading all touch pads and signal pins one at a time against a single
+# crickit.read_inputs() snapshot. Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+# Each simulated I2C transaction takes 0.5 ms.
+seesaw = FakeSeesaw(latency=0.0005)
+crickit = Crickit(seesaw)
+touch_pads = (crickit.touch_1, crickit.touch_2, crickit.touch_3, crickit.touch_4)
+signal_pins = (
+    crickit.SIGNAL1,
+    crickit.SIGNAL2,
+    crickit.SIGNAL3,
+    crickit.SIGNAL4,
+    crickit.SIGNAL5,
+    crickit.SIGNAL6,
+    crickit.SIGNAL7,
+    crickit.SIGNAL8,
+)
+
+ROUNDS = 20
+
+seesaw.transactions = 0
+start = time.monotonic()
+for _ in range(ROUNDS):
+    touched = [pad.value for pad in touch_pads]
+    signals = [seesaw.digital_read(pin) for pin in signal_pins]
+per_pin_time = (time.monotonic() - start) / ROUNDS
+per_pin_transactions = seesaw.transactions / ROUNDS
+
+seesaw.transactions = 0
+start = time.monotonic()
+for _ in range(ROUNDS):
+    inputs = crickit.read_inputs()
+snapshot_time = (time.monotonic() - start) / ROUNDS
+snapshot_transactions = seesaw.transactions / ROUNDS
+
+print("one at a time:", per_pin_transactions, "transactions,", per_pin_time * 1000, "ms")
+print("read_inputs():", snapshot_transactions, "transactions,", snapshot_time * 1000, "ms")
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Measure the cost of looking up a device through a Crickit property in a hot loop,
+# compared with a plain attribute read. Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+LOOPS = 100_000
+
+
+class Holder:
+    """A plain attribute read, for comparison."""
+
+    def __init__(self, device):
+        self.servo_1 = device
+
+
+crickit = Crickit(FakeSeesaw())
+holder = Holder(crickit.servo_1)
+# Create every device up front, so only lookups are measured.
+for name in ("servo_1", "dc_motor_1", "drive_1", "touch_1", "feather_drive_stepper_motor"):
+    getattr(crickit, name)
+
+
+def per_access_ns(function):
+    start = time.monotonic_ns()
+    function()
+    return (time.monotonic_ns() - start) / LOOPS
+
+
+def attribute():
+    for _ in range(LOOPS):
+        holder.servo_1
+
+
+def servo():
+    for _ in range(LOOPS):
+        crickit.servo_1
+
+
+def dc_motor():
+    for _ in range(LOOPS):
+        crickit.dc_motor_1
+
+
+def feather_drive_stepper():
+    for _ in range(LOOPS):
+        crickit.feather_drive_stepper_motor
+
+
+for function in (attribute, servo, dc_motor, feather_drive_stepper):
+    print(function.__name__, per_access_ns(function), "ns per access")
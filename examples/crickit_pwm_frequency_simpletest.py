@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Crickit library demo - quiet high frequency drive PWM alongside 50 Hz servos
+
+import time
+
+from adafruit_crickit import crickit
+
+# Drive 1 and 2 share a timer. Plan it before creating the drives.
+crickit.set_pwm_frequency("drives_1_2", 20000)
+print(crickit.pwm_frequencies)
+
+while True:
+    crickit.drive_1.fraction = 0.3
+    crickit.servo_1.angle = 0
+    time.sleep(1)
+    crickit.drive_1.fraction = 0.0
+    crickit.servo_1.angle = 180
+    time.sleep(1)
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Run the same control loop, two DC motors and a servo in one batch plus a drive, with and
+# without realtime mode, and measure the memory each loop iteration allocates.
+# Each mode runs against a simulated seesaw, which realtime mode writes through its write
+# method, and against a plain Seesaw on a stub I2C device, which realtime mode writes to
+# directly, as it would on a real board.
+# On CircuitPython the count comes from gc.mem_alloc() and realtime mode must allocate
+# nothing. On CPython, at every bus write, tracemalloc lists the memory still in use
+# that the Seesaw driver or the Crickit write path allocated during the loop: the buffers
+# Seesaw builds for each write and the entries of the batch. Realtime mode must have none,
+# and normal mode must have some, which shows that the check can fail. Realtime mode's own
+# module is left out, since on CPython it shows loop iterators and call frames that
+# CircuitPython keeps off the heap.
+# Runs without a Crickit attached.
+
+import gc
+import time
+
+from adafruit_seesaw.seesaw import Seesaw
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+WARMUP = 50
+LOOPS = 1000
+PROBED_LOOPS = 100
+THROTTLES = (0.25, 0.5, 0.75, 1.0, -0.25, -0.5, -0.75, -1.0)
+ANGLES = (0, 45, 90, 135, 180)
+DUTY_CYCLES = (0, 0x4000, 0x8000, 0xC000, 0xFFFF)
+
+# Where the allocations of the write path would come from, other than realtime mode.
+if tracemalloc is not None:
+    WRITE_PATH = (
+        tracemalloc.Filter(True, "*adafruit_seesaw*"),
+        tracemalloc.Filter(True, "*adafruit_crickit*__init__.py"),
+    )
+
+# Most blocks in use at a bus write, while probing.
+probe = {"enabled": False, "blocks": 0}
+
+
+def check_memory():
+    if not probe["enabled"]:
+        return
+    snapshot = tracemalloc.take_snapshot().filter_traces(WRITE_PATH)
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    probe["blocks"] = max(probe["blocks"], blocks)
+
+
+class StubI2CDevice:
+    # Takes the place of an I2CDevice, so Seesaw.write and realtime mode write to it.
+    def __init__(self):
+        self.writes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def write(self, buf, *, start=0, end=None):
+        self.writes += 1
+        check_memory()
+
+
+class ProbedSeesaw(FakeSeesaw):
+    def write(self, reg_base, reg, buf=None):
+        check_memory()
+        super().write(reg_base, reg, buf)
+
+
+def stub_seesaw():
+    # A plain Seesaw, set up without probing a bus.
+    seesaw = Seesaw.__new__(Seesaw)
+    seesaw.i2c_device = StubI2CDevice()
+    seesaw._drdy = None
+    seesaw.chip_id = 0x55
+    return seesaw
+
+
+def measure(realtime, make_seesaw):
+    crickit = Crickit(make_seesaw())
+    crickit.enable_realtime(realtime, devices=("dc_motor_1", "dc_motor_2", "servo_1", "drive_1"))
+    direct = realtime and crickit._realtime._direct
+    left = crickit.dc_motor_1
+    right = crickit.dc_motor_2
+    servo = crickit.servo_1
+    drive = crickit.drive_1
+    batch = crickit.batch()
+
+    def loop(i):
+        with batch:
+            left.throttle = THROTTLES[i % 8]
+            right.throttle = THROTTLES[(i + 3) % 8]
+            servo.angle = ANGLES[i % 5]
+        drive.duty_cycle = DUTY_CYCLES[i % 5]
+
+    for i in range(WARMUP):
+        loop(i)
+    gc.collect()
+    gc.disable()
+    before = gc.mem_alloc() if tracemalloc is None else 0
+    start = time.monotonic()
+    for i in range(LOOPS):
+        loop(i)
+    elapsed = time.monotonic() - start
+    allocated = None
+    blocks = None
+    if tracemalloc is None:
+        allocated = (gc.mem_alloc() - before) / LOOPS
+    else:
+        tracemalloc.start()
+        probe["enabled"] = True
+        probe["blocks"] = 0
+        for i in range(PROBED_LOOPS):
+            loop(i)
+        probe["enabled"] = False
+        tracemalloc.stop()
+        blocks = probe["blocks"]
+    gc.enable()
+    return elapsed / LOOPS, allocated, blocks, direct
+
+
+for seesaw_name, make_seesaw in (("simulated", ProbedSeesaw), ("stub I2C", stub_seesaw)):
+    for realtime in (False, True):
+        per_loop, allocated, blocks, direct = measure(realtime, make_seesaw)
+        name = f"{'realtime' if realtime else 'normal'}, {seesaw_name}"
+        if realtime:
+            name += ", direct" if direct else ", through write"
+        line = f"{name:34}: {per_loop * 1000:.3f} ms/loop, "
+        if allocated is not None:
+            print(line + f"{allocated:.1f} bytes allocated/loop")
+            if realtime:
+                assert allocated == 0, "realtime loop allocated memory"
+        else:
+            print(line + f"{blocks} write path blocks in use at a write")
+            if realtime:
+                assert blocks == 0, "realtime loop allocated on the write path"
+            else:
+                assert blocks > 0, "the check cannot tell normal mode apart"
+        if realtime and make_seesaw is stub_seesaw:
+            assert direct, "realtime mode did not write to the I2C device directly"
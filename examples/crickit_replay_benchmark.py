@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Analyze a bus recording saved with crickit.save_recording(), then replay it against a
+# simulated seesaw. Run on a host computer:
+#
+#   python crickit_replay_benchmark.py bus.bin
+#
+# Without a file name, a recording is first made from a short simulated session.
+
+import io
+import sys
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.recorder import Recording
+from adafruit_crickit.simulator import FakeSeesaw
+
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "rb") as stream:
+        recording = Recording(stream)
+else:
+    # Each simulated I2C transaction takes 0.5 ms.
+    crickit = Crickit(FakeSeesaw(latency=0.0005))
+    crickit.enable_recording(records=512)
+    for i in range(100):
+        crickit.servo_1.angle = 90 + 45 * ((i // 10) % 2)
+        crickit.drive_1.fraction = (i % 4) / 4
+        crickit.touch_1.raw_value  # noqa: B018
+        time.sleep(0.005)
+    stream = io.BytesIO()
+    crickit.save_recording(stream)
+    stream.seek(0)
+    recording = Recording(stream)
+
+summary = recording.summary()
+print(
+    summary["count"],
+    "operations over",
+    summary["elapsed"],
+    "s,",
+    summary["operations_per_second"],
+    "ops/sec,",
+    summary["bytes_per_second"],
+    "bytes/sec, bus busy",
+    summary["busy"] / summary["elapsed"] * 100,
+    "% of the time",
+)
+for terminal, entry in summary["terminals"].items():
+    print(
+        terminal,
+        entry["device"],
+        entry["writes"],
+        "writes,",
+        entry["redundant"],
+        "redundant,",
+        entry["reads"],
+        "reads, interval",
+        entry.get("interval", 0) * 1000,
+        "ms, jitter",
+        entry.get("jitter", 0) * 1000,
+        "ms",
+    )
+
+for latency in (0.0005, 0.0001):
+    elapsed = recording.replay(FakeSeesaw(latency=latency))
+    print("replayed back to back with", latency * 1000, "ms transactions in", elapsed, "s")
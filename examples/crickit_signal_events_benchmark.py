@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Watch a simulated limit switch on Signal 1 and a sensor giving short pulses on Signal 2,
+# three ways: SignalEvents with an INT line, SignalEvents polling the interrupt flags, and
+# polling the pin levels every 10 ms. Reports the edges each one saw, and the I2C
+# transactions per second each one spends while nothing happens.
+# Runs without a Crickit attached.
+
+import random
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.signals import SignalEvents
+from adafruit_crickit.simulator import FakeInterruptPin, FakeSeesaw
+
+ACTIVE = 2.0
+IDLE = 1.0
+POLL_INTERVAL = 0.01
+SIGNAL1 = Crickit.SIGNAL1
+SIGNAL2 = Crickit.SIGNAL2
+
+random.seed(1)
+# (time, pin, level): the switch toggles now and then, and the sensor pulses for 0.5 ms.
+STIMULI = []
+at = 0.05
+switch = True
+while at < ACTIVE:
+    switch = not switch
+    STIMULI.append((at, SIGNAL1, switch))
+    at += random.uniform(0.1, 0.3)
+at = 0.08
+while at < ACTIVE:
+    STIMULI.append((at, SIGNAL2, False))
+    STIMULI.append((at + 0.0005, SIGNAL2, True))
+    at += random.uniform(0.1, 0.2)
+STIMULI.sort()
+EDGES = len(STIMULI)
+
+
+def level_poller(seesaw):
+    # The usual approach: read both pins every poll and compare with the last levels.
+    mask = (1 << SIGNAL1) | (1 << SIGNAL2)
+    last = [seesaw.digital_read_bulk(mask)]
+    next_poll = [0.0]
+
+    def update():
+        now = time.monotonic()
+        if now < next_poll[0]:
+            return ()
+        next_poll[0] = now + POLL_INTERVAL
+        levels = seesaw.digital_read_bulk(mask)
+        changed = levels ^ last[0]
+        last[0] = levels
+        return [pin for pin in (SIGNAL1, SIGNAL2) if changed & (1 << pin)]
+
+    return update
+
+
+def run(name):
+    seesaw = FakeSeesaw()
+    crickit = Crickit(seesaw)
+    for pin in (SIGNAL1, SIGNAL2):
+        seesaw.set_input(pin, True)
+    if name == "interrupt":
+        update = SignalEvents(crickit, (1, 2), interrupt=FakeInterruptPin(seesaw)).update
+    elif name == "flag polling":
+        update = SignalEvents(crickit, (1, 2), poll_interval=POLL_INTERVAL).update
+    else:
+        update = level_poller(seesaw)
+    seen = 0
+    latencies = []
+    pending = list(STIMULI)
+    start = time.monotonic()
+    idle_transactions = None
+    while True:
+        elapsed = time.monotonic() - start
+        if elapsed >= ACTIVE + IDLE:
+            break
+        if idle_transactions is None and elapsed >= ACTIVE:
+            idle_transactions = seesaw.transactions
+        # Apply every change due since the last pass, as the outside world would.
+        while pending and pending[0][0] <= elapsed:
+            _, pin, level = pending.pop(0)
+            seesaw.set_input(pin, level)
+        events = update()
+        seen += len(events)
+        if events and name != "level polling":
+            due = max(stimulus for stimulus, _, _ in STIMULI if stimulus <= elapsed)
+            latencies.append(events[-1].timestamp - start - due)
+        time.sleep(0.001)
+    idle_rate = (seesaw.transactions - idle_transactions) / IDLE
+    return seen, idle_rate, latencies
+
+
+print(f"{EDGES} edges generated, {sum(1 for s in STIMULI if s[1] == SIGNAL2) // 2} pulses")
+for mode in ("interrupt", "flag polling", "level polling"):
+    seen, idle_rate, latencies = run(mode)
+    line = f"{mode:14}: {seen:3} edges seen, {idle_rate:6.1f} transactions/s idle"
+    if latencies:
+        line += f", latency max {max(latencies) * 1000:.1f} ms"
+    print(line)
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Measure operations per second and I2C transactions per operation for each kind of
+# Crickit device, using the simulated seesaw. Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+ROUNDS = 100
+
+# Each simulated I2C transaction takes 0.2 ms.
+seesaw = FakeSeesaw(latency=0.0002)
+crickit = Crickit(seesaw)
+crickit.init_neopixel(8, auto_write=False)
+
+
+def servo(i):
+    crickit.servo_1.angle = 45 + 90 * (i % 2)
+
+
+def continuous_servo(i):
+    crickit.continuous_servo_2.throttle = 0.5 - i % 2
+
+
+def dc_motor(i):
+    crickit.dc_motor_1.throttle = 0.5 - i % 2
+
+
+def drive(i):
+    crickit.drive_1.fraction = i % 2
+
+
+def stepper_motor(i):
+    crickit.stepper_motor.onestep()
+
+
+def touch(i):
+    return crickit.touch_1.value
+
+
+def neopixel(i):
+    crickit.neopixel.fill((i % 256, 0, 0))
+    crickit.neopixel.show()
+
+
+def read_inputs(i):
+    return crickit.read_inputs()
+
+
+for operation in (
+    servo,
+    continuous_servo,
+    dc_motor,
+    drive,
+    stepper_motor,
+    touch,
+    neopixel,
+    read_inputs,
+):
+    # Run once so that creating the device is not measured.
+    operation(0)
+    seesaw.transactions = 0
+    start = time.monotonic()
+    for i in range(1, ROUNDS + 1):
+        operation(i)
+    elapsed = time.monotonic() - start
+    print(
+        operation.__name__,
+        ROUNDS / elapsed,
+        "ops/sec,",
+        seesaw.transactions / ROUNDS,
+        "transactions/op",
+    )
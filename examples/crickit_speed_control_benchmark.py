@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Simulate a DC motor with an encoder on Signal 1, held at 120 rpm by MotorSpeedControl.
+# Halfway through, a load slows the motor; the controller raises the throttle to recover.
+# Reports the loop and sample rates achieved, and the settling time after the start and
+# after the load. Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+from adafruit_crickit.speed import MotorSpeedControl
+
+TARGET = 120
+PULSES_PER_REVOLUTION = 48
+FREE_RPM = 200  # Speed at full throttle without load.
+TIME_CONSTANT = 0.1  # Seconds for the motor to get 63% of the way to a new speed.
+LOAD_AT = 3.0
+DURATION = 6.0
+TOLERANCE = 0.1
+
+# Each simulated I2C transaction takes 0.2 ms.
+seesaw = FakeSeesaw(latency=0.0002)
+crickit = Crickit(seesaw)
+control = MotorSpeedControl(crickit, rate=10, sample_rate=400, budget=500)
+wheel = control.add(crickit.dc_motor_1, crickit.SIGNAL1, PULSES_PER_REVOLUTION)
+
+rpm = 0.0
+position = 0.0  # In encoder pulses.
+start = last = time.monotonic()
+settled = {}
+wheel.target_rpm = TARGET
+while last - start < DURATION:
+    now = time.monotonic()
+    elapsed = now - start
+    # Motor 1 is driven by seesaw pins 22 (forward) and 23 (backward).
+    throttle = (seesaw.duty_cycles.get(22, 0) - seesaw.duty_cycles.get(23, 0)) / 0xFFFF
+    load = 0.6 if elapsed >= LOAD_AT else 1.0
+    rpm += (throttle * FREE_RPM * load - rpm) * min(1.0, (now - last) / TIME_CONSTANT)
+    position += rpm / 60 * PULSES_PER_REVOLUTION * (now - last)
+    last = now
+    # A square wave, high for the first half of each pulse.
+    seesaw.set_input(crickit.SIGNAL1, position % 1 < 0.5)
+
+    control.update()
+
+    phase = "load" if elapsed >= LOAD_AT else "start"
+    if abs(wheel.measured_rpm - TARGET) > TOLERANCE * TARGET:
+        settled.pop(phase, None)
+    elif phase not in settled:
+        settled[phase] = elapsed - (LOAD_AT if phase == "load" else 0)
+    time.sleep(0.0002)
+
+print("loop rate:", control.achieved_rate, "of", 10, "/sec")
+print(
+    "sample rate:",
+    control.achieved_sample_rate,
+    "of",
+    400,
+    "/sec,",
+    control.missed_samples,
+    "missed",
+)
+print("max control lateness:", control.max_lateness * 1000, "ms")
+print("settling time after start:", settled.get("start"), "s")
+print("settling time after load:", settled.get("load"), "s")
+print("final:", wheel.measured_rpm, "rpm at throttle", crickit.dc_motor_1.throttle)
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Crickit library demo - find out where the I2C bus time goes
+
+import time
+
+from adafruit_crickit import crickit
+
+crickit.enable_stats()
+
+while True:
+    for angle in (0, 90, 180):
+        crickit.servo_1.angle = angle
+        crickit.dc_motor_1.throttle = angle / 180
+        if crickit.touch_1.value:
+            print("Touched terminal Touch 1")
+        time.sleep(0.1)
+
+    stats = crickit.stats(reset=True)
+    print(stats["count"], "operations,", stats["bytes_per_second"], "bytes/sec")
+    for device_type, device_stats in stats["devices"].items():
+        print(" ", device_type, device_stats)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Count the seesaw PWM writes per step for each step style, comparing a plain
+# adafruit_motor StepperMotor with the CrickitStepperMotor returned by
+# crickit.stepper_motor. Runs without a Crickit attached.
+
+import time
+
+from adafruit_motor import stepper
+from adafruit_motor.stepper import StepperMotor
+from adafruit_seesaw.pwmout import PWMOut
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+STEPS = 200
+STYLES = (
+    ("SINGLE", stepper.SINGLE),
+    ("DOUBLE", stepper.DOUBLE),
+    ("INTERLEAVE", stepper.INTERLEAVE),
+    ("MICROSTEP", stepper.MICROSTEP),
+)
+
+
+def measure(motor, seesaw, style):
+    # One step first, to align with the style's pattern.
+    motor.onestep(style=style)
+    seesaw.transactions = 0
+    start = time.monotonic()
+    for _ in range(STEPS):
+        motor.onestep(style=style)
+    elapsed = time.monotonic() - start
+    return seesaw.transactions / STEPS, elapsed / STEPS * 1e6
+
+
+plain_seesaw = FakeSeesaw()
+plain = StepperMotor(*(PWMOut(plain_seesaw, pin) for pin in (22, 23, 19, 18)))
+
+crickit_seesaw = FakeSeesaw()
+crickit = Crickit(crickit_seesaw)
+tuned = crickit.stepper_motor
+
+for name, style in STYLES:
+    plain_writes, plain_us = measure(plain, plain_seesaw, style)
+    tuned_writes, tuned_us = measure(tuned, crickit_seesaw, style)
+    print(
+        name,
+        "plain:",
+        plain_writes,
+        "writes/step,",
+        plain_us,
+        "us/step;",
+        "crickit:",
+        tuned_writes,
+        "writes/step,",
+        tuned_us,
+        "us/step",
+    )
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Crickit library demo - smooth stepper moves with acceleration
+
+from adafruit_motor import stepper
+
+from adafruit_crickit import crickit
+from adafruit_crickit.motion import StepperMotion
+
+motion = StepperMotion(crickit.stepper_motor, style=stepper.DOUBLE)
+
+# Move forward 400 steps and back again, ramping speed up and down.
+while True:
+    for target in (400, 0):
+        motion.move_to(target, max_speed=200, acceleration=400)
+        print(
+            "at",
+            motion.position,
+            "achieved",
+            motion.achieved_rate,
+            "of",
+            motion.planned_rate,
+            "steps/sec",
+        )
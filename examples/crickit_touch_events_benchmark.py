@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Simulate three seconds of touch pad readings that drift upward, with two touches on
+# pad 1. Compare polling crickit.touch_1.value every 10 ms against TouchPads, counting
+# the touches each one sees and the touch reads each one spends.
+# Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+from adafruit_crickit.touch import TouchPads
+
+DURATION = 3.0
+TOUCHES = ((0.5, 0.8), (2.0, 2.3))
+
+seesaw = FakeSeesaw()
+crickit = Crickit(seesaw)
+pins = seesaw.pin_mapping.touch_pins
+
+
+def simulate(elapsed):
+    # The readings of every pad drift up by 40 a second; a touch adds 200 to pad 1.
+    for pin in pins:
+        seesaw.touch_values[pin] = int(300 + 40 * elapsed)
+    for start, end in TOUCHES:
+        if start <= elapsed < end:
+            seesaw.touch_values[pins[0]] += 200
+
+
+simulate(0)
+touch_1 = crickit.touch_1
+start = time.monotonic()
+presses = 0
+reads = 0
+was_touched = False
+while time.monotonic() - start < DURATION:
+    simulate(time.monotonic() - start)
+    touched = touch_1.value
+    reads += 1
+    if touched and not was_touched:
+        presses += 1
+    was_touched = touched
+    time.sleep(0.01)
+print("touch_1.value:", presses, "presses,", reads / DURATION, "reads/sec, stuck:", was_touched)
+
+simulate(0)
+pads = TouchPads(crickit)
+start = time.monotonic()
+pads.reads = 0
+presses = 0
+while time.monotonic() - start < DURATION:
+    simulate(time.monotonic() - start)
+    for event in pads.update():
+        presses += event.pressed
+    time.sleep(0.002)
+print("TouchPads:", presses, "presses,", pads.reads / DURATION, "reads/sec for 4 pads")
+print("baselines:", pads.baselines)
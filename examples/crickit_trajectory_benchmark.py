@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Play the same one second, four servo trajectory at several control rates on a
+# simulated bus, and report missed ticks and lateness, to show which rates the bus can
+# keep up with. Then checks that a keyframe landing on a tick, 0.3 s at 10 ticks per second,
+# is reached. Runs without a Crickit attached.
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+from adafruit_crickit.trajectory import ServoTrajectory, ease_in_out
+
+# Each simulated I2C transaction takes 1 ms.
+seesaw = FakeSeesaw(latency=0.001)
+crickit = Crickit(seesaw)
+servos = (crickit.servo_1, crickit.servo_2, crickit.servo_3, crickit.servo_4)
+
+for rate in (25, 50, 100, 200, 400):
+    trajectory = ServoTrajectory(crickit, rate=rate)
+    for i, servo in enumerate(servos):
+        trajectory.add(servo, ((0, 0), (0.5, 90 + 20 * i, ease_in_out), (1.0, 0, ease_in_out)))
+    seesaw.transactions = 0
+    trajectory.run()
+    print(
+        rate,
+        "ticks/sec:",
+        trajectory.ticks,
+        "sent,",
+        trajectory.missed,
+        "missed,",
+        trajectory.max_lateness * 1000,
+        "ms max lateness,",
+        seesaw.transactions / trajectory.ticks,
+        "transactions/tick",
+    )
+
+# 0.3 / 0.1 is 2.9999999999999996 in floating point; the tick at 0.3 s must still be there.
+trajectory = ServoTrajectory(crickit, rate=10)
+trajectory.add(crickit.servo_1, ((0, 0), (0.3, 90)))
+trajectory.run()
+servo = crickit.servo_1
+assert trajectory.ticks == 4, trajectory.ticks
+assert seesaw.duty_cycles[servo._pwm_out._pin] == servo._min_duty + int(0.5 * servo._duty_range)
+print("0.3 s at 10 ticks/sec:", trajectory.ticks, "ticks, end pose reached")
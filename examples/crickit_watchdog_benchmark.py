@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Run a simulated control loop that drives two DC motors, a continuous servo and two
+# drives while feeding the Crickit watchdog, then stall the loop and measure how long it
+# takes from the last feed until every output is in its safe state, and that the board
+# stays safe until re-armed. Also checks that an exception in the loop makes the board
+# safe, that a loop which is only sometimes late, and so writes while the watchdog
+# thread trips, sees the board made safe whole, and that realtime mode's staged writes
+# are dropped rather than sent with the safe state. Runs without a Crickit attached.
+
+import random
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+
+TIMEOUT = 0.1
+TRIALS = 20
+
+# Each simulated I2C transaction takes 0.2 ms.
+seesaw = FakeSeesaw(latency=0.0002)
+crickit = Crickit(seesaw)
+motor_1 = crickit.dc_motor_1
+motor_2 = crickit.dc_motor_2
+wheel = crickit.continuous_servo_1
+drive_1 = crickit.drive_1
+drive_2 = crickit.drive_2
+batch = crickit.batch()
+
+# Motor 1 and motor 2 pins, and drive 1 and drive 2 pins.
+MOTOR_PINS = (22, 23, 19, 18)
+DRIVE_PINS = (13, 12)
+
+
+def run_loop():
+    with batch:
+        motor_1.throttle = 0.8
+        motor_2.throttle = -0.6
+        wheel.throttle = 0.5
+        drive_1.fraction = 1.0
+        drive_2.fraction = 0.5
+
+
+def safe():
+    # Braking shorts the motors, the servo stops at its midpoint and the drives turn off.
+    braked = all(seesaw.duty_cycles[pin] == 0xFFFF for pin in MOTOR_PINS)
+    stopped = wheel.throttle is not None and abs(wheel.throttle) < 0.01
+    off = not any(seesaw.duty_cycles[pin] for pin in DRIVE_PINS)
+    return braked and stopped and off
+
+
+crickit.enable_watchdog(timeout=TIMEOUT, motors="brake")
+watchdog = crickit.watchdog
+times = []
+for _ in range(TRIALS):
+    end = time.monotonic() + random.uniform(0.05, 0.2)
+    while time.monotonic() < end:
+        watchdog.feed()
+        run_loop()
+        time.sleep(0.01)
+    assert not safe()
+    # The loop stalls; only the watchdog thread is left to notice.
+    time.sleep(TIMEOUT * 2)
+    assert watchdog.tripped and safe(), "outputs were not made safe"
+    times.append(watchdog.time_to_safe)
+    # The loop resumes late, but the board stays safe until it is re-armed.
+    watchdog.feed()
+    try:
+        run_loop()
+    except ValueError:
+        pass
+    assert safe(), "a late loop restarted the outputs"
+    watchdog.rearm()
+
+watchdog.feed()
+run_loop()
+start = time.monotonic()
+watchdog.trip()
+flush = time.monotonic() - start
+crickit.enable_watchdog(False)
+
+print(f"timeout:                {TIMEOUT * 1000:.1f} ms")
+print(f"mean time to safe:      {sum(times) / len(times) * 1000:.1f} ms")
+print(f"worst time to safe:     {max(times) * 1000:.1f} ms")
+print(f"safe-state flush:       {flush * 1000:.1f} ms")
+
+# Unbatched, the same writes each wait for the seesaw to settle.
+run_loop()
+start = time.monotonic()
+motor_1.throttle = 0
+motor_2.throttle = 0
+wheel.throttle = 0
+drive_1.fraction = 0
+drive_2.fraction = 0
+print(f"same writes unbatched:  {(time.monotonic() - start) * 1000:.1f} ms")
+
+# An exception in the loop makes the board safe at once.
+crickit.enable_watchdog(timeout=TIMEOUT, motors="brake")
+run_loop()
+try:
+    with crickit.watchdog:
+        crickit.watchdog.feed()
+        raise RuntimeError("sensor failed")
+except RuntimeError:
+    pass
+assert safe(), "outputs were not made safe after an exception"
+print("exception in the loop:  made safe")
+
+# A loop that feeds every tick, but is now and then 3.5 ms late against a 4 ms timeout,
+# so the watchdog thread trips while the loop is writing.
+LATE_TIMEOUT = 0.004
+crickit.enable_watchdog(timeout=LATE_TIMEOUT, motors="brake")
+watchdog = crickit.watchdog
+safe_at_trip = []
+trip = watchdog.trip
+
+
+def checked_trip():
+    # Still holding the lock, so the loop cannot write before the check.
+    with crickit._lock:
+        trip()
+        safe_at_trip.append(safe())
+
+
+watchdog.trip = checked_trip
+ticks = 0
+end = time.monotonic() + 1.0
+while time.monotonic() < end:
+    try:
+        watchdog.feed()
+        run_loop()
+    except ValueError:
+        # Tripped meanwhile; take control again.
+        watchdog.rearm()
+    ticks += 1
+    time.sleep(0.0035 if random.random() < 0.2 else 0.0005)
+crickit.enable_watchdog(False)
+assert safe_at_trip, "the late loop never tripped the watchdog"
+assert all(safe_at_trip), "a trip left outputs unsafe"
+print(f"late loop:              {ticks} ticks, {len(safe_at_trip)} trips, all made safe")
+
+# Realtime mode: a loop that stalls inside a batch leaves a servo angle staged. The trip
+# drops it, so the servo holds where it was.
+crickit.enable_realtime(devices=("servo_2",))
+servo = crickit.servo_2
+servo.angle = 0
+crickit.enable_watchdog(timeout=TIMEOUT, motors="brake")
+servo_duty = seesaw.duty_cycles[servo._pwm_out._pin]
+with batch:
+    servo.angle = 180
+    run_loop()
+    time.sleep(TIMEOUT * 2)
+assert crickit.watchdog.tripped and safe(), "outputs were not made safe"
+assert seesaw.duty_cycles[servo._pwm_out._pin] == servo_duty, "a staged write was sent"
+crickit.enable_watchdog(False)
+crickit.enable_realtime(False)
+print("realtime staged writes: dropped at the trip")
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Play a two second pattern on the four drives, solenoid pulses on Drive 1 and 2 and LED
+# fades on Drive 3 and 4, first with a plain loop that sets each duty cycle and sleeps
+# until the next change, then with WaveformPlayer. Reports how late the changes were
+# and how many bus flushes each needed. Runs without a Crickit attached.
+
+import time
+
+from adafruit_crickit import Crickit
+from adafruit_crickit.simulator import FakeSeesaw
+from adafruit_crickit.waveform import WaveformPlayer
+
+# Each simulated I2C transaction takes 0.3 ms.
+seesaw = FakeSeesaw(latency=0.0003)
+crickit = Crickit(seesaw)
+drives = (crickit.drive_1, crickit.drive_2, crickit.drive_3, crickit.drive_4)
+
+segments = []
+for i in range(20):
+    at = i * 0.1
+    # Solenoids: 30 ms pulses, both fired together.
+    segments.append((at, drives[0], 1.0))
+    segments.append((at + 0.03, drives[0], 0.0))
+    segments.append((at, drives[1], 1.0))
+    segments.append((at + 0.03, drives[1], 0.0))
+    # LEDs: a 10 step fade up in each 100 ms, the second LED fading down.
+    for step in range(10):
+        level = step / 9
+        segments.append((at + step * 0.01, drives[2], level))
+        segments.append((at + step * 0.01, drives[3], 1.0 - level))
+
+
+def naive():
+    # Set each change in order, sleeping for the gap to the next one.
+    ordered = sorted(segments, key=lambda segment: segment[0])
+    lateness = []
+    start = time.monotonic()
+    previous = 0.0
+    for at, drive, duty in ordered:
+        if at > previous:
+            time.sleep(at - previous)
+            previous = at
+        drive.fraction = duty
+        lateness.append(time.monotonic() - start - at)
+    return lateness
+
+
+transactions = seesaw.transactions
+lateness = naive()
+flushes = seesaw.transactions - transactions
+print(f"{len(segments)} changes")
+print(
+    f"sleep loop:     max {max(lateness) * 1000:6.1f} ms late, "
+    f"mean {sum(lateness) / len(lateness) * 1000:6.1f} ms, "
+    f"last {lateness[-1] * 1000:6.1f} ms, {flushes} writes"
+)
+
+player = WaveformPlayer(crickit, segments)
+transactions = seesaw.transactions
+player.run()
+lateness = player.lateness
+print(
+    f"WaveformPlayer: max {player.max_lateness * 1000:6.1f} ms late, "
+    f"mean {player.mean_lateness * 1000:6.1f} ms, "
+    f"last {lateness[-1] * 1000:6.1f} ms, {seesaw.transactions - transactions} writes "
+    f"in {player.flushes} flushes for {len(player)} events"
+)